@@ -77,6 +77,7 @@ from .models import (
     # Matching models
     MatchResult,
     HierarchicalMatch,
+    make_hierarchical_match,
     
     # Output models
     AutoFolderOutput,
@@ -98,6 +99,8 @@ from .taxonomy_generator import (
     get_taxonomy_generator
 )
 
+from .folder_index import FolderEmbeddingIndex, FolderTrie
+
 from .folder_matcher import (
     FolderMatcher,
     get_folder_matcher
@@ -131,6 +134,7 @@ try:
         SupabaseItemFolderRepository,
         SupabaseEmbeddingRepository,
         SupabaseTaxonomyStatsRepository,
+        AsyncSupabaseFolderRepository,
         get_supabase_client,
         get_migration_sql,
         check_supabase_availability
@@ -144,6 +148,7 @@ except ImportError:
     SupabaseItemFolderRepository = None
     SupabaseEmbeddingRepository = None
     SupabaseTaxonomyStatsRepository = None
+    AsyncSupabaseFolderRepository = None
     get_supabase_client = None
     get_migration_sql = None
     check_supabase_availability = None
@@ -179,6 +184,7 @@ __all__ = [
     "ExistingFolder",
     "MatchResult",
     "HierarchicalMatch",
+    "make_hierarchical_match",
     "AutoFolderOutput",
     "BatchInput",
     "BatchOutput",
@@ -189,6 +195,8 @@ __all__ = [
     "InMemoryVectorStore",
     "TaxonomyGenerator",
     "FolderMatcher",
+    "FolderEmbeddingIndex",
+    "FolderTrie",
     
     # Database - Core
     "Database",
@@ -205,6 +213,7 @@ __all__ = [
     "SupabaseItemFolderRepository",
     "SupabaseEmbeddingRepository",
     "SupabaseTaxonomyStatsRepository",
+    "AsyncSupabaseFolderRepository",
     "get_supabase_client",
     "get_migration_sql",
     "check_supabase_availability",
@@ -0,0 +1,138 @@
+"""
+Similarity Kernels for Auto-Folder System
+
+Handles:
+- Top-k cosine scan over unit-normalized embedding matrices
+- numba JIT kernels (dimension-specialized and row-parallel) when available
+- NumPy/BLAS fallback otherwise
+
+Kernels take plain arrays only; folder dataclasses stay on the Python side.
+"""
+
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+
+# Try to import numba for the JIT-compiled similarity kernels
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many rows, thread fan-out costs more than the scan itself
+PARALLEL_MIN_ROWS = 4096
+
+
+# ============================================
+# NumPy Kernels
+# ============================================
+
+def topk_from_scores(scores: np.ndarray, threshold: float, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the top-k indices (and scores) at or above threshold, best first."""
+    candidates = np.flatnonzero(scores >= threshold)
+    if candidates.size > k:
+        candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+    top = candidates[np.argsort(-scores[candidates])]
+    return top, scores[top]
+
+
+def _topk_above_threshold_numpy(
+    mat: np.ndarray,
+    q: np.ndarray,
+    threshold: float,
+    k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score unit-normalized rows against a unit-normalized query and return
+    the top-k row indices (and scores) at or above threshold, best first.
+    """
+    return topk_from_scores(mat @ q, threshold, k)
+
+
+# ============================================
+# numba Kernels
+# ============================================
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True, fastmath=True, boundscheck=False)
+    def cosine_topk(mat, q, threshold, k):
+        """
+        Row-parallel top-k cosine scan over a unit-normalized (N, D) float32 matrix.
+        
+        Returns:
+            Tuple of (row indices, scores) at or above threshold, best first
+        """
+        n, dim = mat.shape
+        scores = np.empty(n, dtype=np.float32)
+        for i in prange(n):
+            acc = np.float32(0.0)
+            for j in range(dim):
+                acc += mat[i, j] * q[j]
+            scores[i] = acc
+        
+        candidates = np.nonzero(scores >= threshold)[0]
+        top = candidates[np.argsort(-scores[candidates])[:k]]
+        return top, scores[top]
+else:
+    cosine_topk = _topk_above_threshold_numpy
+
+
+@lru_cache(maxsize=None)
+def _get_topk_kernel(dim: int):
+    """
+    Get a serial top-k kernel specialized for one embedding dimension.
+    
+    With numba, the dimension is closed over as a compile-time constant so
+    LLVM can fully unroll and vectorize the dot product. Without numba, the
+    NumPy kernel already dispatches to BLAS.
+    """
+    if not NUMBA_AVAILABLE:
+        return _topk_above_threshold_numpy
+    
+    @njit(fastmath=True, boundscheck=False)
+    def _topk_above_threshold(mat, q, threshold, k):
+        n = mat.shape[0]
+        rows = np.empty(n, dtype=np.int64)
+        scores = np.empty(n, dtype=np.float32)
+        count = 0
+        for i in range(n):
+            acc = np.float32(0.0)
+            for j in range(dim):
+                acc += mat[i, j] * q[j]
+            if acc >= threshold:
+                rows[count] = i
+                scores[count] = acc
+                count += 1
+        order = np.argsort(-scores[:count])[:k]
+        return rows[:count][order], scores[:count][order]
+    
+    return _topk_above_threshold
+
+
+def topk_above_threshold(
+    mat: np.ndarray,
+    q: np.ndarray,
+    threshold: float,
+    k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the top-k rows of a unit-normalized matrix by cosine with a unit query.
+    
+    Small matrices use the dimension-specialized serial kernel; large ones
+    use the row-parallel kernel.
+    
+    Args:
+        mat: (N, D) float32 matrix of normalized rows
+        q: (D,) float32 normalized query
+        threshold: Minimum similarity
+        k: Maximum number of results
+    
+    Returns:
+        Tuple of (row indices, scores), best first
+    """
+    threshold = np.float32(threshold)
+    if NUMBA_AVAILABLE and mat.shape[0] >= PARALLEL_MIN_ROWS:
+        return cosine_topk(np.ascontiguousarray(mat), q, threshold, k)
+    return _get_topk_kernel(mat.shape[1])(mat, q, threshold, k)
@@ -71,6 +71,9 @@ class AutoFolder:
         self.folder_matcher = folder_matcher or get_folder_matcher()
         self.database = get_database()
         
+        # Per-folder item count deltas, collected while a batch is running
+        self._pending_item_counts: Optional[Dict[str, int]] = None
+        
         # Check if we need to initialize
         if auto_init_seed:
             self._ensure_initialized()
@@ -81,7 +84,7 @@ class AutoFolder:
         self.folder_matcher.load_folders_from_store()
         
         # If no folders exist, initialize seed taxonomy
-        if len(self.folder_matcher._folders_by_depth[1]) == 0:
+        if self.folder_matcher.folder_count(depth=1) == 0:
             logger.info("No existing folders found - initializing seed taxonomy...")
             self.initialize_seed_taxonomy()
     
@@ -148,7 +151,11 @@ class AutoFolder:
                 # Update folder item counts
                 final_folder = match.subdomain_result.get_folder()
                 if final_folder:
-                    self.database.folders.increment_item_count(final_folder.folder_id)
+                    if self._pending_item_counts is not None:
+                        pending = self._pending_item_counts
+                        pending[final_folder.folder_id] = pending.get(final_folder.folder_id, 0) + 1
+                    else:
+                        self.database.folders.increment_item_count(final_folder.folder_id)
                     self.database.item_folders.associate_item(
                         item_id=item.item_id,
                         folder_id=final_folder.folder_id,
@@ -225,49 +232,56 @@ class AutoFolder:
         start_time = time.time()
         
         results = []
-        successful = 0
-        failed = 0
-        new_folders = 0
-        reused_folders = 0
         
         logger.info(f"Processing batch of {len(items)} items...")
         
-        for i, item in enumerate(items):
-            logger.info(f"Processing item {i+1}/{len(items)}: {item.item_id}")
-            
-            try:
-                output = self.classify(item)
-                results.append(output)
-                
-                if output.confidence > 0:
-                    successful += 1
-                else:
-                    failed += 1
-                
-                new_folders += len(output.created_folders)
-                reused_folders += len(output.reused_folders)
+        # Defer item count updates so the batch costs one increment call, not one per item
+        self._pending_item_counts = {}
+        try:
+            for i, item in enumerate(items):
+                logger.info(f"Processing item {i+1}/{len(items)}: {item.item_id}")
                 
-            except Exception as e:
-                logger.error(f"Failed to classify item {item.item_id}: {e}")
-                failed += 1
-                results.append(AutoFolderOutput(
-                    item_id=item.item_id,
-                    final_path="Uncategorized/Error",
-                    notes=f"Classification failed: {str(e)}",
-                    confidence=0.0
-                ))
+                try:
+                    results.append(self.classify(item))
+                except Exception as e:
+                    logger.error(f"Failed to classify item {item.item_id}: {e}")
+                    results.append(AutoFolderOutput(
+                        item_id=item.item_id,
+                        final_path="Uncategorized/Error",
+                        notes=f"Classification failed: {str(e)}",
+                        confidence=0.0
+                    ))
+        finally:
+            # Folders created during the batch are snapshotted once, here
+            self.folder_matcher.flush_index()
+            pending, self._pending_item_counts = self._pending_item_counts, None
+            if pending:
+                try:
+                    self.database.folders.batch_increment_item_counts(pending)
+                except Exception as e:
+                    logger.warning(f"Failed to update folder item counts: {e}")
         
         processing_time_ms = int((time.time() - start_time) * 1000)
         
-        return BatchOutput(
-            results=results,
-            total_items=len(items),
-            successful=successful,
-            failed=failed,
-            new_folders_created=new_folders,
-            folders_reused=reused_folders,
-            processing_time_ms=processing_time_ms
-        )
+        return BatchOutput.from_results(results, processing_time_ms=processing_time_ms)
+    
+    def classify_batch_input(self, batch: BatchInput) -> BatchOutput:
+        """
+        Classify a batch, matching against its existing folders.
+        
+        The batch's folder embeddings are normalized into the matcher's
+        per-depth embedding index once, before any item is classified.
+        
+        Args:
+            batch: Items plus the caller's existing folders
+        
+        Returns:
+            BatchOutput with all results
+        """
+        if batch.existing_folders:
+            self.folder_matcher.load_existing_folders(batch.existing_folders)
+        
+        return self.classify_batch(batch.items)
     
     def get_folder_tree(self) -> Dict[str, Any]:
         """
@@ -363,7 +377,8 @@ def process_batch_file(batch_file: str) -> Dict[str, Any]:
     
     auto_folder = AutoFolder()
     batch_output = auto_folder.classify_batch(items)
-    return batch_output.to_dict()
+    # One processed_at for the whole batch, formatted once
+    return batch_output.to_dict(now_iso=datetime.utcnow().isoformat())
 
 
 def initialize_seed() -> Dict[str, Any]:
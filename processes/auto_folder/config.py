@@ -7,7 +7,7 @@ for the hierarchical auto-foldering system.
 
 import os
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, List, Optional
 from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
@@ -40,6 +40,9 @@ class ThresholdConfig:
     
     # Minimum keyword overlap for sanity check
     min_keyword_overlap: float = 0.20
+    
+    # Log similar subdomains under other domains (costs an extra vector search)
+    enable_cross_domain_diagnostic: bool = False
 
 
 @dataclass
@@ -77,6 +80,25 @@ class TaxonomyConfig:
     
     # Maximum leaf label length (words)
     max_leaf_words: int = 4
+    
+    # Put the static prompt prefix in a Gemini context cache. Off by default: the
+    # prefix alone is below Gemini's minimum cacheable size, so enable it only with
+    # a model/prompt that meets the minimum
+    prompt_cache_enabled: bool = field(
+        default_factory=lambda: os.environ.get('TAXONOMY_PROMPT_CACHE', '').lower() in ('1', 'true')
+    )
+    
+    # Lifetime of the Gemini context cache holding the static prompt prefix
+    prompt_cache_ttl_minutes: int = 30
+    
+    # Maximum number of LLM responses kept in the exact-match response cache
+    response_cache_size: int = 10000
+    
+    # Reuse a cached response when an item's text embedding is at least this
+    # similar to a previously classified item's. Opt-in (e.g. 0.92): each LLM
+    # miss then costs an extra embedding call, and the index lasts only as
+    # long as the process. None disables
+    semantic_cache_threshold: Optional[float] = None
 
 
 @dataclass
@@ -99,6 +121,18 @@ class DatabaseConfig:
         default_factory=lambda: os.environ.get('SUPABASE_KEY', '')
     )
     
+    # Supavisor transaction-pooler connection string (port 6543) for bulk writes
+    # that bypass PostgREST; requires psycopg[pool], unused when empty
+    supabase_pooled_db_url: str = field(
+        default_factory=lambda: os.environ.get('SUPABASE_DB_URL_POOLED', '')
+    )
+    
+    # Supavisor session-pooler connection string (port 5432) for similarity
+    # search; session mode keeps server-side prepared statements across calls
+    supabase_session_db_url: str = field(
+        default_factory=lambda: os.environ.get('SUPABASE_DB_URL_SESSION', '')
+    )
+    
     # Direct PostgreSQL connection string (for non-Supabase deployments)
     connection_string: str = field(
         default_factory=lambda: os.environ.get(
@@ -121,6 +155,18 @@ class DatabaseConfig:
         default_factory=lambda: os.environ.get('VECTOR_DB_TYPE', 'memory')
     )
     
+    # Store the in-memory folder embedding index as int8 with a per-row scale
+    # (4x less memory bandwidth per scan, ~1e-2 cosine error); fp32 when off
+    quantize_folder_embeddings: bool = field(
+        default_factory=lambda: os.environ.get('QUANTIZE_FOLDER_EMBEDDINGS', '').lower() in ('1', 'true')
+    )
+    
+    # Send stored embeddings to pgvector as int8-valued vectors with the scale in
+    # metadata (~5x smaller JSON payload; cosine search is unaffected by the scale)
+    quantize_stored_embeddings: bool = field(
+        default_factory=lambda: os.environ.get('QUANTIZE_STORED_EMBEDDINGS', '').lower() in ('1', 'true')
+    )
+    
     def __post_init__(self):
         # Auto-configure vector_db_type when using Supabase
         if self.backend == 'supabase' and self.vector_db_type == 'memory':
@@ -291,23 +337,28 @@ SEED_DOMAINS: List[Dict] = [
 # ============================================
 
 def build_alias_map() -> Dict[str, str]:
-    """Build a mapping from aliases to canonical domain/subdomain names."""
+    """
+    Build a mapping from aliases to canonical domain/subdomain names.
+    
+    Keys are casefolded once here, so lookups are a single dict access on a
+    casefolded key.
+    """
     alias_map: Dict[str, str] = {}
     
     for domain in SEED_DOMAINS:
         canonical_domain = domain["label"]
         
         # Add domain aliases
-        alias_map[canonical_domain.lower()] = canonical_domain
+        alias_map[canonical_domain.casefold()] = canonical_domain
         for alias in domain.get("aliases", []):
-            alias_map[alias.lower()] = canonical_domain
+            alias_map[alias.casefold()] = canonical_domain
         
         # Add subdomain aliases
         for subdomain in domain.get("subdomains", []):
             canonical_subdomain = f"{canonical_domain}/{subdomain['label']}"
-            alias_map[subdomain["label"].lower()] = canonical_subdomain
+            alias_map[subdomain["label"].casefold()] = canonical_subdomain
             for alias in subdomain.get("aliases", []):
-                alias_map[alias.lower()] = canonical_subdomain
+                alias_map[alias.casefold()] = canonical_subdomain
     
     return alias_map
 
@@ -319,7 +370,8 @@ ALIAS_MAP: Dict[str, str] = build_alias_map()
 # Forbidden Words - Words to exclude from labels
 # ============================================
 
-FORBIDDEN_LABEL_WORDS: Set[str] = {
+# Frozen: shared read-only by every label and tag check
+FORBIDDEN_LABEL_WORDS: FrozenSet[str] = frozenset({
     "saved", "stash", "stashed", "bookmark", "bookmarked",
     "like", "liked", "favorite", "favourited", "favorited",
     "share", "shared", "post", "posted", "tweet", "tweeted",
@@ -327,7 +379,7 @@ FORBIDDEN_LABEL_WORDS: Set[str] = {
     "video", "image", "photo", "picture", "link", "url",
     "content", "item", "thing", "stuff", "misc", "miscellaneous",
     "other", "general", "various", "random", "untitled", "unknown"
-}
+})
 
 
 # ============================================
@@ -80,6 +80,12 @@ class FolderRepository(ABC):
         """Increment the item count for a folder."""
         pass
     
+    def batch_increment_item_counts(self, counts: Dict[str, int]) -> None:
+        """Add per-folder deltas to item counts (folder_id -> delta)."""
+        for folder_id, delta in counts.items():
+            for _ in range(delta):
+                self.increment_item_count(folder_id)
+    
     @abstractmethod
     def get_children(self, parent_id: str) -> List[FolderEntity]:
         """Get child folders of a parent."""
@@ -282,6 +288,15 @@ class LocalJsonFolderRepository(FolderRepository):
             self._folders[folder_id]['item_count'] = self._folders[folder_id].get('item_count', 0) + 1
             self._save()
     
+    def batch_increment_item_counts(self, counts: Dict[str, int]) -> None:
+        changed = False
+        for folder_id, delta in counts.items():
+            if folder_id in self._folders:
+                self._folders[folder_id]['item_count'] = self._folders[folder_id].get('item_count', 0) + delta
+                changed = True
+        if changed:
+            self._save()
+    
     def get_children(self, parent_id: str) -> List[FolderEntity]:
         children = []
         for data in self._folders.values():
@@ -510,6 +525,9 @@ class PostgreSQLFolderRepository(FolderRepository):
     def increment_item_count(self, folder_id: str) -> None:
         logger.info(f"[PLACEHOLDER] Would increment item count in PostgreSQL: {folder_id}")
     
+    def batch_increment_item_counts(self, counts: Dict[str, int]) -> None:
+        logger.info(f"[PLACEHOLDER] Would increment item counts in PostgreSQL: {len(counts)} folders")
+    
     def get_children(self, parent_id: str) -> List[FolderEntity]:
         logger.info(f"[PLACEHOLDER] Would fetch children from PostgreSQL: {parent_id}")
         return []
@@ -10,6 +10,7 @@ Handles:
 
 import logging
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
 import json
@@ -89,6 +90,27 @@ class EmbeddingService:
             except Exception as e:
                 logger.warning(f"Failed to save embedding cache: {e}")
     
+    def _truncate(self, text: str) -> str:
+        """Truncate text to the model's maximum input length."""
+        if len(text) > self.config.max_text_length:
+            logger.debug(f"Truncated text to {self.config.max_text_length} chars")
+            return text[:self.config.max_text_length]
+        return text
+    
+    def _embed_content(self, content):
+        """Call Gemini for one text (returns a vector) or a list of texts (returns a list of vectors)."""
+        if isinstance(content, list):
+            content = [self._truncate(text) for text in content]
+        else:
+            content = self._truncate(content)
+        
+        result = genai.embed_content(
+            model=self.config.model_name,
+            content=content,
+            task_type=self.config.task_type
+        )
+        return result['embedding']
+    
     def generate_embedding(self, text: str, use_cache: bool = True) -> List[float]:
         """
         Generate embedding for text using Gemini.
@@ -112,20 +134,8 @@ class EmbeddingService:
         # Configure if needed
         self._configure()
         
-        # Truncate if too long
-        if len(text) > self.config.max_text_length:
-            text = text[:self.config.max_text_length]
-            logger.debug(f"Truncated text to {self.config.max_text_length} chars")
-        
         try:
-            # Generate embedding using Gemini
-            result = genai.embed_content(
-                model=self.config.model_name,
-                content=text,
-                task_type=self.config.task_type
-            )
-            
-            embedding = result['embedding']
+            embedding = self._embed_content(text)
             
             # Cache result
             if use_cache:
@@ -154,18 +164,55 @@ class EmbeddingService:
         Returns:
             List of embedding vectors
         """
-        embeddings = []
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        pending: Dict[str, List[int]] = {}
         
-        for text in texts:
+        # Serve cache hits, and group misses by cache key so duplicates embed once
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            cache_key = self._get_cache_key(text)
+            if use_cache and cache_key in self._cache:
+                embeddings[i] = self._cache[cache_key]
+            else:
+                pending.setdefault(cache_key, []).append(i)
+        
+        if pending:
+            miss_texts = [texts[indices[0]] for indices in pending.values()]
+            results: List[Optional[List[float]]] = [None] * len(miss_texts)
+            
             try:
-                embedding = self.generate_embedding(text, use_cache)
-                embeddings.append(embedding)
+                self._configure()
+                # One request for all misses
+                results = list(self._embed_content(miss_texts))
             except Exception as e:
-                logger.error(f"Failed to embed text: {text[:50]}... Error: {e}")
-                # Return zero vector on failure
-                embeddings.append([0.0] * self.config.dimension)
+                logger.warning(f"Batch embedding failed, falling back to per-text requests: {e}")
+                
+                def embed_one(text: str) -> Optional[List[float]]:
+                    try:
+                        return self._embed_content(text)
+                    except Exception as err:
+                        logger.error(f"Failed to embed text: {text[:50]}... Error: {err}")
+                        return None
+                
+                if self._configured:
+                    with ThreadPoolExecutor(max_workers=8) as executor:
+                        results = list(executor.map(embed_one, miss_texts))
+            
+            for (cache_key, indices), embedding in zip(pending.items(), results):
+                if embedding is None:
+                    continue
+                for i in indices:
+                    embeddings[i] = embedding
+                if use_cache:
+                    self._cache[cache_key] = embedding
+            
+            # Persist the cache once for the whole batch
+            if use_cache:
+                self._save_cache()
         
-        return embeddings
+        # Return zero vector on failure
+        return [e if e is not None else [0.0] * self.config.dimension for e in embeddings]
     
     @staticmethod
     def cosine_similarity(a: List[float], b: List[float]) -> float:
@@ -300,6 +347,30 @@ class VectorStore:
         """Get a vector by ID."""
         raise NotImplementedError
 
+    def get_vectors_by_filter(
+        self,
+        filter_metadata: Dict[str, Any]
+    ) -> Tuple[List[str], np.ndarray, List[Dict[str, Any]]]:
+        """
+        Get all vectors whose metadata matches the filter.
+        
+        Returns:
+            Tuple of (ids, stacked embeddings with one row per id, metadata list)
+        """
+        raise NotImplementedError
+    
+    def get_metadata_by_filter(self, filter_metadata: Dict[str, Any]) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Get (ids, metadata list) of all vectors whose metadata matches the filter, without embeddings."""
+        ids, _, metadatas = self.get_vectors_by_filter(filter_metadata)
+        return ids, metadatas
+    
+    @staticmethod
+    def _matches_filter(metadata: Dict[str, Any], filter_metadata: Optional[Dict[str, Any]]) -> bool:
+        """Check whether metadata satisfies every key/value in the filter."""
+        if not filter_metadata:
+            return True
+        return all(metadata.get(k) == v for k, v in filter_metadata.items())
+
 
 class InMemoryVectorStore(VectorStore):
     """
@@ -362,13 +433,8 @@ class InMemoryVectorStore(VectorStore):
         
         for vector_id, (embedding, metadata) in self._vectors.items():
             # Apply metadata filter if provided
-            if filter_metadata:
-                match = all(
-                    metadata.get(k) == v 
-                    for k, v in filter_metadata.items()
-                )
-                if not match:
-                    continue
+            if not self._matches_filter(metadata, filter_metadata):
+                continue
             
             try:
                 score = self.embedding_service.cosine_similarity(query_embedding, embedding)
@@ -397,6 +463,36 @@ class InMemoryVectorStore(VectorStore):
         """Get all vectors."""
         return self._vectors.copy()
     
+    def get_vectors_by_filter(
+        self,
+        filter_metadata: Dict[str, Any]
+    ) -> Tuple[List[str], np.ndarray, List[Dict[str, Any]]]:
+        """Get all vectors whose metadata matches the filter, stacked into one matrix."""
+        ids: List[str] = []
+        embeddings: List[List[float]] = []
+        metadatas: List[Dict[str, Any]] = []
+        
+        for vector_id, (embedding, metadata) in self._vectors.items():
+            if embedding and self._matches_filter(metadata, filter_metadata):
+                ids.append(vector_id)
+                embeddings.append(embedding)
+                metadatas.append(metadata)
+        
+        if not ids:
+            return ids, np.empty((0, 0), dtype=np.float32), metadatas
+        
+        return ids, np.asarray(embeddings, dtype=np.float32), metadatas
+    
+    def get_metadata_by_filter(self, filter_metadata: Dict[str, Any]) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Get (ids, metadata list) of all vectors whose metadata matches the filter, without embeddings."""
+        ids: List[str] = []
+        metadatas: List[Dict[str, Any]] = []
+        for vector_id, (embedding, metadata) in self._vectors.items():
+            if embedding and self._matches_filter(metadata, filter_metadata):
+                ids.append(vector_id)
+                metadatas.append(metadata)
+        return ids, metadatas
+    
     def clear(self) -> None:
         """Clear all vectors."""
         self._vectors = {}
@@ -0,0 +1,290 @@
+"""
+Folder Embedding Index for Auto-Folder System
+
+Handles:
+- Struct-of-arrays storage of unit-normalized folder embeddings
+- Amortized O(1) appends via capacity-doubling buffers
+- Partitioned (per-parent) top-k similarity search
+- Optional int8 quantization with per-row scales
+- Radix trie for exact label lookup
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ._kernels import topk_above_threshold, topk_from_scores
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+# ============================================
+# Array Helpers
+# ============================================
+
+INITIAL_CAPACITY = 16
+
+_EMPTY_IDS = np.empty(0, dtype=np.int64)
+_EMPTY_SCORES = np.empty(0, dtype=np.float32)
+
+
+def ensure_capacity(buf: np.ndarray, rows: int) -> np.ndarray:
+    """Return buf if it can hold rows, else a copy with doubled capacity (amortized O(1) appends)."""
+    capacity = buf.shape[0]
+    if rows <= capacity:
+        return buf
+    
+    new_capacity = max(INITIAL_CAPACITY, capacity * 2)
+    while new_capacity < rows:
+        new_capacity *= 2
+    
+    grown = np.empty((new_capacity,) + buf.shape[1:], dtype=buf.dtype)
+    grown[:capacity] = buf
+    return grown
+
+
+def normalize_embedding(vec) -> np.ndarray:
+    """Return an L2-normalized float32 copy of a vector (or each row of a matrix)."""
+    vec = np.asarray(vec, dtype=np.float32)
+    norms = np.linalg.norm(vec, axis=-1, keepdims=True)
+    return vec / np.maximum(norms, np.float32(1e-12))
+
+
+def quantize_int8(vec) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Symmetrically quantize a vector (or each row of a matrix) to int8.
+    
+    Returns:
+        Tuple of (int8 values, float32 scale per row) with vec ~= values * scale
+    """
+    vec = np.asarray(vec, dtype=np.float32)
+    scale = np.maximum(np.abs(vec).max(axis=-1) / np.float32(127), np.float32(1e-12))
+    values = np.rint(vec / scale[..., None]).astype(np.int8)
+    return values, scale.astype(np.float32)
+
+
+# ============================================
+# Folder Embedding Index
+# ============================================
+
+class FolderEmbeddingIndex:
+    """
+    Struct-of-arrays index of unit-normalized folder embeddings.
+    
+    Embeddings live in one contiguous float32 matrix with a parallel array of
+    caller-defined integer ids. Rows can be grouped into named partitions
+    (e.g. by parent folder) so a search only scans that slice.
+    
+    When quantized, rows are stored as int8 with a float32 scale each and
+    scored with int32 accumulation, a quarter of the fp32 scan bandwidth.
+    """
+    
+    def __init__(
+        self,
+        matrix: Optional[np.ndarray] = None,
+        ids: Optional[Sequence[int]] = None,
+        quantize: bool = False
+    ):
+        """
+        Initialize the index, optionally over an existing (possibly memory-mapped) matrix.
+        
+        Args:
+            matrix: Normalized float32 embeddings, one row per id
+            ids: Caller ids for each matrix row
+            quantize: Store rows as int8 instead of float32
+        """
+        self.quantize = quantize
+        self._scales = _EMPTY_SCORES
+        if matrix is None:
+            self._buf = np.empty((0, 0), dtype=np.int8 if quantize else np.float32)
+            self._ids = _EMPTY_IDS
+        else:
+            if quantize:
+                self._buf, self._scales = quantize_int8(matrix)
+            else:
+                self._buf = matrix
+            self._ids = np.asarray(ids, dtype=np.int64)
+        self._count = self._buf.shape[0]
+        self._partitions: Dict[str, List[int]] = {}
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    @property
+    def dimension(self) -> int:
+        """Embedding dimension (0 while empty)."""
+        return self._buf.shape[1] if self._count else 0
+    
+    @property
+    def matrix(self) -> np.ndarray:
+        """Used rows of the embedding buffer, as float32."""
+        if self.quantize:
+            return self._buf[:self._count].astype(np.float32) * self._scales[:self._count, None]
+        return self._buf[:self._count]
+    
+    @property
+    def ids(self) -> np.ndarray:
+        """Caller ids, parallel to matrix rows."""
+        return self._ids[:self._count]
+    
+    def add(self, item_id: int, embedding, partition: Optional[str] = None) -> int:
+        """
+        Append a normalized embedding.
+        
+        Args:
+            item_id: Caller id for the row
+            embedding: Unit-normalized embedding vector
+            partition: Optional partition key (e.g. parent folder ID)
+        
+        Returns:
+            Matrix row of the new embedding, or -1 on dimension mismatch
+        """
+        vec = np.asarray(embedding, dtype=np.float32).ravel()
+        
+        if self._count == 0:
+            self._buf = np.empty((INITIAL_CAPACITY, vec.shape[0]), dtype=self._buf.dtype)
+        elif self._buf.shape[1] != vec.shape[0]:
+            logger.warning(
+                f"Embedding dimension {vec.shape[0]} does not match index dimension "
+                f"{self._buf.shape[1]}; skipping vector search for id {item_id}"
+            )
+            return -1
+        
+        row = self._count
+        # Read-only maps are exactly full, so the first append copies into a writable buffer
+        self._buf = ensure_capacity(self._buf, row + 1)
+        self._ids = ensure_capacity(self._ids, row + 1)
+        if self.quantize:
+            self._scales = ensure_capacity(self._scales, row + 1)
+            self._buf[row], self._scales[row] = quantize_int8(vec)
+        else:
+            self._buf[row] = vec
+        self._ids[row] = item_id
+        self._count = row + 1
+        
+        if partition is not None:
+            self.add_to_partition(row, partition)
+        return row
+    
+    def add_to_partition(self, row: int, partition: str) -> None:
+        """Assign a matrix row to a partition."""
+        self._partitions.setdefault(partition, []).append(row)
+    
+    def vector(self, row: int) -> np.ndarray:
+        """Get the embedding stored at a matrix row, as float32."""
+        if self.quantize:
+            return self._buf[row].astype(np.float32) * self._scales[row]
+        return self._buf[row]
+    
+    def search(
+        self,
+        query: np.ndarray,
+        threshold: float,
+        k: int,
+        partition: Optional[str] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the top-k rows at or above a cosine threshold.
+        
+        Args:
+            query: Unit-normalized float32 query vector
+            threshold: Minimum similarity
+            k: Maximum number of results
+            partition: Only search rows in this partition
+        
+        Returns:
+            Tuple of (caller ids, scores), best first
+        """
+        if self._count == 0 or query.shape[0] != self._buf.shape[1]:
+            return _EMPTY_IDS, _EMPTY_SCORES
+        
+        matrix = self._buf[:self._count]
+        scales = self._scales[:self._count]
+        rows = None
+        if partition is not None:
+            rows = np.asarray(self._partitions.get(partition, ()), dtype=np.int64)
+            matrix = matrix[rows]
+            if self.quantize:
+                scales = scales[rows]
+        
+        if self.quantize:
+            # int8 x int8 dot products accumulate in int32, then rescale to cosine
+            q_values, q_scale = quantize_int8(query)
+            dots = np.einsum('ij,j->i', matrix, q_values, dtype=np.int32)
+            scores = (dots * (scales * q_scale)).astype(np.float32)
+            top, scores = topk_from_scores(scores, threshold, k)
+        else:
+            top, scores = topk_above_threshold(matrix, query, threshold, k)
+        if rows is not None:
+            top = rows[top]
+        return self._ids[top], scores
+
+
+# ============================================
+# Folder Label Trie
+# ============================================
+
+class FolderTrie:
+    """
+    Radix (path-compressed) trie mapping lowercase keys to values.
+    
+    Each node holds a multi-character edge prefix, so lookups cost O(len(key))
+    regardless of how many keys are stored. Children are keyed by the first
+    character of their prefix.
+    """
+    
+    __slots__ = ('prefix', 'children', 'values')
+    
+    def __init__(self, prefix: str = ''):
+        self.prefix = prefix
+        self.children: Dict[str, 'FolderTrie'] = {}
+        self.values: List[Any] = []
+    
+    def insert(self, key: str, value: Any) -> None:
+        """Add a value under a key (case-insensitive)."""
+        node = self
+        key = key.lower()
+        
+        while key:
+            child = node.children.get(key[0])
+            if child is None:
+                child = FolderTrie(key)
+                node.children[key[0]] = child
+                node = child
+                break
+            
+            # Length of the shared prefix between the edge and the key
+            common = 1
+            limit = min(len(child.prefix), len(key))
+            while common < limit and child.prefix[common] == key[common]:
+                common += 1
+            
+            if common < len(child.prefix):
+                # Split the edge at the divergence point
+                split = FolderTrie(child.prefix[:common])
+                child.prefix = child.prefix[common:]
+                split.children[child.prefix[0]] = child
+                node.children[key[0]] = split
+                child = split
+            
+            key = key[common:]
+            node = child
+        
+        if value not in node.values:
+            node.values.append(value)
+    
+    def find_exact(self, key: str) -> Optional[Any]:
+        """Get the first value inserted under a key, or None."""
+        node = self
+        key = key.lower()
+        
+        while key:
+            child = node.children.get(key[0])
+            if child is None or not key.startswith(child.prefix):
+                return None
+            key = key[len(child.prefix):]
+            node = child
+        
+        return node.values[0] if node.values else None
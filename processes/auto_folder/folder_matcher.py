@@ -8,12 +8,20 @@ Handles:
 - Sanity checks and guardrails
 """
 
+import atexit
+import hashlib
+import json
 import logging
-import uuid
+import os
+import sys
 from datetime import datetime
-from typing import List, Optional, Dict, Tuple, Set
+from pathlib import Path
+from functools import lru_cache
+from typing import Any, List, Optional, Dict, Tuple, Set, FrozenSet
 import re
 
+import numpy as np
+
 from .config import get_config, ThresholdConfig, SEED_DOMAINS, ALIAS_MAP
 from .models import (
     TaxonomyCandidate,
@@ -23,7 +31,9 @@ from .models import (
     MatchAction,
     MatchResult,
     HierarchicalMatch,
-    LabelWithAliases
+    make_hierarchical_match,
+    LabelWithAliases,
+    fast_uuid4
 )
 from .embedding_service import (
     get_embedding_service,
@@ -31,11 +41,56 @@ from .embedding_service import (
     EmbeddingService,
     VectorStore
 )
+from .folder_index import FolderEmbeddingIndex, FolderTrie, ensure_capacity, normalize_embedding
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
 
+# ============================================
+# Keyword Extraction
+# ============================================
+
+_WORD_RE = re.compile(r'\w+')
+
+_STOP_WORDS: FrozenSet[str] = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'
+})
+
+
+@lru_cache(maxsize=2048)
+def _extract_keywords_cached(text: str) -> FrozenSet[str]:
+    """Tokenize text into lowercase keywords (labels repeat heavily, so cache)."""
+    return frozenset(
+        w for w in _WORD_RE.findall(text.lower())
+        if len(w) > 2 and w not in _STOP_WORDS
+    )
+
+
+# Common false positive patterns (labels from obviously different domains)
+_FALSE_POSITIVE_PAIRS: FrozenSet[FrozenSet[str]] = frozenset({
+    frozenset({"cooking", "computer"}),
+    frozenset({"health", "computer"}),
+    frozenset({"finance", "fitness"}),
+    frozenset({"travel", "technology"}),
+})
+
+# Seed aliases grouped by canonical path ("Domain" or "Domain/Subdomain")
+_SEED_ALIASES_BY_PATH: Dict[str, List[str]] = {}
+for _alias, _path in ALIAS_MAP.items():
+    _SEED_ALIASES_BY_PATH.setdefault(_path, []).append(_alias)
+
+
+def _label_key(parent_path: Optional[str], label: str) -> str:
+    """Build the exact-match index key for a label under a parent path."""
+    return f"{parent_path}/{label}".lower() if parent_path else label.lower()
+
+
+_FALSE_POSITIVE_RE = re.compile(
+    '|'.join(sorted({term for pair in _FALSE_POSITIVE_PAIRS for term in pair}))
+)
+
+
 class FolderMatcher:
     """
     Matches taxonomy candidates to existing folders using
@@ -46,16 +101,155 @@ class FolderMatcher:
         self,
         embedding_service: Optional[EmbeddingService] = None,
         vector_store: Optional[VectorStore] = None,
-        thresholds: Optional[ThresholdConfig] = None
+        thresholds: Optional[ThresholdConfig] = None,
+        index_dir: Optional[Path] = None
     ):
         """Initialize the folder matcher."""
+        config = get_config()
         self.embedding_service = embedding_service or get_embedding_service()
         self.vector_store = vector_store or get_vector_store()
-        self.thresholds = thresholds or get_config().thresholds
+        self.thresholds = thresholds or config.thresholds
+        
+        # On-disk snapshot of the folder table for fast cold start
+        if index_dir is None and config.output_dir:
+            index_dir = config.output_dir / "folder_index"
+        self._index_dir: Optional[Path] = index_dir
+        # Set when folders were created since the last snapshot; see flush_index()
+        self._index_dirty = False
+        if index_dir:
+            atexit.register(self.flush_index)
+        self._quantize = config.database.quantize_folder_embeddings
+        
+        # Folder table stored as parallel columns, one row per folder
+        self._fid_to_row: Dict[str, int] = {}
+        self._row_by_path: Dict[str, int] = {}
+        self._folder_ids: List[str] = []
+        self._paths: List[str] = []
+        self._path_parts: List[Tuple[str, ...]] = []
+        self._labels: List[str] = []
+        self._aliases: List[Tuple[str, ...]] = []
+        self._embedding_ids: List[Optional[str]] = []
+        self._is_seed: List[bool] = []
+        self._created_at: List[datetime] = []
+        
+        # Numeric columns are capacity-doubling buffers; only the first len(_folder_ids) rows are used
+        self._depths = np.empty(0, dtype=np.int8)
+        self._parent_rows = np.empty(0, dtype=np.int32)  # -1 for top-level folders
+        self._item_counts = np.empty(0, dtype=np.int64)
+        self._emb_rows = np.empty(0, dtype=np.int32)  # row in the depth index, -1 if none
+        
+        # Normalized embeddings per depth, keyed by folder row and partitioned by parent folder_id
+        self._indexes: Dict[int, FolderEmbeddingIndex] = {
+            d: FolderEmbeddingIndex(quantize=self._quantize) for d in (1, 2, 3)
+        }
+        
+        # Label/alias radix trie per depth: parent-scoped lowercase key -> folder row
+        self._label_index: Dict[int, FolderTrie] = {d: FolderTrie() for d in (1, 2, 3)}
+    
+    def _append_row(
+        self,
+        folder_id: str,
+        path: str,
+        path_parts: Tuple[str, ...],
+        depth: int,
+        parent_row: int = -1,
+        aliases: Tuple[str, ...] = (),
+        embedding_id: Optional[str] = None,
+        embedding: Optional[np.ndarray] = None,
+        item_count: int = 0,
+        is_seed: bool = False,
+        created_at: Optional[datetime] = None
+    ) -> int:
+        """Append a folder to the column store and its indexes. Returns the new row."""
+        row = len(self._folder_ids)
+        
+        self._fid_to_row[folder_id] = row
+        self._row_by_path[path] = row
+        self._folder_ids.append(folder_id)
+        self._paths.append(path)
+        self._path_parts.append(path_parts)
+        self._labels.append(path_parts[-1])
+        self._aliases.append(aliases)
+        self._embedding_ids.append(embedding_id)
+        self._is_seed.append(is_seed)
+        self._created_at.append(created_at or datetime.utcnow())
+        
+        self._depths = ensure_capacity(self._depths, row + 1)
+        self._parent_rows = ensure_capacity(self._parent_rows, row + 1)
+        self._item_counts = ensure_capacity(self._item_counts, row + 1)
+        self._emb_rows = ensure_capacity(self._emb_rows, row + 1)
+        self._depths[row] = depth
+        self._parent_rows[row] = parent_row
+        self._item_counts[row] = item_count
+        
+        emb_row = -1
+        if depth <= 3:
+            if embedding is not None and len(embedding):
+                parent_id = self._folder_ids[parent_row] if parent_row >= 0 else None
+                emb_row = self._indexes[depth].add(row, embedding, partition=parent_id)
+            
+            parent_path = '/'.join(path_parts[:-1]) or None
+            index = self._label_index[depth]
+            for name in [path_parts[-1], *aliases, *_SEED_ALIASES_BY_PATH.get(path, [])]:
+                index.insert(_label_key(parent_path, name), row)
         
-        # Cache for loaded folders
-        self._folder_cache: Dict[str, FolderEntity] = {}
-        self._folders_by_depth: Dict[int, List[FolderEntity]] = {1: [], 2: [], 3: []}
+        self._emb_rows[row] = emb_row
+        return row
+    
+    def _register_folder(self, folder: FolderEntity) -> None:
+        """Add a folder entity to the column store."""
+        parent_row = self._fid_to_row.get(folder.parent_id, -1) if folder.parent_id else -1
+        self._append_row(
+            folder_id=folder.folder_id,
+            path=folder.path,
+            path_parts=folder.path_parts,
+            depth=folder.depth,
+            parent_row=parent_row,
+            aliases=folder.aliases,
+            embedding_id=folder.embedding_id,
+            embedding=folder.embedding,
+            item_count=folder.item_count,
+            is_seed=folder.is_seed,
+            created_at=folder.created_at
+        )
+    
+    def _folder_at(self, row: int) -> FolderEntity:
+        """Materialize a FolderEntity view of a column store row."""
+        depth = int(self._depths[row])
+        parent_row = int(self._parent_rows[row])
+        emb_row = int(self._emb_rows[row])
+        
+        return FolderEntity(
+            folder_id=self._folder_ids[row],
+            path=self._paths[row],
+            label=self._labels[row],
+            depth=depth,
+            parent_id=self._folder_ids[parent_row] if parent_row >= 0 else None,
+            aliases=self._aliases[row],
+            embedding_id=self._embedding_ids[row],
+            embedding=self._indexes[depth].vector(emb_row) if emb_row >= 0 else None,
+            created_at=self._created_at[row],
+            item_count=int(self._item_counts[row]),
+            is_seed=self._is_seed[row],
+            path_parts=self._path_parts[row]
+        )
+    
+    def get_folder(self, folder_id: str) -> Optional[FolderEntity]:
+        """Get a loaded folder by ID."""
+        row = self._fid_to_row.get(folder_id)
+        return self._folder_at(row) if row is not None else None
+    
+    def folder_count(self, depth: Optional[int] = None) -> int:
+        """Count loaded folders, optionally at a single depth."""
+        if depth is None:
+            return len(self._folder_ids)
+        return int(np.count_nonzero(self._depths[:len(self._folder_ids)] == depth))
+    
+    def _lookup_label(self, depth: int, parent_path: Optional[str], label: str) -> Optional[FolderEntity]:
+        """Find a folder by exact label or alias, without generating an embedding."""
+        index = self._label_index.get(depth)
+        row = index.find_exact(_label_key(parent_path, label)) if index else None
+        return self._folder_at(row) if row is not None else None
     
     def load_existing_folders(self, folders: List[ExistingFolder]) -> None:
         """
@@ -64,48 +258,197 @@ class FolderMatcher:
         Args:
             folders: List of existing folders with embeddings
         """
-        for folder in folders:
-            # Determine depth from path
-            depth = len(folder.path.split('/'))
+        # Parents first, so each child can resolve its parent row from its path
+        for folder in sorted(folders, key=lambda f: f.path.count('/')):
+            if folder.folder_id in self._fid_to_row:
+                continue
+            
+            # Determine depth and label from path
+            parts = tuple(folder.path.split('/'))
+            parent_row = self._row_by_path.get('/'.join(parts[:-1]), -1) if len(parts) > 1 else -1
             
-            entity = FolderEntity(
+            self._append_row(
                 folder_id=folder.folder_id,
                 path=folder.path,
-                label=folder.path.split('/')[-1],
-                depth=depth,
+                path_parts=parts,
+                depth=len(parts),
+                parent_row=parent_row,
                 embedding_id=folder.embedding_id,
-                embedding=folder.embedding,
+                embedding=normalize_embedding(folder.embedding) if folder.embedding is not None else None,
                 item_count=folder.item_count
             )
             
-            self._folder_cache[folder.folder_id] = entity
-            
-            if depth <= 3:
-                self._folders_by_depth[depth].append(entity)
-        
         logger.info(
             f"Loaded {len(folders)} folders: "
-            f"{len(self._folders_by_depth[1])} domains, "
-            f"{len(self._folders_by_depth[2])} subdomains, "
-            f"{len(self._folders_by_depth[3])} leaves"
+            f"{self.folder_count(1)} domains, "
+            f"{self.folder_count(2)} subdomains, "
+            f"{self.folder_count(3)} leaves"
         )
     
+    def _index_fingerprint(self, vector_ids: List[str]) -> Dict[str, Any]:
+        """
+        Describe what the folder table is built from: the vector store backend,
+        the embedding model and the folder vector IDs.
+        
+        A snapshot whose fingerprint differs from the current one is stale.
+        """
+        embeddings = get_config().embeddings
+        folder_ids = sorted(vector_ids)
+        return {
+            'backend': type(self.vector_store).__name__,
+            'embedding_model': embeddings.model_name,
+            'embedding_dimension': embeddings.dimension,
+            'folder_count': len(folder_ids),
+            'folder_ids_hash': hashlib.blake2b('\n'.join(folder_ids).encode('utf-8'), digest_size=16).hexdigest()
+        }
+    
+    def save_index(self) -> None:
+        """
+        Snapshot the folder table to the index directory.
+        
+        Embeddings are written as one .npy per depth (memory-mappable on load),
+        everything else as a JSON column file. Item counts are not saved; they
+        are read from the vector store on load.
+        """
+        if not self._index_dir:
+            return
+        self._index_dirty = False
+        
+        try:
+            self._index_dir.mkdir(parents=True, exist_ok=True)
+            
+            for depth in (1, 2, 3):
+                tmp_path = self._index_dir / f"embeddings_depth{depth}.tmp.npy"
+                np.save(tmp_path, self._indexes[depth].matrix)
+                os.replace(tmp_path, self._index_dir / f"embeddings_depth{depth}.npy")
+            
+            n = len(self._folder_ids)
+            meta = {
+                # The folder vectors in the store are exactly the rows with an embedding_id
+                'fingerprint': self._index_fingerprint([eid for eid in self._embedding_ids if eid]),
+                'folder_ids': self._folder_ids,
+                'paths': self._paths,
+                'aliases': self._aliases,
+                'embedding_ids': self._embedding_ids,
+                'is_seed': self._is_seed,
+                'created_at': [dt.isoformat() for dt in self._created_at],
+                'depths': self._depths[:n].tolist(),
+                'parent_rows': self._parent_rows[:n].tolist(),
+                'emb_rows': self._emb_rows[:n].tolist()
+            }
+            
+            # Metadata goes last so a partial snapshot is never loaded
+            tmp_path = self._index_dir / "folder_meta.json.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(meta, f)
+            os.replace(tmp_path, self._index_dir / "folder_meta.json")
+            
+        except Exception as e:
+            logger.warning(f"Failed to save folder index: {e}")
+    
+    def flush_index(self) -> None:
+        """Save the snapshot if folders were created since it was last written."""
+        if self._index_dirty:
+            self.save_index()
+    
+    def load_index(self) -> bool:
+        """
+        Load the folder table from the index directory snapshot.
+        
+        The snapshot is only used if it was built from the current vector
+        store contents, backend and embedding model.
+        
+        Returns:
+            True if a snapshot was loaded
+        """
+        meta_path = self._index_dir / "folder_meta.json" if self._index_dir else None
+        if not meta_path or not meta_path.exists() or self._folder_ids:
+            return False
+        
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            
+            # Only ids and metadata are fetched; the embeddings come from the snapshot
+            vector_ids, metadatas = self.vector_store.get_metadata_by_filter({'type': 'folder'})
+            if meta.get('fingerprint') != self._index_fingerprint(vector_ids):
+                logger.info("Folder index snapshot is stale, rebuilding from the vector store")
+                return False
+            
+            matrices = {
+                depth: np.load(self._index_dir / f"embeddings_depth{depth}.npy", mmap_mode='r')
+                for depth in (1, 2, 3)
+            }
+        except Exception as e:
+            logger.warning(f"Failed to load folder index: {e}")
+            return False
+        
+        self._folder_ids = meta['folder_ids']
+        self._paths = meta['paths']
+        self._path_parts = [tuple(path.split('/')) for path in self._paths]
+        self._labels = [parts[-1] for parts in self._path_parts]
+        self._aliases = [tuple(sys.intern(alias) for alias in aliases) for aliases in meta['aliases']]
+        self._embedding_ids = meta['embedding_ids']
+        self._is_seed = meta['is_seed']
+        self._created_at = [datetime.fromisoformat(dt) for dt in meta['created_at']]
+        self._depths = np.asarray(meta['depths'], dtype=np.int8)
+        self._parent_rows = np.asarray(meta['parent_rows'], dtype=np.int32)
+        counts = {vector_id: metadata.get('item_count', 0) for vector_id, metadata in zip(vector_ids, metadatas)}
+        self._item_counts = np.asarray([counts.get(eid, 0) for eid in self._embedding_ids], dtype=np.int64)
+        self._emb_rows = np.asarray(meta['emb_rows'], dtype=np.int32)
+        
+        # Rebuild lookup indexes in one pass
+        index_ids: Dict[int, List[int]] = {1: [], 2: [], 3: []}
+        partitions: Dict[int, List[Tuple[int, str]]] = {1: [], 2: [], 3: []}
+        for row, (folder_id, path, depth, parent_row, emb_row) in enumerate(zip(
+            self._folder_ids, self._paths, meta['depths'], meta['parent_rows'], meta['emb_rows']
+        )):
+            self._fid_to_row[folder_id] = row
+            self._row_by_path[path] = row
+            if depth > 3:
+                continue
+            
+            if emb_row >= 0:
+                index_ids[depth].append(row)
+                if parent_row >= 0:
+                    partitions[depth].append((emb_row, self._folder_ids[parent_row]))
+            
+            parts = self._path_parts[row]
+            parent_path = '/'.join(parts[:-1]) or None
+            index = self._label_index[depth]
+            for name in [parts[-1], *self._aliases[row], *_SEED_ALIASES_BY_PATH.get(path, [])]:
+                index.insert(_label_key(parent_path, name), row)
+        
+        for depth, matrix in matrices.items():
+            index = FolderEmbeddingIndex(matrix=matrix, ids=index_ids[depth], quantize=self._quantize)
+            for emb_row, parent_id in partitions[depth]:
+                index.add_to_partition(emb_row, parent_id)
+            self._indexes[depth] = index
+        
+        logger.info(f"Loaded {len(self._folder_ids)} folders from index snapshot")
+        return True
+    
     def load_folders_from_store(self) -> None:
-        """Load folders from vector store."""
-        vectors = self.vector_store.get_all_vectors()
-        
-        folders = []
-        for vector_id, (embedding, metadata) in vectors.items():
-            if metadata.get('type') == 'folder':
-                folders.append(ExistingFolder(
-                    folder_id=metadata.get('folder_id', vector_id),
-                    path=metadata.get('path', ''),
-                    embedding_id=vector_id,
-                    embedding=embedding,
-                    item_count=metadata.get('item_count', 0)
-                ))
+        """Load folders from the index snapshot, or from the vector store."""
+        if self.load_index():
+            return
+        
+        ids, embeddings, metadatas = self.vector_store.get_vectors_by_filter({'type': 'folder'})
+        
+        folders = [
+            ExistingFolder(
+                folder_id=metadata.get('folder_id', vector_id),
+                path=metadata.get('path', ''),
+                embedding_id=vector_id,
+                embedding=embeddings[row],
+                item_count=metadata.get('item_count', 0)
+            )
+            for row, (vector_id, metadata) in enumerate(zip(ids, metadatas))
+        ]
         
         self.load_existing_folders(folders)
+        if folders:
+            self.save_index()
     
     def initialize_seed_folders(self) -> List[FolderEntity]:
         """
@@ -116,102 +459,84 @@ class FolderMatcher:
             List of created seed folders
         """
         created_folders = []
+        embed_texts = []
         
         for domain in SEED_DOMAINS:
             # Create domain folder
             domain_entity = FolderEntity(
-                folder_id=str(uuid.uuid4()),
+                folder_id=fast_uuid4(),
                 path=domain["label"],
                 label=domain["label"],
                 depth=1,
                 aliases=domain.get("aliases", []),
                 is_seed=True
             )
-            
-            # Generate and store embedding
-            try:
-                embedding = self.embedding_service.generate_embedding(domain["label"])
-                embedding_id = f"folder_{domain_entity.folder_id}"
-                
-                self.vector_store.add_vector(
-                    vector_id=embedding_id,
-                    embedding=embedding,
-                    metadata={
-                        'type': 'folder',
-                        'folder_id': domain_entity.folder_id,
-                        'path': domain_entity.path,
-                        'depth': 1,
-                        'is_seed': True
-                    }
-                )
-                
-                domain_entity.embedding_id = embedding_id
-                domain_entity.embedding = embedding
-                
-            except Exception as e:
-                logger.warning(f"Failed to create embedding for domain {domain['label']}: {e}")
-            
             created_folders.append(domain_entity)
-            self._folder_cache[domain_entity.folder_id] = domain_entity
-            self._folders_by_depth[1].append(domain_entity)
+            embed_texts.append(domain["label"])
             
             # Create subdomain folders
             for subdomain in domain.get("subdomains", []):
-                subdomain_path = f"{domain['label']}/{subdomain['label']}"
                 subdomain_entity = FolderEntity(
-                    folder_id=str(uuid.uuid4()),
-                    path=subdomain_path,
+                    folder_id=fast_uuid4(),
+                    path=f"{domain['label']}/{subdomain['label']}",
                     label=subdomain["label"],
                     depth=2,
                     parent_id=domain_entity.folder_id,
                     aliases=subdomain.get("aliases", []),
                     is_seed=True
                 )
+                created_folders.append(subdomain_entity)
+                # Use hierarchical embedding text
+                embed_texts.append(f"{domain['label']} > {subdomain['label']}")
                 
-                # Generate and store embedding
+        # Generate all seed embeddings in one batch
+        try:
+            embeddings = self.embedding_service.generate_embeddings_batch(embed_texts)
+        except Exception as e:
+            logger.warning(f"Failed to create seed embeddings: {e}")
+            embeddings = [None] * len(created_folders)
+        
+        for folder, embedding in zip(created_folders, embeddings):
+            # Batch failures come back as zero vectors
+            if embedding is not None and any(embedding):
                 try:
-                    # Use hierarchical embedding text
-                    embed_text = f"{domain['label']} > {subdomain['label']}"
-                    embedding = self.embedding_service.generate_embedding(embed_text)
-                    embedding_id = f"folder_{subdomain_entity.folder_id}"
+                    embedding = normalize_embedding(embedding)
+                    embedding_id = f"folder_{folder.folder_id}"
+                    
+                    metadata = {
+                        'type': 'folder',
+                        'folder_id': folder.folder_id,
+                        'path': folder.path,
+                        'depth': folder.depth,
+                        'is_seed': True
+                    }
+                    if folder.parent_id:
+                        metadata['parent_id'] = folder.parent_id
                     
                     self.vector_store.add_vector(
                         vector_id=embedding_id,
-                        embedding=embedding,
-                        metadata={
-                            'type': 'folder',
-                            'folder_id': subdomain_entity.folder_id,
-                            'path': subdomain_entity.path,
-                            'depth': 2,
-                            'parent_id': domain_entity.folder_id,
-                            'is_seed': True
-                        }
+                        embedding=embedding.tolist(),
+                        metadata=metadata
                     )
                     
-                    subdomain_entity.embedding_id = embedding_id
-                    subdomain_entity.embedding = embedding
+                    folder.embedding_id = embedding_id
+                    folder.embedding = embedding
                     
                 except Exception as e:
-                    logger.warning(f"Failed to create embedding for subdomain {subdomain_path}: {e}")
+                    logger.warning(f"Failed to store embedding for seed folder {folder.path}: {e}")
+            else:
+                logger.warning(f"Failed to create embedding for seed folder {folder.path}")
                 
-                created_folders.append(subdomain_entity)
-                self._folder_cache[subdomain_entity.folder_id] = subdomain_entity
-                self._folders_by_depth[2].append(subdomain_entity)
+            self._register_folder(folder)
+        
+        self.save_index()
         
         logger.info(f"Initialized {len(created_folders)} seed folders")
         return created_folders
     
-    def _extract_keywords(self, text: str) -> Set[str]:
+    def _extract_keywords(self, text: str) -> FrozenSet[str]:
         """Extract keywords from text for sanity checking."""
-        # Normalize and split
-        text = text.lower()
-        words = re.findall(r'\b\w+\b', text)
-        
-        # Remove common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        keywords = {w for w in words if len(w) > 2 and w not in stop_words}
-        
-        return keywords
+        return _extract_keywords_cached(text)
     
     def _keyword_overlap(self, text_a: str, text_b: str) -> float:
         """Calculate keyword overlap ratio between two texts."""
@@ -252,20 +577,10 @@ class FolderMatcher:
             return False
         
         # Check for obviously wrong matches (different domains)
-        # These are common false positive patterns
-        false_positive_pairs = [
-            ("cooking", "computer"),
-            ("health", "computer"),
-            ("finance", "fitness"),
-            ("travel", "technology"),
-        ]
-        
-        label_a_lower = candidate_label.lower()
-        label_b_lower = matched_label.lower()
-        
-        for pair in false_positive_pairs:
-            if (pair[0] in label_a_lower and pair[1] in label_b_lower) or \
-               (pair[1] in label_a_lower and pair[0] in label_b_lower):
+        terms_a = set(_FALSE_POSITIVE_RE.findall(candidate_label.lower()))
+        if terms_a:
+            terms_b = set(_FALSE_POSITIVE_RE.findall(matched_label.lower()))
+            if any(frozenset((a, b)) in _FALSE_POSITIVE_PAIRS for a in terms_a for b in terms_b):
                 logger.warning(f"Sanity check: rejecting likely false positive {candidate_label} vs {matched_label}")
                 return False
         
@@ -276,7 +591,8 @@ class FolderMatcher:
         search_text: str,
         depth: int,
         parent_id: Optional[str] = None,
-        threshold: float = 0.8
+        threshold: float = 0.8,
+        query_embedding: Optional[List[float]] = None
     ) -> Tuple[Optional[FolderEntity], float]:
         """
         Find the best matching folder at a given depth.
@@ -286,16 +602,21 @@ class FolderMatcher:
             depth: Folder depth level
             parent_id: Optional parent folder ID for subdomain/leaf searches
             threshold: Minimum similarity threshold
+            query_embedding: Precomputed embedding to search with (skips generation)
             
         Returns:
             Tuple of (matched_folder, similarity_score)
         """
         # Generate embedding for search text
-        try:
-            query_embedding = self.embedding_service.generate_embedding(search_text)
-        except Exception as e:
-            logger.error(f"Failed to generate embedding for search: {e}")
-            return None, 0.0
+        if query_embedding is None:
+            try:
+                query_embedding = self.embedding_service.generate_embedding(search_text)
+            except Exception as e:
+                logger.error(f"Failed to generate embedding for search: {e}")
+                return None, 0.0
+        
+        # Folder embeddings are stored unit-length, so cosine is a bare dot product
+        query_vec = normalize_embedding(query_embedding)
         
         # Build filter
         filter_metadata = {'type': 'folder', 'depth': depth}
@@ -311,25 +632,18 @@ class FolderMatcher:
         
         # Also search in-memory cache if vector store returns few results
         if len(results) < 3:
-            candidates = self._folders_by_depth.get(depth, [])
-            
-            if parent_id:
-                candidates = [f for f in candidates if f.parent_id == parent_id]
+            top_rows, top_scores = self._indexes[depth].search(
+                query_vec, threshold, 5, partition=parent_id or None
+            )
             
-            for folder in candidates:
-                if folder.embedding:
-                    try:
-                        score = self.embedding_service.cosine_similarity(
-                            query_embedding, folder.embedding
-                        )
-                        # Add to results if not already present
-                        if not any(r[0] == folder.embedding_id for r in results):
-                            results.append((folder.embedding_id, score, {
-                                'folder_id': folder.folder_id,
-                                'path': folder.path
-                            }))
-                    except Exception:
-                        pass
+            seen = {r[0] for r in results}
+            for row, score in zip(top_rows, top_scores):
+                # Add to results if not already present
+                if self._embedding_ids[row] not in seen:
+                    results.append((self._embedding_ids[row], min(float(score), 1.0), {
+                        'folder_id': self._folder_ids[row],
+                        'path': self._paths[row]
+                    }))
         
         # Sort and filter
         results.sort(key=lambda x: x[1], reverse=True)
@@ -342,14 +656,14 @@ class FolderMatcher:
                 continue
             
             folder_id = metadata.get('folder_id')
-            folder = self._folder_cache.get(folder_id)
+            folder = self.get_folder(folder_id) if folder_id else None
             
             if not folder:
                 # Try to reconstruct from metadata
                 path = metadata.get('path', '')
                 if path:
                     folder = FolderEntity(
-                        folder_id=folder_id or str(uuid.uuid4()),
+                        folder_id=folder_id or fast_uuid4(),
                         path=path,
                         label=path.split('/')[-1],
                         depth=depth,
@@ -370,33 +684,36 @@ class FolderMatcher:
         label: str,
         depth: int,
         parent: Optional[FolderEntity] = None,
-        aliases: List[str] = None
+        aliases: Tuple[str, ...] = ()
     ) -> FolderEntity:
         """Create a new folder entity."""
         if parent:
             path = f"{parent.path}/{label}"
+            parts = parent.path_parts + (label,)
         else:
             path = label
+            parts = (label,)
         
         folder = FolderEntity(
-            folder_id=str(uuid.uuid4()),
+            folder_id=fast_uuid4(),
             path=path,
             label=label,
             depth=depth,
             parent_id=parent.folder_id if parent else None,
-            aliases=aliases or [],
-            is_seed=False
+            aliases=aliases,
+            is_seed=False,
+            path_parts=parts
         )
         
         # Generate and store embedding
         try:
             embed_text = path.replace('/', ' > ')
-            embedding = self.embedding_service.generate_embedding(embed_text)
+            embedding = normalize_embedding(self.embedding_service.generate_embedding(embed_text))
             embedding_id = f"folder_{folder.folder_id}"
             
             self.vector_store.add_vector(
                 vector_id=embedding_id,
-                embedding=embedding,
+                embedding=embedding.tolist(),
                 metadata={
                     'type': 'folder',
                     'folder_id': folder.folder_id,
@@ -413,10 +730,9 @@ class FolderMatcher:
         except Exception as e:
             logger.warning(f"Failed to create embedding for new folder {path}: {e}")
         
-        # Add to cache
-        self._folder_cache[folder.folder_id] = folder
-        if depth <= 3:
-            self._folders_by_depth[depth].append(folder)
+        # Add to cache; the snapshot is rewritten by flush_index(), not per folder
+        self._register_folder(folder)
+        self._index_dirty = True
         
         logger.info(f"Created new folder: {path}")
         return folder
@@ -431,6 +747,18 @@ class FolderMatcher:
         Returns:
             MatchResult for domain level
         """
+        # Exact label/alias hit needs no embedding
+        exact_folder = self._lookup_label(1, None, candidate.domain.label)
+        if exact_folder:
+            return MatchResult(
+                level=FolderDepth.DOMAIN,
+                action=MatchAction.REUSE_EXISTING,
+                matched_folder=exact_folder,
+                similarity_score=1.0,
+                label_used=exact_folder.label,
+                notes=f"Reused existing domain '{exact_folder.label}' (exact label match)"
+            )
+        
         search_text = candidate.domain.label
         threshold = self.thresholds.domain_threshold
         
@@ -486,16 +814,37 @@ class FolderMatcher:
         if not domain_folder:
             raise ValueError("Domain folder required for subdomain matching")
         
+        # Exact label/alias hit under this domain needs no embedding
+        exact_folder = self._lookup_label(2, domain_folder.path, candidate.subdomain.label)
+        if exact_folder:
+            return MatchResult(
+                level=FolderDepth.SUBDOMAIN,
+                action=MatchAction.REUSE_EXISTING,
+                matched_folder=exact_folder,
+                similarity_score=1.0,
+                label_used=exact_folder.label,
+                notes=f"Reused existing subdomain '{exact_folder.label}' (exact label match)"
+            )
+        
         # Search text includes domain for better context
         search_text = f"{domain_folder.label} > {candidate.subdomain.label}"
         threshold = self.thresholds.subdomain_threshold
         
+        # Embed once up front when the diagnostic search will reuse it
+        query_embedding = None
+        if self.thresholds.enable_cross_domain_diagnostic:
+            try:
+                query_embedding = self.embedding_service.generate_embedding(search_text)
+            except Exception as e:
+                logger.error(f"Failed to generate embedding for search: {e}")
+        
         # First try to find under specific domain
         matched_folder, similarity = self._find_best_match(
             search_text=search_text,
             depth=2,
             parent_id=domain_folder.folder_id,
-            threshold=threshold
+            threshold=threshold,
+            query_embedding=query_embedding
         )
         
         if matched_folder:
@@ -508,16 +857,18 @@ class FolderMatcher:
                 notes=f"Reused existing subdomain '{matched_folder.label}' (similarity: {similarity:.2f})"
             )
         
-        # Try global search at depth 2 (might find similar subdomain under different domain)
-        matched_folder, similarity = self._find_best_match(
-            search_text=candidate.subdomain.label,
-            depth=2,
-            threshold=threshold
-        )
+        # Diagnostic only: global search at depth 2 (might find similar subdomain under different domain)
+        if query_embedding is not None:
+            matched_folder, similarity = self._find_best_match(
+                search_text=candidate.subdomain.label,
+                depth=2,
+                threshold=threshold,
+                query_embedding=query_embedding
+            )
         
-        if matched_folder and similarity > threshold + 0.05:
-            # Found similar elsewhere, but we want to create under our domain
-            logger.info(f"Found similar subdomain '{matched_folder.label}' under different domain")
+            if matched_folder and similarity > threshold + 0.05:
+                # Found similar elsewhere, but we want to create under our domain
+                logger.info(f"Found similar subdomain '{matched_folder.label}' under different domain")
         
         # Create new subdomain under domain
         new_folder = self._create_folder(
@@ -569,6 +920,18 @@ class FolderMatcher:
         if not subdomain_folder:
             return None
         
+        # Exact label/alias hit under this subdomain needs no embedding
+        exact_folder = self._lookup_label(3, subdomain_folder.path, candidate.leaf_topic.label)
+        if exact_folder:
+            return MatchResult(
+                level=FolderDepth.LEAF,
+                action=MatchAction.REUSE_EXISTING,
+                matched_folder=exact_folder,
+                similarity_score=1.0,
+                label_used=exact_folder.label,
+                notes=f"Reused existing leaf '{exact_folder.label}' (exact label match)"
+            )
+        
         # Search text includes full path
         search_text = f"{subdomain_folder.path} > {candidate.leaf_topic.label}"
         threshold = self.thresholds.leaf_threshold
@@ -649,7 +1012,7 @@ class FolderMatcher:
         # Match leaf (optional)
         leaf_result = self.match_leaf(candidate, subdomain_result)
         
-        match = HierarchicalMatch(
+        match = make_hierarchical_match(
             domain_result=domain_result,
             subdomain_result=subdomain_result,
             leaf_result=leaf_result
@@ -668,43 +1031,29 @@ class FolderMatcher:
         Returns:
             Dictionary representing the folder hierarchy
         """
-        tree = {}
-        
-        for folder in self._folders_by_depth[1]:
-            tree[folder.path] = {
-                'id': folder.folder_id,
-                'label': folder.label,
-                'item_count': folder.item_count,
-                'children': {}
+        n = len(self._folder_ids)
+        depths = self._depths[:n].tolist()
+        item_counts = self._item_counts[:n].tolist()
+        
+        nodes: List[Dict] = []
+        for row, depth in enumerate(depths):
+            node = {
+                'id': self._folder_ids[row],
+                'label': self._labels[row],
+                'item_count': item_counts[row]
             }
-        
-        for folder in self._folders_by_depth[2]:
-            parent_path = '/'.join(folder.path.split('/')[:-1])
-            if parent_path in tree:
-                tree[parent_path]['children'][folder.label] = {
-                    'id': folder.folder_id,
-                    'label': folder.label,
-                    'path': folder.path,
-                    'item_count': folder.item_count,
-                    'children': {}
-                }
-        
-        for folder in self._folders_by_depth[3]:
-            parts = folder.path.split('/')
-            if len(parts) >= 3:
-                domain_path = parts[0]
-                subdomain_label = parts[1]
-                
-                if domain_path in tree:
-                    if subdomain_label in tree[domain_path]['children']:
-                        tree[domain_path]['children'][subdomain_label]['children'][folder.label] = {
-                            'id': folder.folder_id,
-                            'label': folder.label,
-                            'path': folder.path,
-                            'item_count': folder.item_count
-                        }
-        
-        return tree
+            if depth > 1:
+                node['path'] = self._paths[row]
+            if depth < 3:
+                node['children'] = {}
+            nodes.append(node)
+        
+        # Link children to parents in a single pass
+        for row, parent_row in enumerate(self._parent_rows[:n].tolist()):
+            if parent_row >= 0 and 'children' in nodes[parent_row]:
+                nodes[parent_row]['children'][self._labels[row]] = nodes[row]
+        
+        return {self._paths[row]: nodes[row] for row, depth in enumerate(depths) if depth == 1}
 
 
 # ============================================
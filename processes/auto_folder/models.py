@@ -10,12 +10,27 @@ Contains Pydantic models and dataclasses for:
 """
 
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Union
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Union, Tuple, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
+import os
+import re
+import sys
+import threading
 import uuid
 import json
 
+import numpy as np
+
+# Try to import orjson for fast JSON encoding
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # ============================================
 # Enums
@@ -48,11 +63,133 @@ class ItemSourceType(Enum):
     UNKNOWN = "unknown"
 
 
+# ============================================
+# Serialization Helpers
+# ============================================
+
+# Field names for flat to_dict() output, in output order. A single attrgetter
+# fetches them all in C instead of one attribute lookup per key.
+_ITEM_INPUT_FIELDS = (
+    "item_id", "raw_topic", "summary", "source_app", "url", "domain", "user_note",
+    "timestamp", "entities", "keywords", "content_path", "media_type"
+)
+_LABEL_FIELDS = ("label", "aliases", "optional")
+_FOLDER_ENTITY_FIELDS = (
+    "folder_id", "path", "label", "depth", "parent_id", "aliases", "embedding_id",
+    "created_at", "updated_at", "item_count", "is_seed", "user_id"
+)
+_EXISTING_FOLDER_FIELDS = ("folder_id", "path", "embedding_id", "item_count")
+_OUTPUT_FIELDS = (
+    "item_id", "final_path", "created_folders", "reused_folders", "applied_labels", "tags",
+    "similarity_scores", "confidence", "notes", "processed_at", "processing_time_ms"
+)
+_BATCH_OUTPUT_FIELDS = (
+    "total_items", "successful", "failed", "new_folders_created", "folders_reused",
+    "processing_time_ms"
+)
+
+_get_item_input_fields = attrgetter(*_ITEM_INPUT_FIELDS)
+_get_label_fields = attrgetter(*_LABEL_FIELDS)
+_get_folder_entity_fields = attrgetter(*_FOLDER_ENTITY_FIELDS)
+_get_existing_folder_fields = attrgetter(*_EXISTING_FOLDER_FIELDS)
+_get_output_fields = attrgetter(*_OUTPUT_FIELDS)
+_get_batch_output_fields = attrgetter(*_BATCH_OUTPUT_FIELDS)
+
+
+def _as_float32(value: Any) -> np.ndarray:
+    """View raw little-endian fp32 bytes, or convert a sequence, as a contiguous float32 array."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return np.frombuffer(value, dtype='<f4')
+    return np.ascontiguousarray(value, dtype=np.float32)
+
+
+# Bound once so default factories and __post_init__ skip the attribute lookup
+_utcnow = datetime.utcnow
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+# ============================================
+# ID Generation
+# ============================================
+
+# Random bytes for 4096 UUIDs per os.urandom call instead of one syscall each
+_UUID_POOL_SIZE = 4096 * 16
+_uuid_lock = threading.Lock()
+_uuid_pool = b""
+_uuid_offset = _UUID_POOL_SIZE
+
+
+def _reset_uuid_pool() -> None:
+    # A forked child must not hand out the parent's remaining bytes
+    global _uuid_lock, _uuid_pool, _uuid_offset
+    _uuid_lock = threading.Lock()
+    _uuid_pool = b""
+    _uuid_offset = _UUID_POOL_SIZE
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_uuid_pool)
+
+
+def fast_uuid4() -> str:
+    """Generate a random RFC 4122 version 4 UUID string from a pooled random buffer."""
+    global _uuid_pool, _uuid_offset
+    with _uuid_lock:
+        if _uuid_offset >= _UUID_POOL_SIZE:
+            _uuid_pool = os.urandom(_UUID_POOL_SIZE)
+            _uuid_offset = 0
+        raw = _uuid_pool[_uuid_offset:_uuid_offset + 16]
+        _uuid_offset += 16
+    # version=4 sets the version and variant bits exactly as uuid.uuid4() does
+    return str(uuid.UUID(bytes=raw, version=4))
+
+
+# ============================================
+# Text Helpers
+# ============================================
+
+# Summary characters sent to the LLM
+PROMPT_SUMMARY_MAX_CHARS = 2000
+
+
+def _truncate_at_word(text: str, max_chars: int) -> str:
+    """Cut text to at most max_chars, backing off to the last whitespace so no word is split."""
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind(' ', max_chars // 2, max_chars + 1)
+    return text[:cut if cut > 0 else max_chars].rstrip()
+
+
+# Downloader directory-name needles -> source app, matched in one regex pass
+_SOURCE_APPS: Dict[str, str] = {
+    source.value: source.value
+    for source in (
+        ItemSourceType.TIKTOK,
+        ItemSourceType.INSTAGRAM,
+        ItemSourceType.TWITTER,
+        ItemSourceType.YOUTUBE
+    )
+}
+_SOURCE_RE = re.compile('|'.join(map(re.escape, _SOURCE_APPS)))
+
+
+def _read_stripped(path: Path) -> str:
+    """Read a whole UTF-8 file in one unbuffered call, or return '' if it is missing."""
+    try:
+        with open(path, 'rb', buffering=0) as f:
+            return f.read().decode('utf-8').strip()
+    except FileNotFoundError:
+        return ""
+
+
 # ============================================
 # Input Models
 # ============================================
 
-@dataclass
+@dataclass(slots=True)
 class ItemInput:
     """
     Input item to be categorized.
@@ -75,11 +212,15 @@ class ItemInput:
     content_path: Optional[str] = None
     media_type: Optional[str] = None  # 'video', 'image', 'document', 'text'
     
+    # Summary bounded for LLM prompts, cut once at a word boundary
+    prompt_summary: str = field(default="", init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         if not self.item_id:
-            self.item_id = str(uuid.uuid4())
+            self.item_id = fast_uuid4()
         if not self.timestamp:
-            self.timestamp = datetime.utcnow()
+            self.timestamp = _utcnow()
+        self.prompt_summary = _truncate_at_word(self.summary, PROMPT_SUMMARY_MAX_CHARS)
     
     @classmethod
     def from_downloader_output(cls, output_dir: str) -> "ItemInput":
@@ -89,36 +230,18 @@ class ItemInput:
         Args:
             output_dir: Path to the output directory containing topic.txt and summary.txt
         """
-        from pathlib import Path
-        
         out_path = Path(output_dir)
         
-        # Read topic
-        topic_path = out_path / "topic.txt"
-        raw_topic = ""
-        if topic_path.exists():
-            raw_topic = topic_path.read_text(encoding='utf-8').strip()
-        
-        # Read summary
-        summary_path = out_path / "summary.txt"
-        summary = ""
-        if summary_path.exists():
-            summary = summary_path.read_text(encoding='utf-8').strip()
+        # Read topic and summary (missing files read as empty)
+        raw_topic = _read_stripped(out_path / "topic.txt")
+        summary = _read_stripped(out_path / "summary.txt")
         
         # Determine source from directory name
-        dir_name = out_path.name.lower()
-        source_app = None
-        if "tiktok" in dir_name:
-            source_app = ItemSourceType.TIKTOK.value
-        elif "instagram" in dir_name:
-            source_app = ItemSourceType.INSTAGRAM.value
-        elif "twitter" in dir_name:
-            source_app = ItemSourceType.TWITTER.value
-        elif "youtube" in dir_name:
-            source_app = ItemSourceType.YOUTUBE.value
+        match = _SOURCE_RE.search(out_path.name.lower())
+        source_app = _SOURCE_APPS[match.group()] if match else None
         
         return cls(
-            item_id=str(uuid.uuid4()),
+            item_id=fast_uuid4(),
             raw_topic=raw_topic,
             summary=summary,
             source_app=source_app,
@@ -127,50 +250,43 @@ class ItemInput:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "item_id": self.item_id,
-            "raw_topic": self.raw_topic,
-            "summary": self.summary,
-            "source_app": self.source_app,
-            "url": self.url,
-            "domain": self.domain,
-            "user_note": self.user_note,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "entities": self.entities,
-            "keywords": self.keywords,
-            "content_path": self.content_path,
-            "media_type": self.media_type
-        }
+        data = dict(zip(_ITEM_INPUT_FIELDS, _get_item_input_fields(self)))
+        data["timestamp"] = _isoformat(self.timestamp)
+        return data
 
 
 # ============================================
 # Taxonomy Models
 # ============================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LabelWithAliases:
-    """A label with its aliases for search/matching."""
+    """A label with its aliases for search/matching. Immutable, so safe to share across threads."""
     label: str
-    aliases: List[str] = field(default_factory=list)
+    aliases: Tuple[str, ...] = ()
     optional: bool = False
     
+    def __post_init__(self):
+        # Labels repeat across a batch; interned copies share memory and compare by identity
+        object.__setattr__(self, 'label', sys.intern(self.label))
+        # LLM replies may carry "aliases": null or non-string entries; drop them rather than fail
+        object.__setattr__(self, 'aliases', tuple(
+            sys.intern(alias) for alias in (self.aliases or ()) if isinstance(alias, str)
+        ))
+    
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "label": self.label,
-            "aliases": self.aliases,
-            "optional": self.optional
-        }
+        return dict(zip(_LABEL_FIELDS, _get_label_fields(self)))
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "LabelWithAliases":
         return cls(
             label=data.get("label", ""),
-            aliases=data.get("aliases", []),
+            aliases=data.get("aliases", ()),
             optional=data.get("optional", False)
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TaxonomyCandidate:
     """
     Generated taxonomy candidate from LLM analysis.
@@ -184,22 +300,33 @@ class TaxonomyCandidate:
     confidence: float = 0.0
     rationale: str = ""
     
+    # Memoized path/search strings (labels are immutable once generated)
+    _cache: Dict[Any, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
     def get_full_path(self, include_leaf: bool = True) -> str:
         """Get the full folder path string."""
-        parts = [self.domain.label, self.subdomain.label]
-        if include_leaf and self.leaf_topic and not self.leaf_topic.optional:
-            parts.append(self.leaf_topic.label)
-        return "/".join(parts)
+        path = self._cache.get(include_leaf)
+        if path is None:
+            parts = [self.domain.label, self.subdomain.label]
+            if include_leaf and self.leaf_topic and not self.leaf_topic.optional:
+                parts.append(self.leaf_topic.label)
+            path = self._cache[include_leaf] = sys.intern("/".join(parts))
+        return path
     
     def get_search_text(self, level: FolderDepth) -> str:
         """Get text for embedding/matching at a specific level."""
-        if level == FolderDepth.DOMAIN:
-            return self.domain.label
-        elif level == FolderDepth.SUBDOMAIN:
-            return f"{self.domain.label} > {self.subdomain.label}"
-        elif level == FolderDepth.LEAF and self.leaf_topic:
-            return f"{self.domain.label} > {self.subdomain.label} > {self.leaf_topic.label}"
-        return ""
+        text = self._cache.get(level)
+        if text is None:
+            if level == FolderDepth.DOMAIN:
+                text = self.domain.label
+            elif level == FolderDepth.SUBDOMAIN:
+                text = f"{self.domain.label} > {self.subdomain.label}"
+            elif level == FolderDepth.LEAF and self.leaf_topic:
+                text = f"{self.domain.label} > {self.subdomain.label} > {self.leaf_topic.label}"
+            else:
+                text = ""
+            text = self._cache[level] = sys.intern(text)
+        return text
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -227,7 +354,7 @@ class TaxonomyCandidate:
 # Folder Models
 # ============================================
 
-@dataclass
+@dataclass(slots=True)
 class FolderEntity:
     """
     Database-ready folder entity.
@@ -239,36 +366,43 @@ class FolderEntity:
     depth: int  # 1 = domain, 2 = subdomain, 3 = leaf
     
     parent_id: Optional[str] = None
-    aliases: List[str] = field(default_factory=list)
+    aliases: Tuple[str, ...] = ()
     embedding_id: Optional[str] = None
-    embedding: Optional[List[float]] = None
+    # float32; lists and raw fp32 bytes are converted. Left out of __eq__, which can't compare arrays
+    embedding: Optional[np.ndarray] = field(default=None, compare=False)
     
     # Metadata
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_utcnow)
+    updated_at: datetime = field(default_factory=_utcnow)
     item_count: int = 0
     is_seed: bool = False
     user_id: Optional[str] = None
     
+    # Path components, split once at construction
+    path_parts: Tuple[str, ...] = field(default=(), repr=False)
+    parent_path: Optional[str] = field(default=None, repr=False)
+    
     def __post_init__(self):
         if not self.folder_id:
-            self.folder_id = str(uuid.uuid4())
+            self.folder_id = fast_uuid4()
+        if not isinstance(self.aliases, tuple):
+            self.aliases = tuple(self.aliases)
+        if self.embedding is not None and not isinstance(self.embedding, np.ndarray):
+            self.embedding = _as_float32(self.embedding)
+        if not self.path_parts and self.path:
+            self.path_parts = tuple(self.path.split('/'))
+        if self.parent_path is None and len(self.path_parts) > 1:
+            self.parent_path = '/'.join(self.path_parts[:-1])
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "folder_id": self.folder_id,
-            "path": self.path,
-            "label": self.label,
-            "depth": self.depth,
-            "parent_id": self.parent_id,
-            "aliases": self.aliases,
-            "embedding_id": self.embedding_id,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "item_count": self.item_count,
-            "is_seed": self.is_seed,
-            "user_id": self.user_id
-        }
+        data = dict(zip(_FOLDER_ENTITY_FIELDS, _get_folder_entity_fields(self)))
+        data["created_at"] = _isoformat(self.created_at)
+        data["updated_at"] = _isoformat(self.updated_at)
+        return data
+    
+    def embedding_array(self) -> Optional[np.ndarray]:
+        """Get the embedding as a float32 array (no copy when already one)."""
+        return _as_float32(self.embedding) if self.embedding is not None else None
     
     def to_db_record(self) -> Dict[str, Any]:
         """Convert to database record format."""
@@ -279,12 +413,12 @@ class FolderEntity:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "FolderEntity":
         return cls(
-            folder_id=data.get("folder_id", str(uuid.uuid4())),
+            folder_id=data.get("folder_id", ""),
             path=data.get("path", ""),
-            label=data.get("label", ""),
+            label=sys.intern(data.get("label", "")),
             depth=data.get("depth", 1),
             parent_id=data.get("parent_id"),
-            aliases=data.get("aliases", []),
+            aliases=tuple(sys.intern(alias) for alias in data.get("aliases") or () if isinstance(alias, str)),
             embedding_id=data.get("embedding_id"),
             item_count=data.get("item_count", 0),
             is_seed=data.get("is_seed", False),
@@ -292,29 +426,24 @@ class FolderEntity:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ExistingFolder:
     """Simplified folder representation for matching."""
     folder_id: str
     path: str
     embedding_id: Optional[str] = None
-    embedding: Optional[List[float]] = None
+    embedding: Optional[List[float]] = field(default=None, compare=False)  # may be an ndarray row
     item_count: int = 0
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "folder_id": self.folder_id,
-            "path": self.path,
-            "embedding_id": self.embedding_id,
-            "item_count": self.item_count
-        }
+        return dict(zip(_EXISTING_FOLDER_FIELDS, _get_existing_folder_fields(self)))
 
 
 # ============================================
 # Matching Results
 # ============================================
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """Result of matching at a single folder level."""
     level: FolderDepth
@@ -332,18 +461,28 @@ class MatchResult:
         return self.matched_folder or self.new_folder
     
     def to_dict(self) -> Dict[str, Any]:
+        matched_folder = self.matched_folder
+        new_folder = self.new_folder
         return {
             "level": self.level.name,
             "action": self.action.value,
-            "matched_folder": self.matched_folder.to_dict() if self.matched_folder else None,
-            "new_folder": self.new_folder.to_dict() if self.new_folder else None,
+            "matched_folder": matched_folder.to_dict() if matched_folder is not None else None,
+            "new_folder": new_folder.to_dict() if new_folder is not None else None,
             "similarity_score": self.similarity_score,
             "label_used": self.label_used,
             "notes": self.notes
         }
 
 
-@dataclass
+# Actions under which each level's (domain, subdomain, leaf) new folder counts as created
+_CREATED_ACTIONS = (
+    frozenset({MatchAction.CREATE_NEW}),
+    frozenset({MatchAction.CREATE_NEW, MatchAction.ATTACH_AS_CHILD}),
+    frozenset({MatchAction.CREATE_NEW, MatchAction.ATTACH_AS_CHILD})
+)
+
+
+@dataclass(slots=True)
 class HierarchicalMatch:
     """Complete hierarchical matching result."""
     domain_result: MatchResult
@@ -369,53 +508,113 @@ class HierarchicalMatch:
         
         return "/".join(parts)
     
+    def _iter_created(self) -> Iterator[FolderEntity]:
+        """Yield newly created folders, domain first."""
+        for result, actions in zip(
+            (self.domain_result, self.subdomain_result, self.leaf_result), _CREATED_ACTIONS
+        ):
+            if result is not None and result.action in actions and result.new_folder:
+                yield result.new_folder
+    
+    def _iter_reused(self) -> Iterator[FolderEntity]:
+        """Yield reused folders, domain first."""
+        for result in (self.domain_result, self.subdomain_result, self.leaf_result):
+            if result is not None and result.action is MatchAction.REUSE_EXISTING and result.matched_folder:
+                yield result.matched_folder
+    
     def get_created_folders(self) -> List[FolderEntity]:
         """Get list of newly created folders."""
-        created = []
-        
-        if self.domain_result.action == MatchAction.CREATE_NEW and self.domain_result.new_folder:
-            created.append(self.domain_result.new_folder)
-        
-        if self.subdomain_result.action in [MatchAction.CREATE_NEW, MatchAction.ATTACH_AS_CHILD]:
-            if self.subdomain_result.new_folder:
-                created.append(self.subdomain_result.new_folder)
-        
-        if self.leaf_result and self.leaf_result.action in [MatchAction.CREATE_NEW, MatchAction.ATTACH_AS_CHILD]:
-            if self.leaf_result.new_folder:
-                created.append(self.leaf_result.new_folder)
-        
-        return created
+        return list(self._iter_created())
     
     def get_reused_folders(self) -> List[FolderEntity]:
         """Get list of reused folders."""
-        reused = []
+        return list(self._iter_reused())
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "domain_result": self.domain_result.to_dict(),
+            "subdomain_result": self.subdomain_result.to_dict(),
+            "leaf_result": self.leaf_result.to_dict() if self.leaf_result else None,
+            "final_path": self.get_final_path()
+        }
+
+
+class _NoLeafMatch(HierarchicalMatch):
+    """HierarchicalMatch specialized for a missing leaf result."""
+    __slots__ = ()
+    
+    def get_final_path(self) -> str:
+        """Get the final folder path."""
+        domain_folder = self.domain_result.get_folder()
+        subdomain_folder = self.subdomain_result.get_folder()
+        if domain_folder and subdomain_folder:
+            return f"{domain_folder.label}/{subdomain_folder.label}"
+        if domain_folder:
+            return domain_folder.label
+        return subdomain_folder.label if subdomain_folder else ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "domain_result": self.domain_result.to_dict(),
+            "subdomain_result": self.subdomain_result.to_dict(),
+            "leaf_result": None,
+            "final_path": self.get_final_path()
+        }
+
+
+class _LeafMatch(HierarchicalMatch):
+    """HierarchicalMatch specialized for a present leaf result."""
+    __slots__ = ()
+    
+    def get_final_path(self) -> str:
+        """Get the final folder path."""
+        parts = []
         
-        if self.domain_result.action == MatchAction.REUSE_EXISTING and self.domain_result.matched_folder:
-            reused.append(self.domain_result.matched_folder)
+        domain_folder = self.domain_result.get_folder()
+        if domain_folder:
+            parts.append(domain_folder.label)
         
-        if self.subdomain_result.action == MatchAction.REUSE_EXISTING and self.subdomain_result.matched_folder:
-            reused.append(self.subdomain_result.matched_folder)
+        subdomain_folder = self.subdomain_result.get_folder()
+        if subdomain_folder:
+            parts.append(subdomain_folder.label)
         
-        if self.leaf_result and self.leaf_result.action == MatchAction.REUSE_EXISTING:
-            if self.leaf_result.matched_folder:
-                reused.append(self.leaf_result.matched_folder)
+        if self.leaf_result.action != MatchAction.SKIP:
+            leaf_folder = self.leaf_result.get_folder()
+            if leaf_folder:
+                parts.append(leaf_folder.label)
         
-        return reused
+        return "/".join(parts)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
             "domain_result": self.domain_result.to_dict(),
             "subdomain_result": self.subdomain_result.to_dict(),
-            "leaf_result": self.leaf_result.to_dict() if self.leaf_result else None,
+            "leaf_result": self.leaf_result.to_dict(),
             "final_path": self.get_final_path()
         }
 
 
+def make_hierarchical_match(
+    domain_result: MatchResult,
+    subdomain_result: MatchResult,
+    leaf_result: Optional[MatchResult] = None
+) -> HierarchicalMatch:
+    """
+    Build a HierarchicalMatch specialized on whether a leaf result exists.
+    
+    The leaf branch is resolved once here instead of on every
+    get_final_path/to_dict call.
+    """
+    if leaf_result is None:
+        return _NoLeafMatch(domain_result, subdomain_result)
+    return _LeafMatch(domain_result, subdomain_result, leaf_result)
+
+
 # ============================================
 # Final Output Model
 # ============================================
 
-@dataclass
+@dataclass(slots=True)
 class AutoFolderOutput:
     """
     Final output of the auto-folder system.
@@ -435,26 +634,26 @@ class AutoFolderOutput:
     notes: str = ""
     
     # Processing metadata
-    processed_at: datetime = field(default_factory=datetime.utcnow)
+    processed_at: datetime = field(default_factory=_utcnow)
     processing_time_ms: int = 0
     
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "item_id": self.item_id,
-            "final_path": self.final_path,
-            "created_folders": self.created_folders,
-            "reused_folders": self.reused_folders,
-            "applied_labels": self.applied_labels,
-            "tags": self.tags,
-            "similarity_scores": self.similarity_scores,
-            "confidence": self.confidence,
-            "notes": self.notes,
-            "processed_at": self.processed_at.isoformat() if self.processed_at else None,
-            "processing_time_ms": self.processing_time_ms
-        }
+    def to_dict(self, now_iso: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Convert to dictionary.
+        
+        Args:
+            now_iso: Shared timestamp string used instead of formatting processed_at
+        """
+        data = dict(zip(_OUTPUT_FIELDS, _get_output_fields(self)))
+        data["processed_at"] = now_iso if now_iso is not None else _isoformat(self.processed_at)
+        return data
     
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string."""
+        # orjson serializes the dataclass (and its datetimes) directly, but only indents by 2
+        if ORJSON_AVAILABLE and indent in (None, 0, 2):
+            option = orjson.OPT_INDENT_2 if indent else 0
+            return orjson.dumps(self, option=option).decode()
         return json.dumps(self.to_dict(), indent=indent)
     
     @classmethod
@@ -467,8 +666,8 @@ class AutoFolderOutput:
     ) -> "AutoFolderOutput":
         """Create output from hierarchical match result."""
         
-        created = [f.path for f in match.get_created_folders()]
-        reused = [f.path for f in match.get_reused_folders()]
+        created = [f.path for f in match._iter_created()]
+        reused = [f.path for f in match._iter_reused()]
         
         applied_labels = {
             "domain": match.domain_result.label_used,
@@ -508,7 +707,7 @@ class AutoFolderOutput:
 # Batch Processing Models
 # ============================================
 
-@dataclass
+@dataclass(slots=True)
 class BatchInput:
     """Input for batch processing multiple items."""
     items: List[ItemInput]
@@ -516,7 +715,7 @@ class BatchInput:
     user_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchOutput:
     """Output from batch processing."""
     results: List[AutoFolderOutput]
@@ -529,13 +728,46 @@ class BatchOutput:
     
     processing_time_ms: int = 0
     
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "results": [r.to_dict() for r in self.results],
-            "total_items": self.total_items,
-            "successful": self.successful,
-            "failed": self.failed,
-            "new_folders_created": self.new_folders_created,
-            "folders_reused": self.folders_reused,
-            "processing_time_ms": self.processing_time_ms
-        }
+    @classmethod
+    def from_results(
+        cls,
+        results: List[AutoFolderOutput],
+        processing_time_ms: int = 0
+    ) -> "BatchOutput":
+        """
+        Create batch output, computing all counters in one pass over results.
+
+        Args:
+            results: Per-item outputs (failures have zero confidence)
+            processing_time_ms: Total batch processing time
+        """
+        successful = 0
+        new_folders = 0
+        reused_folders = 0
+        
+        for result in results:
+            successful += result.confidence > 0
+            new_folders += len(result.created_folders)
+            reused_folders += len(result.reused_folders)
+        
+        return cls(
+            results=results,
+            total_items=len(results),
+            successful=successful,
+            failed=len(results) - successful,
+            new_folders_created=new_folders,
+            folders_reused=reused_folders,
+            processing_time_ms=processing_time_ms
+        )
+    
+    def to_dict(self, now_iso: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Convert to dictionary.
+        
+        Args:
+            now_iso: Shared timestamp string for every result's processed_at,
+                instead of formatting one datetime per result
+        """
+        data = {"results": [r.to_dict(now_iso) for r in self.results]}
+        data.update(zip(_BATCH_OUTPUT_FIELDS, _get_batch_output_fields(self)))
+        return data
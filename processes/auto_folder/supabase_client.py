@@ -14,37 +14,106 @@ Supabase Setup:
 4. Set SUPABASE_URL and SUPABASE_KEY in .env
 """
 
+import asyncio
+import atexit
 import logging
 import json
+import re
+import threading
+import time
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Tuple
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Tuple, TYPE_CHECKING
 import uuid
 
+import numpy as np
+
 from .config import get_config
+from .folder_index import ensure_capacity, quantize_int8
 from .models import FolderEntity, AutoFolderOutput, ExistingFolder
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
-# Try to import supabase
+# Check for supabase without importing it; the SDK is only loaded on first client use
+if TYPE_CHECKING:
+    import httpx
+    from supabase import AsyncClient, Client
+
+SUPABASE_AVAILABLE = find_spec("supabase") is not None
+HTTPX_AVAILABLE = find_spec("httpx") is not None
+H2_AVAILABLE = find_spec("h2") is not None
+if not SUPABASE_AVAILABLE:
+    logger.warning("supabase-py not installed. Run: pip install supabase")
+
+# Try to import cachetools for the repository read caches
 try:
-    from supabase import create_client, Client
-    SUPABASE_AVAILABLE = True
+    from cachetools import TTLCache
+    CACHETOOLS_AVAILABLE = True
 except ImportError:
-    SUPABASE_AVAILABLE = False
-    logger.warning("supabase-py not installed. Run: pip install supabase")
+    CACHETOOLS_AVAILABLE = False
+
+# Try to import psycopg for direct writes through the Supavisor pooler
+try:
+    from psycopg import sql
+    from psycopg.types.json import Jsonb
+    from psycopg_pool import ConnectionPool
+    PSYCOPG_AVAILABLE = True
+except ImportError:
+    PSYCOPG_AVAILABLE = False
+
+# Try to import pgvector's psycopg adapter for binary vector COPY
+try:
+    from pgvector.psycopg import register_vector
+    PGVECTOR_AVAILABLE = True
+except ImportError:
+    PGVECTOR_AVAILABLE = False
+
+# Column projections; only what _to_entity and the history callers read
+_FOLDER_COLS = "folder_id,path,label,depth,parent_id,aliases,embedding_id,item_count,is_seed,user_id"
+_CLASSIFICATION_COLS = (
+    "id,item_id,final_path,confidence,created_folders,reused_folders,"
+    "tags,processing_time_ms,created_at"
+)
+
+# Read cache bounds for folder and item lookups
+READ_CACHE_SIZE = 4096
+READ_CACHE_TTL_SECONDS = 60
+
+# IDs per in_() filter; keeps the PostgREST request URL well under proxy limits
+IN_FILTER_MAX_IDS = 200
+
+# Rows per page when reading a whole table; at or below PostgREST's default max-rows
+FETCH_PAGE_SIZE = 1000
+
+# Direct Postgres pool bounds; Supabase caps connections, so stay well below
+PG_POOL_MIN_SIZE = 2
+PG_POOL_MAX_SIZE = 10
+PG_POOL_TIMEOUT_SECONDS = 30
+PG_POOL_RECYCLE_SECONDS = 1800
+
+# HNSW candidate list size for similarity queries (recall vs. latency)
+HNSW_EF_SEARCH = 40
 
 
 class SupabaseClient:
     """
     Singleton Supabase client manager.
+    
+    Creation is guarded by a lock so concurrent first use from batch worker
+    threads builds exactly one client (and one connection handshake).
     """
     _instance: Optional["SupabaseClient"] = None
     _client: Optional["Client"] = None
+    _lock = threading.Lock()
     
     def __new__(cls):
+        # Double-checked: the lock is only taken until the instance exists
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
     
     def initialize(self, url: Optional[str] = None, key: Optional[str] = None) -> "Client":
@@ -73,8 +142,13 @@ class SupabaseClient:
                 "SUPABASE_URL and SUPABASE_KEY must be set in environment or .env file"
             )
         
-        self._client = create_client(supabase_url, supabase_key)
-        logger.info("Supabase client initialized")
+        from supabase import create_client
+        
+        with self._lock:
+            # Another thread may have finished initializing while we waited
+            if self._client is None:
+                self._client = create_client(supabase_url, supabase_key, **_shared_http_options())
+                logger.info("Supabase client initialized")
         
         return self._client
     
@@ -87,7 +161,8 @@ class SupabaseClient:
     
     def close(self) -> None:
         """Close the Supabase client."""
-        self._client = None
+        with self._lock:
+            self._client = None
 
 
 def get_supabase_client() -> "Client":
@@ -95,10 +170,407 @@ def get_supabase_client() -> "Client":
     return SupabaseClient().client
 
 
+# ============================================
+# Shared HTTP Session
+# ============================================
+
+_shared_http: Optional["httpx.Client"] = None
+_shared_http_lock = threading.Lock()
+
+
+def get_shared_http_client() -> Optional["httpx.Client"]:
+    """
+    Get the process-wide keep-alive HTTP client for Supabase requests.
+    
+    Uses HTTP/2 (many requests multiplexed over few connections) when the
+    h2 package is installed, HTTP/1.1 keep-alive otherwise.
+    
+    Returns:
+        Shared httpx.Client, or None if httpx is not installed
+    """
+    global _shared_http
+    if _shared_http is None and HTTPX_AVAILABLE:
+        import httpx
+        
+        with _shared_http_lock:
+            if _shared_http is None:
+                _shared_http = httpx.Client(
+                    http2=H2_AVAILABLE,
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+                )
+                atexit.register(_shared_http.close)
+    return _shared_http
+
+
+def _shared_http_options() -> Dict[str, Any]:
+    """Build create_client kwargs routing requests through the shared HTTP client."""
+    http_client = get_shared_http_client()
+    if http_client is None:
+        return {}
+    
+    try:
+        from supabase import ClientOptions
+        return {"options": ClientOptions(httpx_client=http_client)}
+    except (ImportError, TypeError):
+        # Older SDKs cannot take an external httpx client; they manage their own
+        return {}
+
+
+# ============================================
+# Direct PostgreSQL Pool
+# ============================================
+
+_pg_pool: Optional["ConnectionPool"] = None
+_pg_session_pool: Optional["ConnectionPool"] = None
+_pg_pool_lock = threading.Lock()
+
+# Similarity search run directly on a session-mode connection, so psycopg can
+# prepare it once per connection instead of PostgREST re-planning every call.
+# Distances use the halfvec expression so the planner picks the HNSW index;
+# {dim} is filled in with the configured embedding dimension.
+_MATCH_EMBEDDINGS_SQL = """
+    SELECT entity_id::text, 1 - (embedding::halfvec({dim}) <=> %(q)s::halfvec({dim})) AS similarity, metadata
+    FROM embeddings
+    WHERE entity_type = %(entity_type)s
+        AND 1 - (embedding::halfvec({dim}) <=> %(q)s::halfvec({dim})) >= %(threshold)s
+    ORDER BY embedding::halfvec({dim}) <=> %(q)s::halfvec({dim})
+    LIMIT %(limit)s
+"""
+
+
+@lru_cache(maxsize=None)
+def _match_embeddings_sql(dimension: int) -> str:
+    """Similarity search SQL for the given embedding dimension."""
+    return _MATCH_EMBEDDINGS_SQL.replace("{dim}", str(int(dimension)))
+
+
+def direct_pg_available() -> bool:
+    """Check whether bulk writes can go straight to Postgres through the pooler."""
+    return PSYCOPG_AVAILABLE and bool(get_config().database.supabase_pooled_db_url)
+
+
+def _configure_session(conn) -> None:
+    """Apply per-session search settings to a new session-mode connection."""
+    conn.execute(f"SET hnsw.ef_search = {int(HNSW_EF_SEARCH)}")
+    conn.commit()
+
+
+def direct_search_available() -> bool:
+    """Check whether similarity search can run on a session-mode connection."""
+    return PSYCOPG_AVAILABLE and bool(get_config().database.supabase_session_db_url)
+
+
+def _create_pg_pool(conninfo: str, prepare: bool) -> "ConnectionPool":
+    """Create a bounded, health-checked pool that recycles idle connections."""
+    return ConnectionPool(
+        conninfo=conninfo,
+        min_size=PG_POOL_MIN_SIZE,
+        max_size=PG_POOL_MAX_SIZE,
+        timeout=PG_POOL_TIMEOUT_SECONDS,
+        max_idle=PG_POOL_RECYCLE_SECONDS,
+        max_lifetime=PG_POOL_RECYCLE_SECONDS,
+        check=ConnectionPool.check_connection,
+        # Session settings only persist on the session port
+        configure=_configure_session if prepare else None,
+        # Transaction pooling cannot keep server-side prepared statements
+        kwargs={} if prepare else {"prepare_threshold": None},
+    )
+
+
+def get_pg_pool() -> "ConnectionPool":
+    """Get the shared bounded connection pool for the Supavisor transaction port."""
+    global _pg_pool
+    if _pg_pool is None:
+        with _pg_pool_lock:
+            if _pg_pool is None:
+                _pg_pool = _create_pg_pool(get_config().database.supabase_pooled_db_url, prepare=False)
+                logger.info("Direct Postgres pool initialized")
+    return _pg_pool
+
+
+def get_pg_session_pool() -> "ConnectionPool":
+    """Get the shared bounded connection pool for the Supavisor session port."""
+    global _pg_session_pool
+    if _pg_session_pool is None:
+        with _pg_pool_lock:
+            if _pg_session_pool is None:
+                _pg_session_pool = _create_pg_pool(get_config().database.supabase_session_db_url, prepare=True)
+                logger.info("Direct Postgres session pool initialized")
+    return _pg_session_pool
+
+
+def _pg_write(
+    table: str,
+    rows: List[Dict[str, Any]],
+    on_conflict: Optional[str] = None,
+    casts: Optional[Dict[str, str]] = None
+) -> bool:
+    """
+    Insert (or upsert) rows directly through the pooled connection.
+    
+    Args:
+        table: Target table
+        rows: Row dicts; missing keys are written as NULL
+        on_conflict: Comma-separated conflict columns to upsert on
+        casts: Column -> SQL type; these values are sent as text and parsed server-side
+        
+    Returns:
+        True if the rows were written, False if the caller should fall back
+    """
+    if not rows:
+        return True
+    
+    casts = casts or {}
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    values = [
+        sql.SQL("%s::{}").format(sql.SQL(casts[column])) if column in casts else sql.Placeholder()
+        for column in columns
+    ]
+    query = sql.SQL("INSERT INTO {} ({}) VALUES ({})").format(
+        sql.Identifier(table),
+        sql.SQL(", ").join(map(sql.Identifier, columns)),
+        sql.SQL(", ").join(values)
+    )
+    
+    if on_conflict:
+        keys = [key.strip() for key in on_conflict.split(",")]
+        updates = [column for column in columns if column not in keys]
+        query += sql.SQL(" ON CONFLICT ({}) ").format(sql.SQL(", ").join(map(sql.Identifier, keys)))
+        if updates:
+            query += sql.SQL("DO UPDATE SET {}").format(sql.SQL(", ").join(
+                sql.SQL("{0} = EXCLUDED.{0}").format(sql.Identifier(column)) for column in updates
+            ))
+        else:
+            query += sql.SQL("DO NOTHING")
+    
+    def adapt(column: str, value: Any) -> Any:
+        if value is None:
+            return None
+        if column in casts:
+            # tolist() first: str() of an ndarray or numpy scalars is not a SQL literal
+            return str(np.asarray(value).tolist() if isinstance(value, (list, tuple, np.ndarray)) else value)
+        return Jsonb(value) if isinstance(value, dict) else value
+    
+    params = [tuple(adapt(column, row.get(column)) for column in columns) for row in rows]
+    
+    try:
+        with get_pg_pool().connection() as conn:
+            with conn.cursor() as cur:
+                cur.executemany(query, params)
+        return True
+    except Exception as e:
+        logger.warning(f"Direct Postgres write to {table} failed, falling back to PostgREST: {e}")
+        return False
+
+
 # ============================================
 # Supabase Repository Implementations
 # ============================================
 
+def _chunked(rows: List[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive slices of at most size rows."""
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so value matches literally as a prefix."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# Canonical hyphenated UUID; matched before falling back to uuid.UUID parsing
+_UUID_RE = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE)
+
+
+@lru_cache(maxsize=65536)
+def _ensure_uuid_cached(value: str) -> str:
+    """Return value if it is a valid UUID, else a deterministic UUID derived from it."""
+    if _UUID_RE.match(value):
+        return value
+    try:
+        # Other accepted spellings (braces, urn:uuid:, no hyphens)
+        uuid.UUID(value)
+        return value
+    except ValueError:
+        # Generate deterministic UUID from string
+        return str(uuid.uuid5(uuid.NAMESPACE_OID, value))
+
+
+class _ReadCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed TTL.
+    
+    Backed by cachetools.TTLCache when installed, otherwise by an
+    insertion-ordered dict with the same eviction rules.
+    """
+    
+    def __init__(self, maxsize: int = READ_CACHE_SIZE, ttl: float = READ_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data = TTLCache(maxsize=maxsize, ttl=ttl) if CACHETOOLS_AVAILABLE else {}
+    
+    def get(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            if CACHETOOLS_AVAILABLE:
+                return self._data.get(key)
+            
+            entry = self._data.pop(key, None)
+            if entry is None or entry[0] < time.monotonic():
+                return None
+            self._data[key] = entry  # Re-insert as most recently used
+            return entry[1]
+    
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            if CACHETOOLS_AVAILABLE:
+                self._data[key] = value
+                return
+            
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + self.ttl, value)
+    
+    def pop(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.pop(key, None)
+        if entry is None or CACHETOOLS_AVAILABLE:
+            return entry
+        return entry[1]
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class _FolderMirror:
+    """
+    Process-local struct-of-arrays copy of the folders table.
+    
+    Depth, parent and owner live in parallel numpy arrays so depth and
+    children lookups are a single vectorized mask over contiguous memory;
+    the remaining columns are parallel lists used to rebuild entities.
+    Deleted rows are masked out rather than compacted.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.loaded_at: Optional[float] = None
+        self._reset()
+    
+    def _reset(self) -> None:
+        self._rows: Dict[str, int] = {}
+        self._count = 0
+        self.ids: List[str] = []
+        self.paths: List[str] = []
+        self.labels: List[str] = []
+        self.aliases: List[Tuple[str, ...]] = []
+        self.embedding_ids: List[Optional[str]] = []
+        self.is_seed: List[bool] = []
+        self.parents = np.empty(0, dtype="U36")
+        self.users = np.empty(0, dtype="U36")
+        self.depths = np.empty(0, dtype=np.int16)
+        self.item_counts = np.empty(0, dtype=np.int64)
+        self.alive = np.empty(0, dtype=bool)
+    
+    def is_fresh(self) -> bool:
+        """Check whether the mirror was loaded within the read cache TTL."""
+        return self.loaded_at is not None and time.monotonic() - self.loaded_at < READ_CACHE_TTL_SECONDS
+    
+    def load(self, folders: List[FolderEntity]) -> None:
+        """Replace the mirror contents with a full table snapshot."""
+        with self._lock:
+            self._reset()
+            for folder in folders:
+                self._upsert(folder)
+            self.loaded_at = time.monotonic()
+    
+    def invalidate(self) -> None:
+        """Drop the mirror so the next read reloads it."""
+        with self._lock:
+            self._reset()
+            self.loaded_at = None
+    
+    def upsert(self, folder: FolderEntity) -> None:
+        """Write a created or updated folder through to the mirror."""
+        if self.loaded_at is not None:
+            with self._lock:
+                self._upsert(folder)
+    
+    def _upsert(self, folder: FolderEntity) -> None:
+        row = self._rows.get(folder.folder_id)
+        if row is None:
+            row = self._count
+            self._count = row + 1
+            self._rows[folder.folder_id] = row
+            self.parents = ensure_capacity(self.parents, self._count)
+            self.users = ensure_capacity(self.users, self._count)
+            self.depths = ensure_capacity(self.depths, self._count)
+            self.item_counts = ensure_capacity(self.item_counts, self._count)
+            self.alive = ensure_capacity(self.alive, self._count)
+            for column in (self.ids, self.paths, self.labels, self.aliases, self.embedding_ids, self.is_seed):
+                column.append(None)
+        
+        self.ids[row] = folder.folder_id
+        self.paths[row] = folder.path
+        self.labels[row] = folder.label
+        self.aliases[row] = tuple(folder.aliases)
+        self.embedding_ids[row] = folder.embedding_id
+        self.is_seed[row] = bool(folder.is_seed)
+        self.parents[row] = folder.parent_id or ""
+        self.users[row] = folder.user_id or ""
+        self.depths[row] = folder.depth
+        self.item_counts[row] = folder.item_count or 0
+        self.alive[row] = True
+    
+    def remove(self, folder_id: str) -> None:
+        """Mask a deleted folder out of the mirror."""
+        with self._lock:
+            row = self._rows.pop(folder_id, None)
+            if row is not None:
+                self.alive[row] = False
+    
+    def bump(self, folder_id: str, delta: int) -> None:
+        """Add to a folder's mirrored item count."""
+        with self._lock:
+            row = self._rows.get(folder_id)
+            if row is not None:
+                self.item_counts[row] += delta
+    
+    def select(
+        self,
+        depth: Optional[int] = None,
+        parent_id: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> List[FolderEntity]:
+        """Rebuild the folders matching every given filter, in row order."""
+        with self._lock:
+            n = self._count
+            mask = self.alive[:n].copy()
+            if depth is not None:
+                mask &= self.depths[:n] == depth
+            if parent_id is not None:
+                mask &= self.parents[:n] == parent_id
+            if user_id:
+                mask &= self.users[:n] == user_id
+            return [self._rebuild(row) for row in np.flatnonzero(mask).tolist()]
+    
+    def _rebuild(self, row: int) -> FolderEntity:
+        return FolderEntity(
+            folder_id=self.ids[row],
+            path=self.paths[row],
+            label=self.labels[row],
+            depth=int(self.depths[row]),
+            parent_id=self.parents[row] or None,
+            aliases=self.aliases[row],
+            embedding_id=self.embedding_ids[row],
+            item_count=int(self.item_counts[row]),
+            is_seed=self.is_seed[row],
+            user_id=self.users[row] or None
+        )
+
+
 class SupabaseFolderRepository:
     """
     Supabase-based folder repository.
@@ -109,33 +581,24 @@ class SupabaseFolderRepository:
     def __init__(self, client: Optional["Client"] = None):
         self.client = client or get_supabase_client()
         self.table = "folders"
+        self._use_direct_pg = direct_pg_available()
+        
+        # Classification resolves the same folders repeatedly; skip the round-trip
+        self._id_cache = _ReadCache()
+        self._path_cache = _ReadCache()
+        self._mirror = _FolderMirror()
     
     def create_folder(self, folder: FolderEntity) -> FolderEntity:
         """Create a new folder in Supabase."""
-        # Build data dict, excluding None values and letting Supabase set defaults
-        data = {
-            "folder_id": folder.folder_id,
-            "path": folder.path,
-            "label": folder.label,
-            "depth": folder.depth,
-            "aliases": folder.aliases or [],
-            "item_count": folder.item_count or 0,
-            "is_seed": folder.is_seed or False,
-        }
-        
-        # Only include optional fields if they have values
-        if folder.parent_id:
-            data["parent_id"] = folder.parent_id
-        if folder.embedding_id:
-            data["embedding_id"] = folder.embedding_id
-        if folder.user_id:
-            data["user_id"] = folder.user_id
+        data = self._to_row(folder)
         
         try:
             result = self.client.table(self.table).insert(data).execute()
             
             if result.data:
                 logger.debug(f"Created folder in Supabase: {folder.path}")
+                self._invalidate(folder.folder_id, folder)
+                self._mirror.upsert(folder)
                 return folder
             else:
                 raise Exception(f"Failed to create folder: {result}")
@@ -143,24 +606,110 @@ class SupabaseFolderRepository:
             logger.warning(f"Failed to create folder {folder.path}: {e}")
             raise
     
+    def create_folders_bulk(
+        self,
+        folders: List[FolderEntity],
+        batch_size: int = 500,
+        on_conflict: Optional[str] = None
+    ) -> List[FolderEntity]:
+        """
+        Create many folders with one INSERT per chunk instead of one per folder.
+        
+        Args:
+            folders: Folders to create
+            batch_size: Maximum rows per request
+            on_conflict: Conflict columns (e.g. "path,user_id") to upsert
+                instead of insert, for re-ingesting an existing taxonomy
+        
+        Returns:
+            Folders that were written
+        """
+        created: List[FolderEntity] = []
+        
+        for chunk in _chunked(folders, batch_size):
+            rows = [self._to_row(folder) for folder in chunk]
+            try:
+                if not (self._use_direct_pg and _pg_write(self.table, rows, on_conflict)):
+                    table = self.client.table(self.table)
+                    if on_conflict:
+                        table.upsert(rows, on_conflict=on_conflict).execute()
+                    else:
+                        table.insert(rows).execute()
+                for folder in chunk:
+                    self._invalidate(folder.folder_id, folder)
+                    self._mirror.upsert(folder)
+                created.extend(chunk)
+            except Exception as e:
+                # One bad row fails the whole statement; retry this chunk row by row
+                logger.warning(f"Bulk folder insert failed, retrying {len(chunk)} rows individually: {e}")
+                for folder in chunk:
+                    try:
+                        created.append(self.create_folder(folder))
+                    except Exception:
+                        pass
+        
+        logger.debug(f"Created {len(created)}/{len(folders)} folders in Supabase")
+        return created
+    
     def get_folder_by_id(self, folder_id: str) -> Optional[FolderEntity]:
         """Get folder by ID from Supabase."""
+        folder = self._id_cache.get(folder_id)
+        if folder is not None:
+            return folder
+        
         result = self.client.table(self.table)\
-            .select("*")\
+            .select(_FOLDER_COLS)\
             .eq("folder_id", folder_id)\
             .execute()
         
         if result.data and len(result.data) > 0:
-            return self._to_entity(result.data[0])
+            folder = self._to_entity(result.data[0])
+            self._id_cache.put(folder_id, folder)
+            return folder
         return None
     
+    def get_folders_by_ids(self, folder_ids: List[str]) -> Dict[str, FolderEntity]:
+        """
+        Get many folders by ID, fetching all cache misses in one query.
+        
+        Args:
+            folder_ids: Folder IDs to look up
+            
+        Returns:
+            Dictionary of folder_id -> FolderEntity for the folders found
+        """
+        found: Dict[str, FolderEntity] = {}
+        missing: List[str] = []
+        for folder_id in dict.fromkeys(folder_ids):
+            folder = self._id_cache.get(folder_id)
+            if folder is not None:
+                found[folder_id] = folder
+            else:
+                missing.append(folder_id)
+        
+        for chunk in _chunked(missing, IN_FILTER_MAX_IDS):
+            result = self.client.table(self.table)\
+                .select(_FOLDER_COLS)\
+                .in_("folder_id", chunk)\
+                .execute()
+            for row in result.data or []:
+                folder = self._to_entity(row)
+                self._id_cache.put(folder.folder_id, folder)
+                found[folder.folder_id] = folder
+        
+        return found
+    
     def get_folder_by_path(
         self, 
         path: str, 
         user_id: Optional[str] = None
     ) -> Optional[FolderEntity]:
         """Get folder by path from Supabase."""
-        query = self.client.table(self.table).select("*").eq("path", path)
+        folder = self._path_cache.get((path, user_id))
+        if folder is not None:
+            return folder
+        
+        query = self.client.table(self.table).select(_FOLDER_COLS).eq("path", path)
         
         if user_id:
             query = query.eq("user_id", user_id)
@@ -168,43 +717,77 @@ class SupabaseFolderRepository:
         result = query.execute()
         
         if result.data and len(result.data) > 0:
-            return self._to_entity(result.data[0])
+            folder = self._to_entity(result.data[0])
+            self._path_cache.put((path, user_id), folder)
+            return folder
         return None
     
     def get_all_folders(self, user_id: Optional[str] = None) -> List[FolderEntity]:
-        """Get all folders from Supabase."""
-        query = self.client.table(self.table).select("*")
-        
-        if user_id:
-            query = query.eq("user_id", user_id)
+        """Get all folders, ordered by depth."""
+        if self._ensure_mirror():
+            folders = self._mirror.select(user_id=user_id)
+            folders.sort(key=lambda folder: folder.depth)
+            return folders
+        return self._fetch_all_folders(user_id)
+    
+    def _fetch_all_folders(self, user_id: Optional[str] = None) -> List[FolderEntity]:
+        """
+        Get all folders from Supabase, ordered by depth.
         
-        result = query.order("depth").execute()
+        Pages through the table by folder_id until a page comes back empty, so
+        a server-side max-rows cap smaller than the page size can't truncate it.
+        """
+        rows: List[Dict[str, Any]] = []
+        last_id = None
+        while True:
+            query = self.client.table(self.table).select(_FOLDER_COLS)
+            if user_id:
+                query = query.eq("user_id", user_id)
+            if last_id is not None:
+                query = query.gt("folder_id", last_id)
+            
+            page = query.order("folder_id").limit(FETCH_PAGE_SIZE).execute().data or []
+            if not page:
+                break
+            rows.extend(page)
+            last_id = page[-1]["folder_id"]
         
-        return [self._to_entity(row) for row in result.data] if result.data else []
+        folders = self._to_entities(rows)
+        folders.sort(key=lambda folder: folder.depth)
+        return folders
     
     def get_folders_by_depth(
         self, 
         depth: int, 
         user_id: Optional[str] = None
     ) -> List[FolderEntity]:
-        """Get folders at a specific depth from Supabase."""
-        query = self.client.table(self.table).select("*").eq("depth", depth)
+        """Get folders at a specific depth."""
+        if self._ensure_mirror():
+            folders = self._mirror.select(depth=depth, user_id=user_id)
+            if folders:
+                return folders
+        
+        # Mirror miss: ask Supabase, which also sees writes from other processes
+        query = self.client.table(self.table).select(_FOLDER_COLS).eq("depth", depth)
         
         if user_id:
             query = query.eq("user_id", user_id)
         
         result = query.execute()
         
-        return [self._to_entity(row) for row in result.data] if result.data else []
+        folders = self._to_entities(result.data) if result.data else []
+        for folder in folders:
+            self._mirror.upsert(folder)
+        return folders
     
     def update_folder(self, folder: FolderEntity) -> FolderEntity:
         """Update a folder in Supabase."""
+        self._invalidate(folder.folder_id, folder)
         data = {
             "path": folder.path,
             "label": folder.label,
             "aliases": folder.aliases,
-            "item_count": folder.item_count,
-            "updated_at": datetime.utcnow().isoformat()
+            "item_count": folder.item_count
         }
         
         result = self.client.table(self.table)\
@@ -214,28 +797,34 @@ class SupabaseFolderRepository:
         
         if result.data:
             folder.updated_at = datetime.utcnow()
+            self._mirror.upsert(folder)
             return folder
         else:
             raise Exception(f"Failed to update folder: {result}")
     
     def delete_folder(self, folder_id: str) -> bool:
         """Delete a folder from Supabase."""
+        self._invalidate(folder_id)
         result = self.client.table(self.table)\
             .delete()\
             .eq("folder_id", folder_id)\
             .execute()
         
+        if result.data:
+            self._mirror.remove(folder_id)
         return bool(result.data)
     
     def increment_item_count(self, folder_id: str) -> None:
         """Increment the item count for a folder using RPC."""
         # Using raw SQL via RPC for atomic increment
         # You'll need to create this function in Supabase
+        self._invalidate(folder_id)
         try:
             self.client.rpc(
                 "increment_folder_item_count",
                 {"p_folder_id": folder_id}
             ).execute()
+            self._mirror.bump(folder_id, 1)
         except Exception as e:
             # Fallback to read-update if RPC not available
             logger.warning(f"RPC not available, using fallback: {e}")
@@ -244,14 +833,165 @@ class SupabaseFolderRepository:
                 folder.item_count += 1
                 self.update_folder(folder)
     
+    def batch_increment_item_counts(self, counts: Dict[str, int]) -> None:
+        """
+        Add per-folder deltas to item counts in one RPC round-trip.
+        
+        Args:
+            counts: Mapping of folder_id -> number of items to add
+        """
+        if not counts:
+            return
+        
+        for folder_id in counts:
+            self._invalidate(folder_id)
+        
+        try:
+            self.client.rpc(
+                "increment_folder_item_counts",
+                {"p_counts": counts}
+            ).execute()
+            for folder_id, delta in counts.items():
+                self._mirror.bump(folder_id, delta)
+        except Exception as e:
+            # Fallback to one read-update per folder (not per item) if RPC not available
+            logger.warning(f"Batch RPC not available, using fallback: {e}")
+            for folder_id, delta in counts.items():
+                folder = self.get_folder_by_id(folder_id)
+                if folder:
+                    folder.item_count += delta
+                    self.update_folder(folder)
+    
     def get_children(self, parent_id: str) -> List[FolderEntity]:
-        """Get child folders of a parent from Supabase."""
+        """Get child folders of a parent."""
+        if self._ensure_mirror():
+            folders = self._mirror.select(parent_id=parent_id)
+            if folders:
+                return folders
+        
+        # Mirror miss: ask Supabase, which also sees writes from other processes
         result = self.client.table(self.table)\
-            .select("*")\
+            .select(_FOLDER_COLS)\
             .eq("parent_id", parent_id)\
             .execute()
         
-        return [self._to_entity(row) for row in result.data] if result.data else []
+        folders = self._to_entities(result.data) if result.data else []
+        for folder in folders:
+            self._mirror.upsert(folder)
+        return folders
+    
+    def get_subtree(self, root_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a folder and all its descendants in one round-trip.
+        
+        Uses the get_folder_subtree RPC (a recursive CTE). Without it, falls
+        back to one query per tree level rather than one per folder.
+        
+        Args:
+            root_id: Folder ID of the subtree root
+            
+        Returns:
+            Nested node dict ({'folder', 'children': {label: node}}), or None
+        """
+        try:
+            rows = self.client.rpc("get_folder_subtree", {"p_root": root_id}).execute().data or []
+        except Exception as e:
+            logger.warning(f"Subtree RPC not available, fetching level by level: {e}")
+            rows = []
+            level = [root_id]
+            while level:
+                result = self.client.table(self.table)\
+                    .select(_FOLDER_COLS)\
+                    .in_("parent_id" if rows else "folder_id", level)\
+                    .execute()
+                found = result.data or []
+                rows.extend(found)
+                level = [row["folder_id"] for row in found]
+        
+        return self._build_tree(root_id, self._to_entities(rows))
+    
+    def _build_tree(self, root_id: str, folders: List[FolderEntity]) -> Optional[Dict[str, Any]]:
+        """Link a flat list of folders into nested nodes under root_id."""
+        nodes = {folder.folder_id: {"folder": folder, "children": {}} for folder in folders}
+        
+        for folder in folders:
+            parent = nodes.get(folder.parent_id) if folder.folder_id != root_id else None
+            if parent is not None:
+                parent["children"][folder.label] = nodes[folder.folder_id]
+        
+        return nodes.get(root_id)
+    
+    def clear_cache(self) -> None:
+        """Drop all cached folder lookups."""
+        self._id_cache.clear()
+        self._path_cache.clear()
+        self._mirror.invalidate()
+    
+    def _ensure_mirror(self) -> bool:
+        """
+        (Re)load the in-memory mirror if stale; False means query Supabase directly.
+        
+        The mirror is only replaced by a complete paged read, never a partial one.
+        """
+        if self._mirror.is_fresh():
+            return True
+        try:
+            self._mirror.load(self._fetch_all_folders())
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to load folder mirror, querying Supabase directly: {e}")
+            return False
+    
+    def _invalidate(self, folder_id: str, folder: Optional[FolderEntity] = None) -> None:
+        """Drop cached lookups for a folder under its ID and path."""
+        cached = self._id_cache.pop(folder_id)
+        for entry in (cached, folder):
+            if entry is not None:
+                self._path_cache.pop((entry.path, None))
+                self._path_cache.pop((entry.path, entry.user_id))
+    
+    def _to_row(self, folder: FolderEntity) -> Dict[str, Any]:
+        """Convert FolderEntity to a Supabase row, letting Supabase set defaults."""
+        # Optional fields are only included when set, merged without per-field branches
+        return {
+            "folder_id": folder.folder_id,
+            "path": folder.path,
+            "label": folder.label,
+            "depth": folder.depth,
+            "aliases": list(folder.aliases),
+            "item_count": folder.item_count or 0,
+            "is_seed": bool(folder.is_seed),
+            **({"parent_id": folder.parent_id} if folder.parent_id else {}),
+            **({"embedding_id": folder.embedding_id} if folder.embedding_id else {}),
+            **({"user_id": folder.user_id} if folder.user_id else {}),
+        }
+    
+    def _to_entities(self, rows: List[Dict[str, Any]]) -> List[FolderEntity]:
+        """
+        Convert Supabase rows to FolderEntity objects.
+        
+        Rows selected with _FOLDER_COLS always carry every column, so they are
+        read by direct indexing; anything else goes through _to_entity.
+        """
+        entity = FolderEntity
+        try:
+            return [
+                entity(
+                    folder_id=row["folder_id"],
+                    path=row["path"],
+                    label=row["label"],
+                    depth=row["depth"],
+                    parent_id=row["parent_id"],
+                    aliases=row["aliases"] or (),
+                    embedding_id=row["embedding_id"],
+                    item_count=row["item_count"] or 0,
+                    is_seed=row["is_seed"] or False,
+                    user_id=row["user_id"]
+                )
+                for row in rows
+            ]
+        except KeyError:
+            return [self._to_entity(row) for row in rows]
     
     def _to_entity(self, data: Dict[str, Any]) -> FolderEntity:
         """Convert Supabase row to FolderEntity."""
@@ -261,7 +1001,7 @@ class SupabaseFolderRepository:
             label=data.get("label", ""),
             depth=data.get("depth", 1),
             parent_id=data.get("parent_id"),
-            aliases=data.get("aliases", []),
+            aliases=data.get("aliases") or (),
             embedding_id=data.get("embedding_id"),
             item_count=data.get("item_count", 0),
             is_seed=data.get("is_seed", False),
@@ -279,16 +1019,12 @@ class SupabaseItemFolderRepository:
     def __init__(self, client: Optional["Client"] = None):
         self.client = client or get_supabase_client()
         self.table = "item_folders"
+        self._use_direct_pg = direct_pg_available()
+        self._folder_cache = _ReadCache()
     
     def _ensure_uuid(self, value: str) -> str:
         """Ensure value is a valid UUID, converting if necessary."""
-        try:
-            # Check if already a valid UUID
-            uuid.UUID(value)
-            return value
-        except (ValueError, AttributeError):
-            # Generate deterministic UUID from string
-            return str(uuid.uuid5(uuid.NAMESPACE_OID, value))
+        return _ensure_uuid_cached(str(value))
     
     def associate_item(
         self,
@@ -299,6 +1035,7 @@ class SupabaseItemFolderRepository:
         """Associate an item with a folder."""
         # Ensure item_id is a valid UUID (convert if needed)
         item_uuid = self._ensure_uuid(item_id)
+        self._invalidate(item_id, item_uuid)
         
         data = {
             "item_id": item_uuid,
@@ -313,17 +1050,89 @@ class SupabaseItemFolderRepository:
         except Exception as e:
             logger.warning(f"Failed to associate item {item_id}: {e}")
     
+    def associate_items_bulk(
+        self,
+        items: List[Tuple[str, str, Optional[Dict[str, Any]]]],
+        batch_size: int = 1000
+    ) -> None:
+        """
+        Associate many items with folders, one upsert per chunk.
+        
+        Args:
+            items: (item_id, folder_id, metadata) tuples
+            batch_size: Maximum rows per request
+        """
+        # Postgres rejects an upsert that touches the same row twice, so keep the last pair per item
+        rows_by_item: Dict[str, Dict[str, Any]] = {}
+        for item_id, folder_id, metadata in items:
+            item_uuid = self._ensure_uuid(item_id)
+            self._invalidate(item_id, item_uuid)
+            rows_by_item[item_uuid] = {
+                "item_id": item_uuid,
+                "folder_id": folder_id,
+                "metadata": metadata or {},
+            }
+        rows = list(rows_by_item.values())
+        
+        for chunk in _chunked(rows, batch_size):
+            if self._use_direct_pg and _pg_write(self.table, chunk, on_conflict="item_id"):
+                continue
+            try:
+                self.client.table(self.table).upsert(chunk, on_conflict="item_id").execute()
+            except Exception as e:
+                logger.warning(f"Failed to associate {len(chunk)} items: {e}")
+        
+        logger.debug(f"Associated {len(rows)} items with folders")
+    
     def get_folder_for_item(self, item_id: str) -> Optional[str]:
         """Get the folder ID for an item."""
+        folder_id = self._folder_cache.get(item_id)
+        if folder_id is not None:
+            return folder_id
+        
         result = self.client.table(self.table)\
             .select("folder_id")\
             .eq("item_id", item_id)\
             .execute()
         
         if result.data and len(result.data) > 0:
-            return result.data[0].get("folder_id")
+            folder_id = result.data[0].get("folder_id")
+            if folder_id is not None:
+                self._folder_cache.put(item_id, folder_id)
+            return folder_id
         return None
     
+    def get_folder_for_items(self, item_ids: List[str]) -> Dict[str, str]:
+        """
+        Get the folder IDs for many items, fetching all cache misses in one query.
+        
+        Args:
+            item_ids: Item IDs to look up
+            
+        Returns:
+            Dictionary of item_id -> folder_id for the associated items
+        """
+        found: Dict[str, str] = {}
+        missing: List[str] = []
+        for item_id in dict.fromkeys(item_ids):
+            folder_id = self._folder_cache.get(item_id)
+            if folder_id is not None:
+                found[item_id] = folder_id
+            else:
+                missing.append(item_id)
+        
+        for chunk in _chunked(missing, IN_FILTER_MAX_IDS):
+            result = self.client.table(self.table)\
+                .select("item_id,folder_id")\
+                .in_("item_id", chunk)\
+                .execute()
+            for row in result.data or []:
+                if row.get("folder_id") is not None:
+                    self._folder_cache.put(row["item_id"], row["folder_id"])
+                    found[row["item_id"]] = row["folder_id"]
+        
+        return found
+    
     def get_items_in_folder(
         self,
         folder_id: str,
@@ -331,23 +1140,65 @@ class SupabaseItemFolderRepository:
         offset: int = 0
     ) -> List[str]:
         """Get item IDs in a folder."""
+        if offset == 0:
+            return self.get_items_in_folder_after(folder_id, limit)[0]
+        
+        # Deep offsets make the server scan and discard rows; prefer get_items_in_folder_after
         result = self.client.table(self.table)\
             .select("item_id")\
             .eq("folder_id", folder_id)\
+            .order("associated_at")\
+            .order("item_id")\
             .range(offset, offset + limit - 1)\
             .execute()
         
         return [row["item_id"] for row in result.data] if result.data else []
     
+    def get_items_in_folder_after(
+        self,
+        folder_id: str,
+        limit: int = 100,
+        after: Optional[Tuple[str, str]] = None
+    ) -> Tuple[List[str], Optional[Tuple[str, str]]]:
+        """
+        Get a page of item IDs in a folder using keyset pagination.
+        
+        Pages are ordered by (associated_at, item_id), so each page costs
+        O(limit) on the server however deep it is.
+        
+        Args:
+            folder_id: Folder to list
+            limit: Maximum items per page
+            after: Cursor returned with the previous page, or None for the first
+            
+        Returns:
+            Tuple of (item IDs, cursor for the next page or None at the end)
+        """
+        query = self.client.table(self.table)\
+            .select("item_id,associated_at")\
+            .eq("folder_id", folder_id)
+        
+        if after is not None:
+            ts, item_id = after
+            query = query.or_(
+                f'associated_at.gt."{ts}",'
+                f'and(associated_at.eq."{ts}",item_id.gt.{item_id})'
+            )
+        
+        result = query.order("associated_at").order("item_id").limit(limit).execute()
+        rows = result.data or []
+        
+        cursor = None
+        if len(rows) == limit:
+            cursor = (rows[-1]["associated_at"], rows[-1]["item_id"])
+        return [row["item_id"] for row in rows], cursor
+    
     def move_item(self, item_id: str, new_folder_id: str) -> bool:
         """Move an item to a different folder."""
-        data = {
-            "folder_id": new_folder_id,
-            "moved_at": datetime.utcnow().isoformat()
-        }
-        
+        self._invalidate(item_id)
+        # moved_at is set by the item_folders trigger
         result = self.client.table(self.table)\
-            .update(data)\
+            .update({"folder_id": new_folder_id})\
             .eq("item_id", item_id)\
             .execute()
         
@@ -355,12 +1206,23 @@ class SupabaseItemFolderRepository:
     
     def remove_item(self, item_id: str) -> bool:
         """Remove an item from its folder."""
+        self._invalidate(item_id)
         result = self.client.table(self.table)\
             .delete()\
             .eq("item_id", item_id)\
             .execute()
         
         return bool(result.data)
+    
+    def clear_cache(self) -> None:
+        """Drop all cached item lookups."""
+        self._folder_cache.clear()
+    
+    def _invalidate(self, item_id: str, item_uuid: Optional[str] = None) -> None:
+        """Drop the cached folder for an item under its raw and UUID forms."""
+        self._folder_cache.pop(item_id)
+        if item_uuid and item_uuid != item_id:
+            self._folder_cache.pop(item_uuid)
 
 
 class SupabaseEmbeddingRepository:
@@ -376,6 +1238,22 @@ class SupabaseEmbeddingRepository:
     def __init__(self, client: Optional["Client"] = None):
         self.client = client or get_supabase_client()
         self.table = "embeddings"
+        self._use_direct_pg = direct_pg_available()
+        self._use_direct_search = direct_search_available()
+        self.quantize = get_config().database.quantize_stored_embeddings
+    
+    def _pack(
+        self,
+        embedding: List[float],
+        metadata: Optional[Dict[str, Any]]
+    ) -> Tuple[List[float], Dict[str, Any]]:
+        """Quantize an embedding for transport if enabled, recording its scale in metadata."""
+        metadata = metadata or {}
+        if not self.quantize:
+            return embedding, metadata
+        
+        values, scale = quantize_int8(embedding)
+        return values.tolist(), {**metadata, "q_scale": float(scale)}
     
     def store_embedding(
         self,
@@ -386,14 +1264,14 @@ class SupabaseEmbeddingRepository:
     ) -> str:
         """Store an embedding in Supabase with pgvector."""
         embedding_id = str(uuid.uuid4())
+        embedding, metadata = self._pack(embedding, metadata)
         
         data = {
             "embedding_id": embedding_id,
             "entity_id": entity_id,
             "entity_type": entity_type,
             "embedding": embedding,  # pgvector handles the vector type
-            "metadata": metadata or {},
-            "created_at": datetime.utcnow().isoformat()
+            "metadata": metadata
         }
         
         result = self.client.table(self.table).insert(data).execute()
@@ -404,6 +1282,94 @@ class SupabaseEmbeddingRepository:
         else:
             raise Exception(f"Failed to store embedding: {result}")
     
+    def store_embeddings_bulk(
+        self,
+        records: List[Tuple[str, str, List[float], Optional[Dict[str, Any]]]],
+        batch_size: int = 500
+    ) -> List[str]:
+        """
+        Store many embeddings, one insert per chunk.
+        
+        Args:
+            records: (entity_id, entity_type, embedding, metadata) tuples
+            batch_size: Maximum rows per request
+        
+        Returns:
+            Embedding IDs, parallel to records
+        """
+        rows = []
+        for entity_id, entity_type, embedding, metadata in records:
+            embedding, metadata = self._pack(embedding, metadata)
+            rows.append({
+                "embedding_id": str(uuid.uuid4()),
+                "entity_id": entity_id,
+                "entity_type": entity_type,
+                "embedding": embedding,
+                "metadata": metadata
+            })
+        
+        for chunk in _chunked(rows, batch_size):
+            if self._use_direct_pg and _pg_write(self.table, chunk, casts={"embedding": "vector"}):
+                continue
+            result = self.client.table(self.table).insert(chunk).execute()
+            if not result.data:
+                raise Exception(f"Failed to store embeddings: {result}")
+        
+        logger.debug(f"Stored {len(rows)} embeddings")
+        return [row["embedding_id"] for row in rows]
+    
+    def bulk_copy(
+        self,
+        records: Iterable[Tuple[str, str, np.ndarray, Optional[Dict[str, Any]]]]
+    ) -> List[str]:
+        """
+        Load embeddings with COPY ... FROM STDIN for bootstrap-sized loads.
+        
+        Streams rows over one pooled connection, in binary format when
+        pgvector's adapter is installed and text format otherwise. Falls
+        back to store_embeddings_bulk without a direct connection.
+        
+        Args:
+            records: (entity_id, entity_type, embedding, metadata) tuples
+            
+        Returns:
+            Embedding IDs, parallel to records
+        """
+        if not self._use_direct_pg:
+            return self.store_embeddings_bulk(list(records))
+        
+        embedding_ids: List[str] = []
+        with get_pg_pool().connection() as conn:
+            if PGVECTOR_AVAILABLE:
+                register_vector(conn)
+            
+            with conn.cursor() as cur:
+                copy_format = "BINARY" if PGVECTOR_AVAILABLE else "TEXT"
+                with cur.copy(
+                    "COPY embeddings (embedding_id, entity_id, entity_type, embedding, metadata) "
+                    f"FROM STDIN (FORMAT {copy_format})"
+                ) as copy:
+                    if PGVECTOR_AVAILABLE:
+                        copy.set_types(["uuid", "uuid", "varchar", "vector", "jsonb"])
+                    
+                    for entity_id, entity_type, embedding, metadata in records:
+                        embedding, metadata = self._pack(embedding, metadata)
+                        if PGVECTOR_AVAILABLE:
+                            vector = np.asarray(embedding, dtype=np.float32)
+                        else:
+                            # Text COPY takes pgvector's "[x,y,...]" literal
+                            vector = str(np.asarray(embedding, dtype=np.float32).tolist())
+                        
+                        # UUID objects, not strings: the binary uuid dumper needs them
+                        embedding_id = uuid.uuid4()
+                        copy.write_row(
+                            (embedding_id, uuid.UUID(str(entity_id)), entity_type, vector, Jsonb(metadata))
+                        )
+                        embedding_ids.append(str(embedding_id))
+        
+        logger.debug(f"Copied {len(embedding_ids)} embeddings")
+        return embedding_ids
+    
     def get_embedding(
         self, 
         embedding_id: str
@@ -415,10 +1381,45 @@ class SupabaseEmbeddingRepository:
             .execute()
         
         if result.data and len(result.data) > 0:
-            row = result.data[0]
-            return (row.get("embedding", []), row.get("metadata", {}))
+            return self._unpack(result.data[0])
         return None
     
+    def get_embeddings(
+        self,
+        embedding_ids: List[str]
+    ) -> Dict[str, Tuple[List[float], Dict[str, Any]]]:
+        """
+        Get many embeddings and their metadata in one query per chunk.
+        
+        Args:
+            embedding_ids: Embedding IDs to look up
+            
+        Returns:
+            Dictionary of embedding_id -> (embedding, metadata) for the IDs found
+        """
+        found: Dict[str, Tuple[List[float], Dict[str, Any]]] = {}
+        for chunk in _chunked(list(dict.fromkeys(embedding_ids)), IN_FILTER_MAX_IDS):
+            result = self.client.table(self.table)\
+                .select("embedding_id, embedding, metadata")\
+                .in_("embedding_id", chunk)\
+                .execute()
+            for row in result.data or []:
+                found[row["embedding_id"]] = self._unpack(row)
+        return found
+    
+    def _unpack(self, row: Dict[str, Any]) -> Tuple[List[float], Dict[str, Any]]:
+        """Convert an embeddings row to (embedding, metadata), undoing transport quantization."""
+        embedding = row.get("embedding", [])
+        metadata = dict(row.get("metadata") or {})
+        
+        # pgvector returns vectors as "[...]" text
+        scale = metadata.pop("q_scale", None)
+        if scale is not None:
+            if isinstance(embedding, str):
+                embedding = json.loads(embedding)
+            embedding = (np.asarray(embedding, dtype=np.float32) * np.float32(scale)).tolist()
+        return (embedding, metadata)
+    
     def search_similar(
         self,
         query_embedding: List[float],
@@ -430,8 +1431,26 @@ class SupabaseEmbeddingRepository:
         """
         Search for similar embeddings using pgvector.
         
-        Uses the match_embeddings RPC function for vector similarity search.
+        Runs as a prepared statement on a session-mode connection when one is
+        configured, otherwise through the match_embeddings RPC function.
         """
+        if self._use_direct_search:
+            try:
+                with get_pg_session_pool().connection() as conn:
+                    rows = conn.execute(
+                        _match_embeddings_sql(get_config().embeddings.dimension),
+                        {
+                            "q": str(np.asarray(query_embedding, dtype=np.float32).tolist()),
+                            "entity_type": entity_type,
+                            "threshold": threshold,
+                            "limit": limit
+                        },
+                        prepare=True
+                    ).fetchall()
+                return [(entity_id, similarity, metadata or {}) for entity_id, similarity, metadata in rows]
+            except Exception as e:
+                logger.warning(f"Direct vector search failed, falling back to RPC: {e}")
+        
         try:
             # Use RPC for vector similarity search
             result = self.client.rpc(
@@ -459,6 +1478,57 @@ class SupabaseEmbeddingRepository:
             logger.error(f"Vector search failed: {e}")
             return []
     
+    def search_similar_batch(
+        self,
+        queries: np.ndarray,
+        entity_type: str,
+        limit: int = 10,
+        threshold: float = 0.0
+    ) -> List[List[Tuple[str, float, Dict[str, Any]]]]:
+        """
+        Search for similar embeddings for many queries in one RPC call.
+        
+        Uses the match_embeddings_batch RPC function, falling back to one
+        search_similar call per query if it is not installed.
+        
+        Args:
+            queries: (B, D) matrix of query embeddings
+            entity_type: Entity type to search
+            limit: Maximum results per query
+            threshold: Minimum similarity
+            
+        Returns:
+            One result list per query row, in query order
+        """
+        query_lists = np.asarray(queries, dtype=np.float32).tolist()
+        if not query_lists:
+            return []
+        
+        try:
+            result = self.client.rpc(
+                "match_embeddings_batch",
+                {
+                    "query_embeddings": query_lists,
+                    "match_entity_type": entity_type,
+                    "match_threshold": threshold,
+                    "match_count": limit
+                }
+            ).execute()
+        except Exception as e:
+            logger.warning(f"Batch vector search not available, searching per query: {e}")
+            return [
+                self.search_similar(query, entity_type, limit=limit, threshold=threshold)
+                for query in query_lists
+            ]
+        
+        # Rows come back flattened, tagged with the 1-based query ordinal
+        grouped: List[List[Tuple[str, float, Dict[str, Any]]]] = [[] for _ in query_lists]
+        for row in result.data or []:
+            grouped[row["query_index"] - 1].append(
+                (row["entity_id"], row["similarity"], row.get("metadata", {}))
+            )
+        return grouped
+    
     def delete_embedding(self, embedding_id: str) -> bool:
         """Delete an embedding from Supabase."""
         result = self.client.table(self.table)\
@@ -492,11 +1562,7 @@ class SupabaseTaxonomyStatsRepository:
     
     def _ensure_uuid(self, value: str) -> str:
         """Ensure value is a valid UUID, converting if necessary."""
-        try:
-            uuid.UUID(value)
-            return value
-        except (ValueError, AttributeError):
-            return str(uuid.uuid5(uuid.NAMESPACE_OID, value))
+        return _ensure_uuid_cached(str(value))
     
     def record_classification(
         self,
@@ -515,18 +1581,46 @@ class SupabaseTaxonomyStatsRepository:
             "created_folders": output.created_folders,
             "reused_folders": output.reused_folders,
             "tags": output.tags,
-            "processing_time_ms": output.processing_time_ms,
-            "created_at": datetime.utcnow().isoformat()
+            "processing_time_ms": output.processing_time_ms
         }
         
         self.client.table(self.table).insert(data).execute()
     
+    def record_classifications_bulk(
+        self,
+        results: List[Tuple[str, AutoFolderOutput]],
+        batch_size: int = 1000
+    ) -> None:
+        """
+        Record many classification results, one insert per chunk.
+        
+        Args:
+            results: (item_id, output) tuples
+            batch_size: Maximum rows per request
+        """
+        rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "item_id": self._ensure_uuid(item_id),
+                "final_path": output.final_path,
+                "confidence": output.confidence,
+                "created_folders": output.created_folders,
+                "reused_folders": output.reused_folders,
+                "tags": output.tags,
+                "processing_time_ms": output.processing_time_ms
+            }
+            for item_id, output in results
+        ]
+        
+        for chunk in _chunked(rows, batch_size):
+            self.client.table(self.table).insert(chunk).execute()
+    
     def get_folder_stats(self, folder_path: str) -> Dict[str, Any]:
         """Get statistics for a folder path."""
-        # Count classifications that include this path
+        # Count classifications that include this path; head=True returns only the count
         result = self.client.table(self.table)\
-            .select("*", count="exact")\
-            .like("final_path", f"{folder_path}%")\
+            .select("id", count="exact", head=True)\
+            .like("final_path", f"{_escape_like(folder_path)}%")\
             .execute()
         
         return {
@@ -534,10 +1628,43 @@ class SupabaseTaxonomyStatsRepository:
             "path": folder_path
         }
     
+    def get_folder_stats_bulk(self, folder_paths: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get statistics for many folder paths with one aggregate RPC call.
+        
+        Falls back to one get_folder_stats call per path if the
+        folder_stats_bulk RPC is not installed.
+        
+        Args:
+            folder_paths: Folder path prefixes
+            
+        Returns:
+            Dictionary of folder_path -> stats, shaped like get_folder_stats
+        """
+        paths = list(dict.fromkeys(folder_paths))
+        if not paths:
+            return {}
+        
+        try:
+            result = self.client.rpc(
+                "folder_stats_bulk",
+                {"p_prefixes": [_escape_like(path) for path in paths]}
+            ).execute()
+        except Exception as e:
+            logger.warning(f"Bulk stats RPC not available, counting per path: {e}")
+            return {path: self.get_folder_stats(path) for path in paths}
+        
+        # Rows are tagged with the 1-based position of their prefix
+        counts = {row["idx"]: row["cnt"] for row in result.data or []}
+        return {
+            path: {"classification_count": counts.get(idx, 0), "path": path}
+            for idx, path in enumerate(paths, start=1)
+        }
+    
     def get_classification_history(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent classification history."""
         result = self.client.table(self.table)\
-            .select("*")\
+            .select(_CLASSIFICATION_COLS)\
             .order("created_at", desc=True)\
             .limit(limit)\
             .execute()
@@ -545,15 +1672,114 @@ class SupabaseTaxonomyStatsRepository:
         return result.data if result.data else []
 
 
+# ============================================
+# Async Supabase Repository
+# ============================================
+
+class AsyncSupabaseFolderRepository:
+    """
+    Async read-side counterpart of SupabaseFolderRepository.
+    
+    Independent lookups run concurrently over supabase's async HTTP client,
+    bounded by a semaphore sized to the database pool, so N lookups cost
+    about one round-trip instead of N.
+    
+    Table: folders
+    """
+    
+    # Row conversion is shared with the sync repository
+    _to_entity = SupabaseFolderRepository._to_entity
+    _to_entities = SupabaseFolderRepository._to_entities
+    
+    def __init__(self, client: Optional["AsyncClient"] = None, max_concurrency: int = PG_POOL_MAX_SIZE):
+        self._client = client
+        self.table = "folders"
+        self._max_concurrency = max_concurrency
+    
+    async def _get_client(self) -> "AsyncClient":
+        """Get the async Supabase client, creating it on first use."""
+        if self._client is None:
+            if not SUPABASE_AVAILABLE:
+                raise ImportError("supabase-py not installed. Run: pip install supabase")
+            
+            from supabase import acreate_client
+            
+            config = get_config()
+            self._client = await acreate_client(
+                config.database.supabase_url,
+                config.database.supabase_key
+            )
+        return self._client
+    
+    async def get_folder_by_id(self, folder_id: str) -> Optional[FolderEntity]:
+        """Get folder by ID from Supabase."""
+        client = await self._get_client()
+        result = await client.table(self.table)\
+            .select(_FOLDER_COLS)\
+            .eq("folder_id", folder_id)\
+            .execute()
+        
+        if result.data:
+            return self._to_entity(result.data[0])
+        return None
+    
+    async def _select_in(self, column: str, values: List[str]) -> List[Dict[str, Any]]:
+        """Fetch rows whose column is in values, one in_() query per chunk, chunks run concurrently."""
+        client = await self._get_client()
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        
+        async def fetch(chunk: List[str]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                result = await client.table(self.table)\
+                    .select(_FOLDER_COLS)\
+                    .in_(column, chunk)\
+                    .execute()
+            return result.data or []
+        
+        unique_values = list(dict.fromkeys(values))
+        pages = await asyncio.gather(*[fetch(chunk) for chunk in _chunked(unique_values, IN_FILTER_MAX_IDS)])
+        return [row for rows in pages for row in rows]
+    
+    async def get_folders_by_ids(self, folder_ids: List[str]) -> Dict[str, FolderEntity]:
+        """
+        Get many folders by ID.
+        
+        Args:
+            folder_ids: Folder IDs to look up
+            
+        Returns:
+            Dictionary of folder_id -> FolderEntity for the folders found
+        """
+        folders = self._to_entities(await self._select_in("folder_id", folder_ids))
+        return {folder.folder_id: folder for folder in folders}
+    
+    async def get_children_of(self, parent_ids: List[str]) -> Dict[str, List[FolderEntity]]:
+        """
+        Get the children of many parents.
+        
+        Args:
+            parent_ids: Parent folder IDs
+            
+        Returns:
+            Dictionary of parent_id -> child folders (empty list if none)
+        """
+        children: Dict[str, List[FolderEntity]] = {parent_id: [] for parent_id in parent_ids}
+        for row in await self._select_in("parent_id", parent_ids):
+            children[row["parent_id"]].append(self._to_entity(row))
+        return children
+
+
 # ============================================
 # SQL Migrations for Supabase
 # ============================================
 
+# Template: get_migration_sql() fills {dim} with the configured embedding dimension
 SUPABASE_MIGRATIONS = """
 -- ===========================================
 -- Supabase Migration for Auto-Folder System
 -- ===========================================
--- Run this in your Supabase SQL Editor
+-- Run this in your Supabase SQL Editor. Every statement is idempotent, so
+-- re-running it upgrades an existing deployment in place.
 
 -- 1. Enable pgvector extension
 CREATE EXTENSION IF NOT EXISTS vector;
@@ -586,7 +1812,7 @@ CREATE TABLE IF NOT EXISTS embeddings (
     embedding_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     entity_id UUID NOT NULL,
     entity_type VARCHAR(50) NOT NULL,  -- 'folder' or 'item'
-    embedding vector(768),  -- Gemini text-embedding-004 dimension
+    embedding vector({dim}),  -- config.embeddings.dimension
     metadata JSONB DEFAULT '{}',
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
@@ -595,10 +1821,13 @@ CREATE TABLE IF NOT EXISTS embeddings (
 CREATE INDEX IF NOT EXISTS idx_embeddings_entity 
     ON embeddings(entity_id, entity_type);
 
--- Vector similarity index (IVFFlat for approximate nearest neighbor)
-CREATE INDEX IF NOT EXISTS idx_embeddings_vector 
-    ON embeddings USING ivfflat (embedding vector_cosine_ops) 
-    WITH (lists = 100);
+-- Vector similarity index (HNSW over a half-precision expression, pgvector >= 0.7).
+-- Stored rows stay vector({dim}); the index holds FP16 copies at half the memory,
+-- and queries must order by the same halfvec expression to use it.
+DROP INDEX IF EXISTS idx_embeddings_vector;
+CREATE INDEX IF NOT EXISTS idx_embeddings_hnsw
+    ON embeddings USING hnsw ((embedding::halfvec({dim})) halfvec_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
 
 -- 4. Create item_folders association table
 CREATE TABLE IF NOT EXISTS item_folders (
@@ -609,8 +1838,14 @@ CREATE TABLE IF NOT EXISTS item_folders (
     moved_at TIMESTAMP WITH TIME ZONE
 );
 
+-- Tables created before moved_at existed
+ALTER TABLE item_folders ADD COLUMN IF NOT EXISTS moved_at TIMESTAMP WITH TIME ZONE;
+
 -- Index for item_folders
 CREATE INDEX IF NOT EXISTS idx_item_folders_folder ON item_folders(folder_id);
+-- Keyset pagination order for get_items_in_folder_after
+CREATE INDEX IF NOT EXISTS idx_item_folders_folder_page
+    ON item_folders(folder_id, associated_at, item_id);
 
 -- 5. Create taxonomy_stats table
 CREATE TABLE IF NOT EXISTS taxonomy_stats (
@@ -627,6 +1862,8 @@ CREATE TABLE IF NOT EXISTS taxonomy_stats (
 
 -- Index for taxonomy_stats
 CREATE INDEX IF NOT EXISTS idx_taxonomy_stats_path ON taxonomy_stats(final_path);
+-- text_pattern_ops lets LIKE 'prefix%' use an index scan under any collation
+CREATE INDEX IF NOT EXISTS idx_taxonomy_stats_path_prefix ON taxonomy_stats(final_path text_pattern_ops);
 CREATE INDEX IF NOT EXISTS idx_taxonomy_stats_created ON taxonomy_stats(created_at DESC);
 
 -- 6. Create RPC function for atomic item count increment
@@ -640,9 +1877,21 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Batch variant: p_counts maps folder_id -> delta, applied in one UPDATE
+CREATE OR REPLACE FUNCTION increment_folder_item_counts(p_counts JSONB)
+RETURNS void AS $$
+BEGIN
+    UPDATE folders f
+    SET item_count = f.item_count + e.value::INTEGER,
+        updated_at = NOW()
+    FROM jsonb_each_text(p_counts) e
+    WHERE f.folder_id::TEXT = e.key;
+END;
+$$ LANGUAGE plpgsql;
+
 -- 7. Create RPC function for vector similarity search
 CREATE OR REPLACE FUNCTION match_embeddings(
-    query_embedding vector(768),
+    query_embedding vector({dim}),
     match_entity_type VARCHAR(50),
     match_threshold FLOAT DEFAULT 0.0,
     match_count INT DEFAULT 10
@@ -654,20 +1903,84 @@ RETURNS TABLE (
     metadata JSONB
 ) AS $$
 BEGIN
+    -- Transaction-local, so it is safe behind the transaction pooler
+    PERFORM set_config('hnsw.ef_search', '40', true);
     RETURN QUERY
     SELECT 
         e.entity_id,
         e.entity_type,
-        1 - (e.embedding <=> query_embedding) AS similarity,
+        1 - (e.embedding::halfvec({dim}) <=> query_embedding::halfvec({dim})) AS similarity,
         e.metadata
     FROM embeddings e
     WHERE e.entity_type = match_entity_type
-        AND 1 - (e.embedding <=> query_embedding) >= match_threshold
-    ORDER BY e.embedding <=> query_embedding
+        AND 1 - (e.embedding::halfvec({dim}) <=> query_embedding::halfvec({dim})) >= match_threshold
+    ORDER BY e.embedding::halfvec({dim}) <=> query_embedding::halfvec({dim})
     LIMIT match_count;
 END;
 $$ LANGUAGE plpgsql;
 
+-- Batch variant: query_embeddings is a JSON array of vectors, results are
+-- tagged with the 1-based position of their query
+CREATE OR REPLACE FUNCTION match_embeddings_batch(
+    query_embeddings JSONB,
+    match_entity_type VARCHAR(50),
+    match_threshold FLOAT DEFAULT 0.0,
+    match_count INT DEFAULT 10
+)
+RETURNS TABLE (
+    query_index BIGINT,
+    entity_id UUID,
+    entity_type VARCHAR(50),
+    similarity FLOAT,
+    metadata JSONB
+) AS $$
+BEGIN
+    PERFORM set_config('hnsw.ef_search', '40', true);
+    RETURN QUERY
+    SELECT
+        q.idx,
+        m.entity_id,
+        m.entity_type,
+        m.similarity,
+        m.metadata
+    FROM jsonb_array_elements(query_embeddings) WITH ORDINALITY AS q(vec, idx)
+    CROSS JOIN LATERAL (
+        SELECT
+            e.entity_id,
+            e.entity_type,
+            1 - (e.embedding::halfvec({dim}) <=> q.vec::TEXT::halfvec({dim})) AS similarity,
+            e.metadata
+        FROM embeddings e
+        WHERE e.entity_type = match_entity_type
+            AND 1 - (e.embedding::halfvec({dim}) <=> q.vec::TEXT::halfvec({dim})) >= match_threshold
+        ORDER BY e.embedding::halfvec({dim}) <=> q.vec::TEXT::halfvec({dim})
+        LIMIT match_count
+    ) m
+    ORDER BY q.idx, m.similarity DESC;
+END;
+$$ LANGUAGE plpgsql;
+
+-- RPC function counting classifications under many path prefixes in one call;
+-- prefixes arrive with LIKE wildcards already escaped
+CREATE OR REPLACE FUNCTION folder_stats_bulk(p_prefixes TEXT[])
+RETURNS TABLE (idx BIGINT, cnt BIGINT) AS $$
+    SELECT p.idx, (
+        SELECT COUNT(*) FROM taxonomy_stats s WHERE s.final_path LIKE p.prefix || '%'
+    )
+    FROM unnest(p_prefixes) WITH ORDINALITY AS p(prefix, idx);
+$$ LANGUAGE sql STABLE;
+
+-- RPC function returning a folder and all its descendants
+CREATE OR REPLACE FUNCTION get_folder_subtree(p_root UUID)
+RETURNS SETOF folders AS $$
+    WITH RECURSIVE subtree AS (
+        SELECT * FROM folders WHERE folder_id = p_root
+        UNION ALL
+        SELECT f.* FROM folders f JOIN subtree t ON f.parent_id = t.folder_id
+    )
+    SELECT * FROM subtree;
+$$ LANGUAGE sql STABLE;
+
 -- 8. Row Level Security (RLS) - Optional but recommended
 -- Enable RLS
 ALTER TABLE folders ENABLE ROW LEVEL SECURITY;
@@ -676,11 +1989,13 @@ ALTER TABLE taxonomy_stats ENABLE ROW LEVEL SECURITY;
 
 -- Create policies for authenticated users (adjust as needed)
 -- For seed folders (no user_id), allow read access to all
+DROP POLICY IF EXISTS "Seed folders are viewable by everyone" ON folders;
 CREATE POLICY "Seed folders are viewable by everyone"
     ON folders FOR SELECT
     USING (is_seed = true OR user_id IS NULL);
 
 -- For user folders, only the owner can access
+DROP POLICY IF EXISTS "Users can manage their own folders" ON folders;
 CREATE POLICY "Users can manage their own folders"
     ON folders FOR ALL
     USING (auth.uid() = user_id);
@@ -697,20 +2012,55 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+DROP TRIGGER IF EXISTS update_folders_updated_at ON folders;
 CREATE TRIGGER update_folders_updated_at
     BEFORE UPDATE ON folders
     FOR EACH ROW
     EXECUTE FUNCTION update_updated_at_column();
 
+-- 10. Moved_at trigger
+CREATE OR REPLACE FUNCTION update_moved_at_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.folder_id IS DISTINCT FROM OLD.folder_id THEN
+        NEW.moved_at = NOW();
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS update_item_folders_moved_at ON item_folders;
+CREATE TRIGGER update_item_folders_moved_at
+    BEFORE UPDATE OF folder_id ON item_folders
+    FOR EACH ROW
+    EXECUTE FUNCTION update_moved_at_column();
+
 -- ===========================================
 -- Migration complete!
 -- ===========================================
 """
 
 
+@lru_cache(maxsize=None)
+def _migration_sql(dimension: int) -> str:
+    """Fill the embedding dimension into the migration script."""
+    return SUPABASE_MIGRATIONS.replace("{dim}", str(int(dimension)))
+
+
+# Encoded once per dimension so drivers can take the script without re-encoding it per call
+@lru_cache(maxsize=None)
+def _migration_sql_bytes(dimension: int) -> bytes:
+    return _migration_sql(dimension).encode()
+
+
 def get_migration_sql() -> str:
-    """Get the SQL migration script for Supabase setup."""
-    return SUPABASE_MIGRATIONS
+    """Get the SQL migration script for Supabase setup, sized to config.embeddings.dimension."""
+    return _migration_sql(get_config().embeddings.dimension)
+
+
+def get_migration_sql_bytes() -> bytes:
+    """Get the SQL migration script pre-encoded as UTF-8, e.g. for cursor.execute."""
+    return _migration_sql_bytes(get_config().embeddings.dimension)
 
 
 def check_supabase_availability() -> Dict[str, Any]:
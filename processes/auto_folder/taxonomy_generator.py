@@ -8,10 +8,20 @@ Uses Google Gemini LLM to:
 - Provide confidence scores and rationale
 """
 
+import hashlib
 import logging
 import json
 import re
-from typing import Optional, Dict, Any, List
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
+
+import numpy as np
 
 from .config import (
     get_config, 
@@ -25,6 +35,8 @@ from .models import (
     TaxonomyCandidate,
     LabelWithAliases
 )
+from .embedding_service import get_embedding_service
+from .folder_index import FolderEmbeddingIndex, normalize_embedding
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -37,69 +49,176 @@ except ImportError:
     GEMINI_AVAILABLE = False
     logger.warning("google-generativeai not installed")
 
+# Try to import orjson for fast response parsing (its errors subclass json.JSONDecodeError)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
 
-class TaxonomyGenerator:
+# Try to import pyahocorasick for single-pass fallback keyword matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Structured-output schema for the taxonomy response, so Gemini returns bare,
+# well-formed JSON in the expected shape
+_LABEL_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "label": {"type": "STRING"},
+        "aliases": {"type": "ARRAY", "items": {"type": "STRING"}},
+    },
+    "required": ["label"],
+}
+_RESPONSE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "domain": _LABEL_SCHEMA,
+        "subdomain": _LABEL_SCHEMA,
+        "leaf_topic": {
+            "type": "OBJECT",
+            "nullable": True,
+            "properties": {
+                **_LABEL_SCHEMA["properties"],
+                "optional": {"type": "BOOLEAN"},
+            },
+            "required": ["label"],
+        },
+        "tags": {"type": "ARRAY", "items": {"type": "STRING"}},
+        "confidence": {"type": "NUMBER"},
+        "rationale": {"type": "STRING"},
+    },
+    "required": ["domain", "subdomain", "tags", "confidence", "rationale"],
+}
+
+# Punctuation stripped from labels (everything except & and -). ASCII labels use a
+# translate table; the regex covers Unicode word and punctuation characters.
+_LABEL_PUNCT_RE = re.compile(r'[^\w\s&-]')
+_LABEL_PUNCT_TABLE = {
+    c: None for c in range(128)
+    if not (chr(c).isalnum() or chr(c).isspace() or chr(c) in '_&-')
+}
+
+# Body of a ```/```json fenced block around the response
+_CODE_FENCE_RE = re.compile(r'^```[^\n]*\n(.*?)(?:\n\s*```|$)', re.DOTALL)
+
+
+# ============================================
+# Static Prompt
+# ============================================
+
+@lru_cache(maxsize=None)
+def _build_seed_domains_reference() -> str:
+    """Build a reference string of seed domains for the prompt."""
+    lines = ["Available top-level domains (prefer these when appropriate):"]
+    for domain in SEED_DOMAINS:
+        subdomains = [s["label"] for s in domain.get("subdomains", [])]
+        lines.append(f"- {domain['label']}: {', '.join(subdomains[:5])}...")
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def _get_alias_automaton():
     """
-    Generates canonical taxonomy labels from raw topic and summary.
-    Uses Gemini LLM for intelligent categorization.
+    Build an Aho-Corasick automaton over every seed domain and subdomain alias.
+    
+    Each alias maps to its (domain index, subdomain index) owners, with -1 as
+    the subdomain index for domain-level aliases.
     """
+    owners: Dict[str, List[Tuple[int, int]]] = {}
+    for d, domain in enumerate(SEED_DOMAINS):
+        for alias in domain.get("aliases", []):
+            owners.setdefault(alias, []).append((d, -1))
+        for s, subdomain in enumerate(domain.get("subdomains", [])):
+            for alias in subdomain.get("aliases", []):
+                owners.setdefault(alias, []).append((d, s))
     
-    def __init__(self, config: Optional[TaxonomyConfig] = None):
-        """Initialize the taxonomy generator."""
-        self.config = config or get_config().taxonomy
-        self._configured = False
-        self._model = None
+    automaton = ahocorasick.Automaton()
+    for alias, alias_owners in owners.items():
+        if alias:
+            automaton.add_word(alias, alias_owners)
+    automaton.make_automaton()
+    return automaton
+
+
+def _count_alias_hits(text: str) -> Dict[Tuple[int, int], int]:
+    """
+    Count, per (domain, subdomain) owner, the seed aliases occurring in text.
     
-    def _configure(self) -> None:
-        """Configure Gemini API."""
-        if self._configured:
-            return
-        
-        if not GEMINI_AVAILABLE:
-            raise ImportError("google-generativeai package not installed")
-        
-        api_key = get_config().gemini_api_key
-        if not api_key:
-            raise ValueError("GEMINI_API_KEY not set in environment")
-        
-        genai.configure(api_key=api_key)
-        self._model = genai.GenerativeModel(self.config.model_name)
-        self._configured = True
-        logger.info("Taxonomy generator configured")
+    Each distinct alias counts once however often it occurs, matching a
+    per-alias substring test, but the text is scanned only once.
+    """
+    hits: Dict[Tuple[int, int], int] = {}
+    seen = set()
+    for _, alias_owners in _get_alias_automaton().iter(text):
+        if id(alias_owners) in seen:
+            continue
+        seen.add(id(alias_owners))
+        for owner in alias_owners:
+            hits[owner] = hits.get(owner, 0) + 1
+    return hits
+
+
+class _JsonObjectScanner:
+    """
+    Incrementally track brace depth over streamed text to detect when the
+    first top-level JSON object is complete. Braces inside strings are ignored.
+    """
     
-    def _build_seed_domains_reference(self) -> str:
-        """Build a reference string of seed domains for the prompt."""
-        lines = ["Available top-level domains (prefer these when appropriate):"]
-        for domain in SEED_DOMAINS:
-            subdomains = [s["label"] for s in domain.get("subdomains", [])]
-            lines.append(f"- {domain['label']}: {', '.join(subdomains[:5])}...")
-        return "\n".join(lines)
+    __slots__ = ('depth', 'in_string', 'escaped', 'started')
     
-    def _build_prompt(self, item: ItemInput) -> str:
-        """Build the LLM prompt for taxonomy generation."""
-        
-        seed_reference = self._build_seed_domains_reference()
-        
-        prompt = f"""You are a taxonomy classifier for a personal knowledge management app called Stash.
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.started = False
+    
+    def feed(self, text: str) -> int:
+        """Consume a chunk; return the offset just past the closing brace once the top-level object has closed, else -1."""
+        for i, ch in enumerate(text):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == '\\':
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch == '{':
+                self.depth += 1
+                self.started = True
+            elif ch == '}' and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return i + 1
+        return -1
+
+
+def _extract_braced(text: str) -> Optional[str]:
+    """Get the first balanced {...} object in text in one linear scan, or None."""
+    start = text.find('{')
+    if start < 0:
+        return None
+    end = _JsonObjectScanner().feed(text[start:])
+    return text[start:start + end] if end > 0 else None
+
+
+# Item-independent part of the prompt (instructions, rules, examples), built once
+_STATIC_PROMPT = f"""You are a taxonomy classifier for a personal knowledge management app called Stash.
 
 Given content with a raw topic and summary, generate a hierarchical folder classification.
 
-{seed_reference}
-
-## Content to Classify
-
-**Raw Topic:** {item.raw_topic}
-
-**Summary:**
-{item.summary[:2000]}
-
-{f"**Source:** {item.source_app}" if item.source_app else ""}
-{f"**User Note:** {item.user_note}" if item.user_note else ""}
-{f"**Keywords:** {', '.join(item.keywords)}" if item.keywords else ""}
+{_build_seed_domains_reference()}
 
 ## Your Task
 
-Analyze this content and return a JSON object with the following structure:
+Analyze the content given after these instructions and return a JSON object with the following structure:
 
 ```json
 {{
@@ -167,17 +286,241 @@ Output: domain="Shopping & Gifts", subdomain="Gift Ideas", leaf=null, tags=["bir
 
 Return ONLY valid JSON, no additional text or markdown formatting."""
 
-        return prompt
+
+class TaxonomyGenerator:
+    """
+    Generates canonical taxonomy labels from raw topic and summary.
+    Uses Gemini LLM for intelligent categorization.
+    """
+    
+    def __init__(self, config: Optional[TaxonomyConfig] = None):
+        """Initialize the taxonomy generator."""
+        self.config = config or get_config().taxonomy
+        self._configured = False
+        self._model = None
+        self._generation_config = None
+        self._cached_model = None
+        self._cache_expires_at = 0.0
+        self._cache_lock = threading.Lock()
+        
+        # Exact-match LLM response cache, keyed on a hash of the per-item prompt
+        self._responses: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._responses_lock = threading.Lock()
+        self._responses_dirty = False
+        self._responses_file: Optional[Path] = None
+        
+        # Near-duplicate lookup: embeddings of cached items, ids index _semantic_keys,
+        # which holds (response key, the item's own raw_topic tag)
+        self._semantic_index = FolderEmbeddingIndex()
+        self._semantic_keys: List[Tuple[str, str]] = []
+        
+        config_obj = get_config()
+        if config_obj.output_dir:
+            self._responses_file = config_obj.output_dir / "taxonomy_cache.json"
+            self._load_responses()
+    
+    def _configure(self) -> None:
+        """Configure Gemini API."""
+        if self._configured:
+            return
+        
+        if not GEMINI_AVAILABLE:
+            raise ImportError("google-generativeai package not installed")
+        
+        api_key = get_config().gemini_api_key
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY not set in environment")
+        
+        genai.configure(api_key=api_key)
+        self._model = genai.GenerativeModel(self.config.model_name)
+        try:
+            self._generation_config = genai.GenerationConfig(
+                temperature=self.config.temperature,
+                response_mime_type="application/json",
+                response_schema=_RESPONSE_SCHEMA
+            )
+        except TypeError:
+            # SDK predates structured output; responses still go through the tolerant parser
+            self._generation_config = genai.GenerationConfig(
+                temperature=self.config.temperature,
+                response_mime_type="application/json"
+            )
+        self._configured = True
+        logger.info("Taxonomy generator configured")
+    
+    def _get_cached_model(self):
+        """
+        Get a model bound to a Gemini context cache of the static prompt prefix.
+        
+        The cache is recreated shortly before its TTL runs out. Returns None
+        (and the caller sends the full prompt) unless prompt_cache_enabled is
+        set, and for good once creating the cache fails, e.g. for models
+        without context caching or a prefix below the provider's minimum
+        cacheable size.
+        """
+        if not self.config.prompt_cache_enabled:
+            return None
+        now = time.monotonic()
+        if now < self._cache_expires_at:
+            return self._cached_model
+        
+        with self._cache_lock:
+            # Another batch worker may have refreshed the cache meanwhile
+            if time.monotonic() < self._cache_expires_at:
+                return self._cached_model
+            return self._refresh_cached_model(now)
+    
+    def _refresh_cached_model(self, now: float):
+        """Create the context cache and its bound model (caller holds the lock)."""
+        ttl = timedelta(minutes=self.config.prompt_cache_ttl_minutes)
+        try:
+            from google.generativeai import caching
+            
+            cache = caching.CachedContent.create(
+                model=self.config.model_name,
+                contents=[_STATIC_PROMPT],
+                ttl=ttl
+            )
+            self._cached_model = genai.GenerativeModel.from_cached_content(cached_content=cache)
+            logger.info("Static taxonomy prompt cached")
+        except Exception as e:
+            # A rejected prefix stays rejected; don't retry for the life of the process
+            logger.warning(f"Prompt caching unavailable, sending full prompt: {e}")
+            self._cached_model = None
+            self._cache_expires_at = float("inf")
+            return None
+        
+        # Refresh a minute early
+        self._cache_expires_at = now + max(ttl.total_seconds() - 60, 60)
+        return self._cached_model
+    
+    def _get_response_key(self, prompt_suffix: str) -> str:
+        """Generate the response cache key for a per-item prompt block."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.config.model_name.encode())
+        digest.update(b"\x00")
+        digest.update(prompt_suffix.encode())
+        return digest.hexdigest()
+    
+    def _load_responses(self) -> None:
+        """Load cached LLM responses from disk."""
+        if self._responses_file and self._responses_file.exists():
+            try:
+                with open(self._responses_file, 'r') as f:
+                    self._responses = OrderedDict(json.load(f))
+                logger.info(f"Loaded {len(self._responses)} cached taxonomy responses")
+            except Exception as e:
+                logger.warning(f"Failed to load taxonomy cache: {e}")
+                self._responses = OrderedDict()
+    
+    def _save_responses(self) -> None:
+        """Save cached LLM responses to disk if any were added."""
+        if not self._responses_file or not self._responses_dirty:
+            return
+        with self._responses_lock:
+            snapshot = dict(self._responses)
+            self._responses_dirty = False
+        try:
+            self._responses_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._responses_file, 'w') as f:
+                json.dump(snapshot, f)
+        except Exception as e:
+            logger.warning(f"Failed to save taxonomy cache: {e}")
+    
+    def _get_cached_response(self, key: str) -> Optional[TaxonomyCandidate]:
+        """Get a fresh candidate for a cached response, or None."""
+        with self._responses_lock:
+            data = self._responses.get(key)
+            if data is None:
+                return None
+            self._responses.move_to_end(key)
+        return TaxonomyCandidate.from_dict(data)
+    
+    def _put_cached_response(self, key: str, candidate: TaxonomyCandidate) -> None:
+        """Cache a validated candidate, evicting the least recently used beyond the limit."""
+        with self._responses_lock:
+            self._responses[key] = candidate.to_dict()
+            self._responses.move_to_end(key)
+            while len(self._responses) > self.config.response_cache_size:
+                self._responses.popitem(last=False)
+            self._responses_dirty = True
+    
+    def _embed_for_semantic_cache(self, item: ItemInput) -> Optional[np.ndarray]:
+        """Get the normalized embedding used for near-duplicate lookup, or None if disabled or unavailable."""
+        if self.config.semantic_cache_threshold is None:
+            return None
+        text = f"{item.raw_topic} {item.summary[:500]}".strip()
+        if not text:
+            return None
+        try:
+            vec = normalize_embedding(get_embedding_service().generate_embedding(text))
+        except Exception as e:
+            logger.debug(f"Semantic cache lookup skipped: {e}")
+            return None
+        return vec if vec.any() else None
+    
+    def _get_similar_response(self, query: np.ndarray) -> Optional[TaxonomyCandidate]:
+        """
+        Get the cached candidate of the most similar previously classified item, or None.
+        
+        The tag taken from that item's raw_topic is removed, since it describes
+        the other item rather than this one.
+        """
+        with self._responses_lock:
+            ids, _ = self._semantic_index.search(query, self.config.semantic_cache_threshold, 1)
+            if not len(ids):
+                return None
+            key, source_tag = self._semantic_keys[ids[0]]
+        cached = self._get_cached_response(key)
+        if cached is not None and source_tag:
+            cached.tags = [tag for tag in cached.tags if tag != source_tag]
+        return cached
+    
+    def _add_similar_response(self, key: str, query: np.ndarray, item: ItemInput) -> None:
+        """Index a cached response under its item embedding."""
+        source_tag = item.raw_topic.lower().strip() if item.raw_topic else ""
+        with self._responses_lock:
+            self._semantic_index.add(len(self._semantic_keys), query)
+            self._semantic_keys.append((key, source_tag))
+    
+    def clear_cache(self) -> None:
+        """Clear the LLM response cache, in memory and on disk."""
+        with self._responses_lock:
+            self._responses = OrderedDict()
+            self._responses_dirty = False
+            self._semantic_index = FolderEmbeddingIndex()
+            self._semantic_keys = []
+        if self._responses_file and self._responses_file.exists():
+            self._responses_file.unlink()
+    
+    def _build_content_block(self, item: ItemInput) -> str:
+        """Build the per-item part of the prompt."""
+        return f"""## Content to Classify
+
+**Raw Topic:** {item.raw_topic}
+
+**Summary:**
+{item.prompt_summary}
+
+{f"**Source:** {item.source_app}" if item.source_app else ""}
+{f"**User Note:** {item.user_note}" if item.user_note else ""}
+{f"**Keywords:** {', '.join(item.keywords)}" if item.keywords else ""}"""
+    
+    def _build_prompt(self, item: ItemInput) -> str:
+        """
+        Build the full LLM prompt for taxonomy generation.
+        
+        Static instructions come first and the item content last, so every
+        request shares the same long prefix for provider-side prompt caching.
+        """
+        return _STATIC_PROMPT + "\n\n" + self._build_content_block(item)
     
     def _clean_label(self, label: str, max_words: int = 4) -> str:
         """Clean and normalize a label."""
         if not label:
             return ""
         
-        # Remove extra whitespace
-        label = ' '.join(label.split())
-        
-        # Remove forbidden words
+        # Split on any whitespace run, then remove forbidden words
         words = label.split()
         cleaned_words = [
             w for w in words 
@@ -197,47 +540,61 @@ Return ONLY valid JSON, no additional text or markdown formatting."""
         label = label.title()
         
         # Remove any remaining punctuation except & and -
-        label = re.sub(r'[^\w\s&-]', '', label)
+        if label.isascii():
+            label = label.translate(_LABEL_PUNCT_TABLE)
+        else:
+            label = _LABEL_PUNCT_RE.sub('', label)
         
         return label.strip()
     
     def _parse_llm_response(self, response_text: str) -> Dict[str, Any]:
         """Parse the LLM response JSON."""
+        # Schema-constrained responses are bare JSON and parse directly
+        try:
+            return _json_loads(response_text)
+        except ValueError:
+            pass
+        
         # Try to extract JSON from response
         response_text = response_text.strip()
         
         # Remove markdown code blocks if present
         if response_text.startswith("```"):
-            # Find the actual JSON content
-            lines = response_text.split('\n')
-            json_lines = []
-            in_json = False
-            for line in lines:
-                if line.strip().startswith("```") and not in_json:
-                    in_json = True
-                    continue
-                elif line.strip() == "```":
-                    break
-                elif in_json:
-                    json_lines.append(line)
-            response_text = '\n'.join(json_lines)
+            match = _CODE_FENCE_RE.match(response_text)
+            response_text = match.group(1) if match else ""
         
         try:
-            return json.loads(response_text)
+            return _json_loads(response_text)
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse JSON response: {e}")
             logger.debug(f"Response text: {response_text[:500]}")
             
             # Try to find JSON object in response
-            match = re.search(r'\{[\s\S]*\}', response_text)
-            if match:
+            braced = _extract_braced(response_text)
+            if braced:
                 try:
-                    return json.loads(match.group())
-                except:
+                    return _json_loads(braced)
+                except ValueError:
                     pass
             
             raise ValueError(f"Could not parse LLM response as JSON: {response_text[:200]}")
     
+    def _read_streamed_response(self, response) -> str:
+        """
+        Collect a streamed LLM response, stopping as soon as the top-level
+        JSON object closes instead of waiting for the stream to finish.
+        """
+        scanner = _JsonObjectScanner()
+        chunks = []
+        for chunk in response:
+            text = chunk.text
+            end = scanner.feed(text)
+            if end >= 0:
+                chunks.append(text[:end])
+                break
+            chunks.append(text)
+        return "".join(chunks)
+    
     def _validate_and_build_candidate(
         self, 
         parsed: Dict[str, Any],
@@ -256,8 +613,8 @@ Return ONLY valid JSON, no additional text or markdown formatting."""
         )
         
         # Check if domain maps to existing via alias
-        if domain_label.lower() in ALIAS_MAP:
-            canonical = ALIAS_MAP[domain_label.lower()]
+        canonical = ALIAS_MAP.get(domain_label.casefold())
+        if canonical is not None:
             if "/" not in canonical:  # It's a domain alias
                 domain_label = canonical
         
@@ -305,9 +662,15 @@ Return ONLY valid JSON, no additional text or markdown formatting."""
         if not isinstance(tags, list):
             tags = []
         
-        # Clean tags
-        tags = [t.lower().strip() for t in tags if isinstance(t, str)]
-        tags = [t for t in tags if t and t.lower() not in FORBIDDEN_LABEL_WORDS]
+        # Clean tags (normalize and filter in one pass)
+        cleaned_tags = []
+        for t in tags:
+            if not isinstance(t, str):
+                continue
+            t = t.strip().lower()
+            if t and t not in FORBIDDEN_LABEL_WORDS:
+                cleaned_tags.append(t)
+        tags = cleaned_tags
         
         # Add raw topic as tag if not already present
         if item.raw_topic:
@@ -345,6 +708,12 @@ Return ONLY valid JSON, no additional text or markdown formatting."""
         Returns:
             TaxonomyCandidate with domain/subdomain/leaf/tags
         """
+        candidate = self._generate(item)
+        self._save_responses()
+        return candidate
+    
+    def _generate(self, item: ItemInput) -> TaxonomyCandidate:
+        """Generate a taxonomy candidate without persisting the response cache."""
         # Check for empty input
         if not item.raw_topic and not item.summary:
             logger.warning("Empty input - using default taxonomy")
@@ -357,10 +726,10 @@ Return ONLY valid JSON, no additional text or markdown formatting."""
                 rationale="No content provided for classification"
             )
         
-        # Try alias map first for simple topics
+        # Try alias map first for simple topics; this path never touches the Gemini client
         raw_topic_lower = item.raw_topic.lower().strip() if item.raw_topic else ""
-        if raw_topic_lower in ALIAS_MAP:
-            canonical_path = ALIAS_MAP[raw_topic_lower]
+        canonical_path = ALIAS_MAP.get(" ".join(raw_topic_lower.casefold().split()))
+        if canonical_path is not None:
             parts = canonical_path.split("/")
             
             if len(parts) >= 2:
@@ -374,28 +743,54 @@ Return ONLY valid JSON, no additional text or markdown formatting."""
                     rationale="Matched via alias map"
                 )
         
+        # Identical items skip the LLM entirely
+        content_block = self._build_content_block(item)
+        response_key = self._get_response_key(content_block)
+        cached = self._get_cached_response(response_key)
+        if cached is not None:
+            logger.debug(f"Taxonomy cache hit for: {item.raw_topic[:50]}")
+            return cached
+        
+        # Near-duplicates reuse the closest cached response
+        query = self._embed_for_semantic_cache(item)
+        if query is not None:
+            cached = self._get_similar_response(query)
+            if cached is not None:
+                logger.debug(f"Taxonomy semantic cache hit for: {item.raw_topic[:50]}")
+                raw_topic_clean = item.raw_topic.lower().strip() if item.raw_topic else ""
+                if raw_topic_clean and raw_topic_clean not in cached.tags:
+                    cached.tags.append(raw_topic_clean)
+                return cached
+        
         # Configure and call LLM
         self._configure()
         
-        prompt = self._build_prompt(item)
+        # With a context cache only the per-item block is sent
+        model = self._get_cached_model()
+        if model is not None:
+            prompt = content_block
+        else:
+            model = self._model
+            prompt = _STATIC_PROMPT + "\n\n" + content_block
         
         try:
             logger.info(f"Generating taxonomy for: {item.raw_topic[:50]}...")
             
-            response = self._model.generate_content(
+            response = model.generate_content(
                 prompt,
-                generation_config=genai.GenerationConfig(
-                    temperature=self.config.temperature,
-                    response_mime_type="application/json"
-                )
+                generation_config=self._generation_config,
+                stream=True
             )
             
-            response_text = response.text
+            response_text = self._read_streamed_response(response)
             logger.debug(f"LLM response: {response_text[:500]}")
             
             # Parse and validate
             parsed = self._parse_llm_response(response_text)
             candidate = self._validate_and_build_candidate(parsed, item)
+            self._put_cached_response(response_key, candidate)
+            if query is not None:
+                self._add_similar_response(response_key, query, item)
             
             logger.info(
                 f"Generated taxonomy: {candidate.domain.label}/{candidate.subdomain.label}"
@@ -424,9 +819,15 @@ Return ONLY valid JSON, no additional text or markdown formatting."""
         best_subdomain = None
         best_score = 0
         
-        for domain in SEED_DOMAINS:
+        # One multi-pattern scan replaces a substring search per alias
+        hits = _count_alias_hits(text_to_match) if AHOCORASICK_AVAILABLE else None
+        
+        for d, domain in enumerate(SEED_DOMAINS):
             # Check domain aliases
-            domain_score = sum(1 for alias in domain.get("aliases", []) if alias in text_to_match)
+            if hits is not None:
+                domain_score = hits.get((d, -1), 0)
+            else:
+                domain_score = sum(1 for alias in domain.get("aliases", []) if alias in text_to_match)
             
             if domain_score > best_score:
                 best_score = domain_score
@@ -434,11 +835,14 @@ Return ONLY valid JSON, no additional text or markdown formatting."""
                 best_subdomain = "General"
             
             # Check subdomain aliases
-            for subdomain in domain.get("subdomains", []):
-                sub_score = domain_score + sum(
-                    1 for alias in subdomain.get("aliases", []) 
-                    if alias in text_to_match
-                )
+            for s, subdomain in enumerate(domain.get("subdomains", [])):
+                if hits is not None:
+                    sub_score = domain_score + hits.get((d, s), 0)
+                else:
+                    sub_score = domain_score + sum(
+                        1 for alias in subdomain.get("aliases", []) 
+                        if alias in text_to_match
+                    )
                 
                 if sub_score > best_score:
                     best_score = sub_score
@@ -462,27 +866,36 @@ Return ONLY valid JSON, no additional text or markdown formatting."""
             rationale="Fallback classification via keyword matching"
         )
     
-    def generate_batch(self, items: List[ItemInput]) -> List[TaxonomyCandidate]:
+    def generate_batch(self, items: List[ItemInput], max_concurrency: int = 8) -> List[TaxonomyCandidate]:
         """
         Generate taxonomy candidates for multiple items.
         
+        LLM calls block on network I/O, so items are generated concurrently
+        on a thread pool.
+        
         Args:
             items: List of input items
+            max_concurrency: Maximum number of in-flight LLM requests
             
         Returns:
-            List of TaxonomyCandidate objects
+            List of TaxonomyCandidate objects, in input order
         """
-        candidates = []
-        
-        for item in items:
+        def generate_one(item: ItemInput) -> TaxonomyCandidate:
             try:
-                candidate = self.generate(item)
-                candidates.append(candidate)
+                return self._generate(item)
             except Exception as e:
                 logger.error(f"Error generating taxonomy for item {item.item_id}: {e}")
                 # Add fallback for failed items
-                candidates.append(self._fallback_classification(item))
+                return self._fallback_classification(item)
+        
+        if len(items) <= 1 or max_concurrency <= 1:
+            candidates = [generate_one(item) for item in items]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, len(items))) as executor:
+                candidates = list(executor.map(generate_one, items))
         
+        # Persist the response cache once for the whole batch
+        self._save_responses()
         return candidates
 
 
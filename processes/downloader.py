@@ -30,18 +30,47 @@ Output Structure:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
 import sys
 import os
 import re
 import json
 import argparse
+import hashlib
+import html
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import logging
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
 
+# Try to import orjson for fast parsing of large API payloads
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse a JSON document from bytes (orjson when available)."""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize a JSON document to compact bytes (orjson when available)."""
+    return orjson.dumps(data) if ORJSON_AVAILABLE else json.dumps(data).encode('utf-8')
+
 # Get the directory where this script is located
 SCRIPT_DIR = Path(__file__).parent
 
@@ -49,11 +78,8 @@ SCRIPT_DIR = Path(__file__).parent
 load_dotenv(SCRIPT_DIR / '.env')
 
 # Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%dT%H:%M:%S'
-)
+from log_format import configure_logging
+configure_logging(datefmt='%Y-%m-%dT%H:%M:%S')
 logger = logging.getLogger(__name__)
 
 # Import local modules
@@ -61,7 +87,7 @@ from media_classifier import is_video, get_file_type
 from overshoot_client import (
     process_video_with_overshoot,
     check_overshoot_status,
-    OVERSHOOT_AVAILABLE
+    is_overshoot_available
 )
 from gemini_client import (
     process_document_with_gemini,
@@ -81,11 +107,251 @@ GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY')
 OVERSHOOT_API_KEY = os.environ.get('OVERSHOOT_API_KEY')
 OUTPUT_BASE_DIR = SCRIPT_DIR / "outputs"
 
+# Download cache: API responses expire after DOWNLOAD_CACHE_TTL seconds, media is kept
+CACHE_DIR = OUTPUT_BASE_DIR / ".cache"
+DOWNLOAD_CACHE_TTL = int(os.environ.get('DOWNLOAD_CACHE_TTL', 24 * 60 * 60))
+
+
+# ============================================
+# HTTP Session
+# ============================================
+
+def _build_http_session() -> requests.Session:
+    """
+    Build the shared keep-alive session used for every API and media request.
+    
+    Pooled connections let the metadata call and the CDN fetch, and
+    consecutive downloads from the same host, reuse TCP/TLS connections.
+    Transient failures (429/5xx) are retried with backoff. API keys are
+    passed per request, never as session headers, so they don't leak to CDNs.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        connect=3,
+        read=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+HTTP_SESSION = _build_http_session()
+
+# (connect, read) timeouts: metadata/API calls, and streamed media downloads
+API_TIMEOUT = (5, 60)
+DOWNLOAD_TIMEOUT = (5, 300)
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+@contextmanager
+def atomic_open(target: Path, buffering: int = -1) -> Iterator[BinaryIO]:
+    """
+    Open a binary file that only appears at target once fully written.
+    
+    Writes go to a .part file beside target, which is fsynced and renamed
+    over target on success and removed on error. Readers (including the
+    download cache) never see a truncated file, and a replaced target's
+    existing hardlinks stay intact.
+    
+    Args:
+        target: Final file path
+        buffering: Buffer size passed to open()
+    """
+    partial = Path(f"{target}.part")
+    try:
+        with open(partial, "wb", buffering=buffering) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(partial, target)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+
+
+def download_to_file(url: str, filename: Path) -> bool:
+    """
+    Stream a URL's body straight to disk in 1 MB chunks.
+    
+    The media is never held in memory as a whole, and disk writes overlap
+    with the network receive. The body is copied from the raw urllib3
+    stream into a 1 MB-buffered file, so large videos take few write calls.
+    
+    Args:
+        url: URL to fetch
+        filename: Destination path
+        
+    Returns:
+        True on success, False on HTTP or network errors (partial files are removed)
+    """
+    try:
+        with HTTP_SESSION.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with atomic_open(filename, buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
+        return True
+    except (requests.RequestException, Urllib3HTTPError) as e:
+        logger.error(f"Download failed: {e}")
+        return False
+
+
+# ============================================
+# Download Cache
+# ============================================
+
+# Query parameters that only track the share and never change the target
+_TRACKING_PARAMS = frozenset({
+    'si', 'feature', 'igshid', 'igsh', 'fbclid', 'gclid', 'ref', 'ref_src', 'ref_url', 's'
+})
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a URL for cache keys: lowercase scheme/host, drop tracking params and fragment."""
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.startswith('utm_') and k not in _TRACKING_PARAMS
+    )
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip('/') or '/',
+        urlencode(query),
+        ''
+    ))
+
+
+def _cache_key(url: str) -> str:
+    return hashlib.sha256(canonicalize_url(url).encode('utf-8')).hexdigest()
+
+
+def fetch_api_json(url: str, api_url: str, headers: dict, params: dict) -> Any:
+    """
+    Get the RapidAPI metadata response for a media URL, from the disk cache when fresh.
+    
+    Args:
+        url: Original media URL (cache key)
+        api_url: RapidAPI endpoint
+        headers: Request headers
+        params: Query parameters
+        
+    Returns:
+        Parsed JSON response
+    """
+    cache_file = CACHE_DIR / "api" / f"{_cache_key(url)}.json"
+    try:
+        if time.time() - cache_file.stat().st_mtime < DOWNLOAD_CACHE_TTL:
+            with open(cache_file, "rb") as f:
+                data = _json_loads(f.read())
+            logger.info("Using cached API response")
+            return data
+    except (OSError, ValueError):
+        pass
+    
+    response = HTTP_SESSION.get(api_url, headers=headers, params=params, timeout=API_TIMEOUT)
+    data = _json_loads(response.content)
+    
+    # Only successful responses are worth replaying
+    if response.ok:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_open(cache_file) as f:
+                f.write(_json_dumps(data))
+        except OSError as e:
+            logger.warning(f"Failed to cache API response: {e}")
+    return data
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink src to dst (replacing dst), copying when links aren't supported."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def restore_cached_media(url: str, filename: Path) -> bool:
+    """Place a previously downloaded file for url at filename; False on a cache miss."""
+    cache_file = CACHE_DIR / "media" / f"{_cache_key(url)}{filename.suffix}"
+    if not cache_file.exists():
+        return False
+    try:
+        _link_or_copy(cache_file, filename)
+    except OSError as e:
+        logger.warning(f"Failed to restore cached media: {e}")
+        return False
+    logger.info(f"[OK] Using cached media: {filename}")
+    return True
+
+
+def store_cached_media(url: str, filename: Path) -> None:
+    """Add a downloaded file to the media cache under url."""
+    cache_file = CACHE_DIR / "media" / f"{_cache_key(url)}{filename.suffix}"
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        _link_or_copy(filename, cache_file)
+    except OSError as e:
+        logger.warning(f"Failed to cache media: {e}")
+
+
+def store_cached_caption(url: str, out_dir: Path) -> None:
+    """Add the caption.txt saved in out_dir (if any) to the media cache under url."""
+    cache_file = CACHE_DIR / "media" / f"{_cache_key(url)}.caption.txt"
+    caption_path = out_dir / "caption.txt"
+    try:
+        if caption_path.exists():
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Copied, not linked: _save_caption rewrites caption.txt in place
+            shutil.copyfile(caption_path, cache_file)
+        else:
+            cache_file.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Failed to cache caption: {e}")
+
+
+def restore_cached_caption(url: str, out_dir: Path) -> None:
+    """Restore the cached caption for url as out_dir/caption.txt, or remove a stale one."""
+    cache_file = CACHE_DIR / "media" / f"{_cache_key(url)}.caption.txt"
+    caption_path = out_dir / "caption.txt"
+    try:
+        if cache_file.exists():
+            shutil.copyfile(cache_file, caption_path)
+        else:
+            caption_path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Failed to restore cached caption: {e}")
+
 
 # ============================================
 # Utility Functions
 # ============================================
 
+# Patterns compiled once at import; subtitle parsing runs them over whole transcripts
+_SAFE_NAME_RE = re.compile(r'[^\w\-_]')
+_YOUTUBE_ID_PATTERNS = [
+    re.compile(r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/shorts\/)([a-zA-Z0-9_-]{11})'),
+    re.compile(r'youtube\.com\/embed\/([a-zA-Z0-9_-]{11})'),
+    re.compile(r'youtube\.com\/v\/([a-zA-Z0-9_-]{11})'),
+]
+# Subtitle markup removed in one pass: tags, cue timings, the WEBVTT header, cue numbers
+_SUBTITLE_NOISE_RE = re.compile(
+    r'<[^>]+>'
+    r'|\d{2}:\d{2}:\d{2}[,\.]\d{3}\s*-->\s*\d{2}:\d{2}:\d{2}[,\.]\d{3}'
+    r'|\AWEBVTT.*?\n\n'
+    r'|^\d+\s*$',
+    re.DOTALL | re.MULTILINE
+)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
 def get_output_dir(input_name: str) -> Path:
     """
     Get the output directory for a given input file/URL.
@@ -97,7 +363,7 @@ def get_output_dir(input_name: str) -> Path:
         Path to the output directory
     """
     # Sanitize the name for use as directory
-    safe_name = re.sub(r'[^\w\-_]', '_', input_name)
+    safe_name = _SAFE_NAME_RE.sub('_', input_name)
     safe_name = safe_name[:50]  # Limit length
     
     out_dir = OUTPUT_BASE_DIR / safe_name
@@ -106,15 +372,18 @@ def get_output_dir(input_name: str) -> Path:
     return out_dir
 
 
+def get_url_output_dir(prefix: str, url: str) -> Path:
+    """
+    Get a per-URL output directory, so downloads of different URLs from the
+    same platform never share files and can be processed concurrently.
+    """
+    return get_output_dir(f"{prefix}_{_cache_key(url)[:12]}")
+
+
 def extract_youtube_video_id(url: str) -> Optional[str]:
     """Extract video ID from various YouTube URL formats."""
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/shorts\/)([a-zA-Z0-9_-]{11})',
-        r'youtube\.com\/embed\/([a-zA-Z0-9_-]{11})',
-        r'youtube\.com\/v\/([a-zA-Z0-9_-]{11})',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, url)
+    for pattern in _YOUTUBE_ID_PATTERNS:
+        match = pattern.search(url)
         if match:
             return match.group(1)
     return None
@@ -122,12 +391,9 @@ def extract_youtube_video_id(url: str) -> Optional[str]:
 
 def parse_subtitles_to_text(subtitle_content: str) -> str:
     """Parse subtitle content (SRT/VTT/XML) and extract plain text."""
-    text = re.sub(r'<[^>]+>', '', subtitle_content)
-    text = re.sub(r'\d{2}:\d{2}:\d{2}[,\.]\d{3}\s*-->\s*\d{2}:\d{2}:\d{2}[,\.]\d{3}', '', text)
-    text = re.sub(r'^WEBVTT.*?\n\n', '', text, flags=re.DOTALL)
-    text = re.sub(r'^\d+\s*$', '', text, flags=re.MULTILINE)
-    text = text.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>').replace('&quot;', '"').replace('&#39;', "'")
-    text = re.sub(r'\s+', ' ', text)
+    text = _SUBTITLE_NOISE_RE.sub('', subtitle_content)
+    text = html.unescape(text)
+    text = _WHITESPACE_RE.sub(' ', text)
     return text.strip()
 
 
@@ -156,9 +422,9 @@ def process_url_with_jina(url: str) -> Optional[str]:
     logger.info(f"Fetching content via Jina Reader: {jina_url}")
     
     try:
-        response = requests.get(jina_url, headers=headers)
+        response = HTTP_SESSION.get(jina_url, headers=headers, timeout=API_TIMEOUT)
         if response.status_code == 200:
-            data = response.json()
+            data = _json_loads(response.content)
             if "data" in data and "content" in data["data"]:
                 return data["data"]["content"]
             # Fallback for plain text response
@@ -171,6 +437,176 @@ def process_url_with_jina(url: str) -> Optional[str]:
         return None
 
 
+# ============================================
+# API Response Field Extraction
+# ============================================
+
+# Key paths tried in order against each RapidAPI response shape
+TIKTOK_VIDEO_URL_PATHS = (
+    ("video",), ("video_url",), ("play",), ("download_url",),
+    ("data", "video"), ("data", "play"),
+)
+INSTAGRAM_VIDEO_URL_PATHS = (
+    ("video",), ("video_url",), ("download_url",), ("downloadUrl",),
+    ("data", "video"), ("data", "url"), ("data", "downloadUrl"),
+    ("data", 0, "video"), ("data", 0, "url"), ("data", 0),
+    ("result", 0, "url"), ("result", 0, "video"), ("result", 0),
+    ("result", "url"), ("result", "video"),
+)
+TIKTOK_CAPTION_PATHS = (
+    ("title",), ("desc",), ("description",),
+    ("data", "title"), ("data", "desc"),
+)
+INSTAGRAM_CAPTION_PATHS = (
+    ("caption",), ("title",), ("description",),
+    ("data", "caption"), ("data", 0, "caption"), ("data", 0, "title"),
+    ("result", 0, "caption"), ("result", 0, "title"), ("result", "caption"),
+)
+TWEET_TEXT_PATHS = (
+    ("description",), ("text",), ("tweet_text",), ("content",), ("message",),
+    ("tweet", "text"), ("tweet", "description"),
+    ("data", "text"), ("data", "description"),
+)
+TWEET_LIKES_PATHS = (
+    ("favorite_count",), ("likes",), ("like_count",),
+    ("tweet", "favorite_count"), ("tweet", "likes"),
+    ("data", "favorite_count"), ("data", "likes"),
+)
+TWEET_AUTHOR_PATHS = (
+    ("user", "name"), ("user", "author"),
+    ("author",), ("name",), ("author_name",), ("username",),
+    ("tweet", "user", "name"),
+)
+TWEET_HANDLE_PATHS = (
+    ("user", "screen_name"), ("user", "username"),
+    ("screen_name",), ("username",),
+    ("tweet", "user", "screen_name"),
+)
+
+
+# Successful key path per (field, top-level response keys), most recent last
+_LEARNED_PATHS: "OrderedDict[tuple, tuple]" = OrderedDict()
+_LEARNED_PATHS_MAX = 256
+_learned_paths_lock = threading.Lock()
+
+_MISSING = object()
+
+
+def _is_http_url(value: Any) -> bool:
+    return isinstance(value, str) and value.startswith("http")
+
+
+def _is_text(value: Any) -> bool:
+    return isinstance(value, str) and bool(value.strip())
+
+
+def _follow(data: Any, path: tuple, accept) -> Any:
+    """Get the value at a key path if it passes accept, else _MISSING."""
+    value = data
+    try:
+        for key in path:
+            value = value[key]
+    except (KeyError, IndexError, TypeError):
+        return _MISSING
+    if isinstance(value, list):
+        value = value[0] if value else None
+    return value if accept(value) else _MISSING
+
+
+def _pick(data: Any, paths: Tuple[tuple, ...], accept=bool, field: Optional[str] = None) -> Any:
+    """
+    Get the first value along a list of key paths that passes accept.
+    
+    Paths that hit a missing key, a short list or a non-container are
+    skipped. A list found at the end of a path stands for its first element.
+    
+    When field is given, the path that succeeded is remembered against the
+    response's top-level keys, and tried first for the next response with
+    the same shape.
+    
+    Args:
+        data: Parsed API response
+        paths: Key paths (dict keys and list indices) to try in order
+        accept: Predicate a value must pass (default: truthy)
+        field: Name to learn the successful path under
+        
+    Returns:
+        The first accepted value, or None
+    """
+    shape = None
+    if field is not None and isinstance(data, dict):
+        shape = (field, tuple(sorted(data)))
+        with _learned_paths_lock:
+            learned = _LEARNED_PATHS.get(shape)
+            if learned is not None:
+                _LEARNED_PATHS.move_to_end(shape)
+        if learned is not None:
+            value = _follow(data, learned, accept)
+            if value is not _MISSING:
+                return value
+    
+    for path in paths:
+        value = _follow(data, path, accept)
+        if value is not _MISSING:
+            if shape is not None:
+                with _learned_paths_lock:
+                    _LEARNED_PATHS[shape] = path
+                    _LEARNED_PATHS.move_to_end(shape)
+                    if len(_LEARNED_PATHS) > _LEARNED_PATHS_MAX:
+                        _LEARNED_PATHS.popitem(last=False)
+            return value
+    return None
+
+
+def _extract_tiktok_video(data: Any) -> Optional[str]:
+    """Get the video URL from a TikTok API response."""
+    if not isinstance(data, dict):
+        return None
+    return _pick(data, TIKTOK_VIDEO_URL_PATHS, _is_http_url, field="tiktok_video")
+
+
+def _extract_instagram_video(data: Any) -> Optional[str]:
+    """Get the video URL from an Instagram API response."""
+    if not isinstance(data, dict):
+        return None
+    return _pick(data, INSTAGRAM_VIDEO_URL_PATHS, _is_http_url, field="instagram_video")
+
+
+def _extract_caption(data: Any, paths: Tuple[tuple, ...], field: str) -> Optional[str]:
+    """Get a post's caption text from an API response."""
+    if not isinstance(data, dict):
+        return None
+    return _pick(data, paths, _is_text, field=field)
+
+
+def _save_caption(caption: Optional[str], out_dir: Path) -> None:
+    """
+    Save a post's caption as caption.txt next to its video, for the Overshoot
+    fast path. Without one, any caption left by an earlier download is removed.
+    """
+    caption_path = out_dir / "caption.txt"
+    if caption:
+        caption_path.write_text(caption, encoding="utf-8")
+    else:
+        caption_path.unlink(missing_ok=True)
+
+
+def _extract_twitter_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get tweet fields from a Twitter API response.
+    
+    Returns:
+        Dict with text, likes, created_at, author and handle (None when absent)
+    """
+    return {
+        "text": _pick(data, TWEET_TEXT_PATHS, field="tweet_text"),
+        "likes": _pick(data, TWEET_LIKES_PATHS, lambda v: v is not None, field="tweet_likes"),
+        "created_at": data.get("created_at"),
+        "author": _pick(data, TWEET_AUTHOR_PATHS, field="tweet_author"),
+        "handle": _pick(data, TWEET_HANDLE_PATHS, field="tweet_handle"),
+    }
+
+
 # ============================================
 # Media Processing Pipeline
 # ============================================
@@ -198,6 +634,9 @@ def process_media(file_path: str, output_name: Optional[str] = None) -> Tuple[Op
     # Determine output directory
     if output_name:
         out_dir = get_output_dir(output_name)
+    elif Path(file_path).resolve().parent.parent == OUTPUT_BASE_DIR.resolve():
+        # Downloaded media: results go in its per-URL directory
+        out_dir = Path(file_path).parent
     else:
         out_dir = get_output_dir(Path(file_path).stem)
     
@@ -222,7 +661,7 @@ def process_media(file_path: str, output_name: Optional[str] = None) -> Tuple[Op
             logger.info("NOTE: Overshoot uses WebRTC - may fail on restricted networks")
             logger.info("=" * 50)
             
-            if not OVERSHOOT_AVAILABLE:
+            if not is_overshoot_available():
                 logger.warning("Overshoot SDK not available, falling back to Gemini")
             else:
                 overshoot_status = check_overshoot_status()
@@ -314,34 +753,30 @@ def download_tiktok(url: str) -> Optional[str]:
     
     params = {"url": url}
     
-    logger.info("Fetching TikTok video info...")
-    response = requests.get(api_url, headers=headers, params=params)
-    data = response.json()
+    out_dir = get_url_output_dir("tiktok", url)
+    filename = out_dir / "tiktok_video.mp4"
+    if restore_cached_media(url, filename):
+        restore_cached_caption(url, out_dir)
+        return str(filename)
     
-    video_url = None
-    if isinstance(data, dict):
-        video_url = data.get("video") or data.get("video_url") or data.get("play") or data.get("download_url")
-        if not video_url and "data" in data:
-            video_url = data["data"].get("video") or data["data"].get("play")
+    logger.info("Fetching TikTok video info...")
+    data = fetch_api_json(url, api_url, headers, params)
     
-    if isinstance(video_url, list) and len(video_url) > 0:
-        video_url = video_url[0]
+    video_url = _extract_tiktok_video(data)
+    _save_caption(_extract_caption(data, TIKTOK_CAPTION_PATHS, "tiktok_caption"), out_dir)
     
     if video_url:
         logger.info("Downloading TikTok video...")
-        video_response = requests.get(video_url)
-        
-        out_dir = get_output_dir("tiktok_video")
-        filename = out_dir / "tiktok_video.mp4"
-        
-        with open(filename, "wb") as f:
-            f.write(video_response.content)
+        if not download_to_file(video_url, filename):
+            return None
+        store_cached_media(url, filename)
+        store_cached_caption(url, out_dir)
         
         logger.info(f"[OK] Video saved: {filename}")
         return str(filename)
     else:
         logger.error("Could not find TikTok video URL")
-        logger.error(f"API Response: {data}")
+        logger.error("API Response: %s", data)
         return None
 
 
@@ -356,47 +791,30 @@ def download_instagram(url: str) -> Optional[str]:
     
     params = {"url": url}
     
+    out_dir = get_url_output_dir("instagram", url)
+    filename = out_dir / "instagram_video.mp4"
+    if restore_cached_media(url, filename):
+        restore_cached_caption(url, out_dir)
+        return str(filename)
+    
     logger.info("Fetching Instagram video info...")
-    response = requests.get(api_url, headers=headers, params=params)
-    data = response.json()
+    data = fetch_api_json(url, api_url, headers, params)
     
-    video_url = None
-    if isinstance(data, dict):
-        video_url = (data.get("video") or data.get("video_url") or 
-                    data.get("download_url") or data.get("downloadUrl"))
-        
-        if not video_url and "data" in data:
-            nested = data["data"]
-            if isinstance(nested, dict):
-                video_url = nested.get("video") or nested.get("url") or nested.get("downloadUrl")
-            elif isinstance(nested, list) and len(nested) > 0:
-                video_url = nested[0].get("video") or nested[0].get("url") if isinstance(nested[0], dict) else nested[0]
-        
-        if not video_url and "result" in data:
-            result = data["result"]
-            if isinstance(result, list) and len(result) > 0:
-                video_url = result[0].get("url") or result[0].get("video") if isinstance(result[0], dict) else result[0]
-            elif isinstance(result, dict):
-                video_url = result.get("url") or result.get("video")
-    
-    if isinstance(video_url, list) and len(video_url) > 0:
-        video_url = video_url[0]
+    video_url = _extract_instagram_video(data)
+    _save_caption(_extract_caption(data, INSTAGRAM_CAPTION_PATHS, "instagram_caption"), out_dir)
     
-    if video_url and isinstance(video_url, str) and video_url.startswith("http"):
+    if video_url:
         logger.info("Downloading Instagram video...")
-        video_response = requests.get(video_url)
-        
-        out_dir = get_output_dir("instagram_video")
-        filename = out_dir / "instagram_video.mp4"
-        
-        with open(filename, "wb") as f:
-            f.write(video_response.content)
+        if not download_to_file(video_url, filename):
+            return None
+        store_cached_media(url, filename)
+        store_cached_caption(url, out_dir)
         
         logger.info(f"[OK] Video saved: {filename}")
         return str(filename)
     else:
         logger.error("Could not find Instagram video URL")
-        logger.error(f"API Response: {data}")
+        logger.error("API Response: %s", data)
         return None
 
 
@@ -412,12 +830,12 @@ def download_twitter(url: str) -> Optional[str]:
     params = {"url": url}
     
     logger.info("Fetching Twitter/X tweet info...")
-    response = requests.get(api_url, headers=headers, params=params)
-    data = response.json()
+    data = fetch_api_json(url, api_url, headers, params)
     
-    logger.debug(f"Twitter API response: {json.dumps(data, indent=2)[:1000]}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Twitter API response: %s", _json_dumps(data)[:1000].decode('utf-8', 'replace'))
     
-    out_dir = get_output_dir("twitter_tweet")
+    out_dir = get_url_output_dir("twitter", url)
     filename = out_dir / "twitter_tweet_data.txt"
     
     if isinstance(data, dict):
@@ -431,65 +849,29 @@ def download_twitter(url: str) -> Optional[str]:
             return str(filename)
         
         # Extract tweet information - handle various API response formats
-        tweet_text = None
-        author = None
-        author_handle = None
-        likes = None
-        created_at = None
-        
-        # Direct fields (main response format)
-        tweet_text = (data.get("description") or data.get("text") or 
-                     data.get("tweet_text") or data.get("content") or data.get("message"))
-        likes = data.get("favorite_count") or data.get("likes") or data.get("like_count")
-        created_at = data.get("created_at")
-        
-        # User info from nested user object
-        user_data = data.get("user", {})
-        if isinstance(user_data, dict):
-            author = user_data.get("name") or user_data.get("author")
-            author_handle = user_data.get("screen_name") or user_data.get("username")
-        
-        # Fallback to top-level user fields
-        if not author:
-            author = (data.get("author") or data.get("name") or 
-                     data.get("author_name") or data.get("username"))
-        if not author_handle:
-            author_handle = data.get("screen_name") or data.get("username")
-        
-        # Check nested 'tweet' field
-        if "tweet" in data and isinstance(data["tweet"], dict):
-            tweet = data["tweet"]
-            tweet_text = tweet_text or tweet.get("text") or tweet.get("description")
-            likes = likes or tweet.get("favorite_count") or tweet.get("likes")
-            if "user" in tweet and isinstance(tweet["user"], dict):
-                author = author or tweet["user"].get("name")
-                author_handle = author_handle or tweet["user"].get("screen_name")
-        
-        # Check nested 'data' field
-        if "data" in data and isinstance(data["data"], dict):
-            nested = data["data"]
-            tweet_text = tweet_text or nested.get("text") or nested.get("description")
-            likes = likes or nested.get("favorite_count") or nested.get("likes")
-        
-        # Build tweet data with all available info
-        tweet_data_lines = []
-        
-        if author:
-            author_str = f"{author}"
-            if author_handle:
-                author_str += f" (@{author_handle})"
-            tweet_data_lines.append(f"Author: {author_str}")
-        else:
-            tweet_data_lines.append("Author: N/A")
-        
-        if created_at:
-            tweet_data_lines.append(f"Date: {created_at}")
+        fields = _extract_twitter_fields(data)
+        tweet_text = fields["text"]
+        likes = fields["likes"]
+        created_at = fields["created_at"]
+        author = fields["author"]
+        author_handle = fields["handle"]
         
-        tweet_data_lines.append(f"Likes: {likes if likes is not None else 'N/A'}")
-        tweet_data_lines.append(f"\nTweet:\n{tweet_text or 'N/A'}")
+        # Build tweet data with all available info; absent optional lines are None
+        if author and author_handle:
+            author_line = f"Author: {author} (@{author_handle})"
+        elif author:
+            author_line = f"Author: {author}"
+        else:
+            author_line = "Author: N/A"
+        tweet_data_lines = (
+            author_line,
+            f"Date: {created_at}" if created_at else None,
+            f"Likes: {likes if likes is not None else 'N/A'}",
+            f"\nTweet:\n{tweet_text or 'N/A'}",
+        )
         
         with open(filename, "w", encoding="utf-8") as f:
-            f.write("\n".join(tweet_data_lines))
+            f.write("\n".join(line for line in tweet_data_lines if line is not None))
         
         logger.info(f"[OK] Tweet data saved: {filename}")
         
@@ -500,10 +882,43 @@ def download_twitter(url: str) -> Optional[str]:
         return str(filename)
     
     logger.error("Could not parse Twitter response")
-    logger.error(f"API Response: {data}")
+    logger.error("API Response: %s", data)
     return None
 
 
+# Background workers for side fetches (captions) that overlap a media download
+_SIDE_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="side-fetch")
+
+
+def _youtube_caption_track(data) -> Tuple[Optional[str], str]:
+    """Get (url, language code) of the first caption track in a YouTube API response."""
+    if not isinstance(data, dict) or "subtitles" not in data:
+        return None, "unknown"
+    subtitles_data = data["subtitles"]
+    if not isinstance(subtitles_data, dict) or "items" not in subtitles_data:
+        return None, "unknown"
+    items = subtitles_data["items"]
+    if not items:
+        return None, "unknown"
+    return items[0].get("url"), items[0].get("code", "unknown")
+
+
+def _download_youtube_captions(subtitle_url: str, subtitle_lang: str, out_dir: Path) -> None:
+    """Download a caption track and save it as plain text."""
+    logger.info(f"Downloading captions ({subtitle_lang})...")
+    try:
+        subtitle_response = HTTP_SESSION.get(subtitle_url, timeout=API_TIMEOUT)
+        plain_text = parse_subtitles_to_text(subtitle_response.text)
+        
+        if plain_text:
+            caption_filename = out_dir / "youtube_captions.txt"
+            with open(caption_filename, "w", encoding="utf-8") as f:
+                f.write(plain_text)
+            logger.info(f"[OK] Captions saved: {caption_filename}")
+    except Exception as e:
+        logger.warning(f"Failed to download captions: {e}")
+
+
 def download_youtube(url: str) -> Optional[str]:
     """Download YouTube video using RapidAPI."""
     video_id = extract_youtube_video_id(url)
@@ -525,9 +940,13 @@ def download_youtube(url: str) -> Optional[str]:
         "audios": "auto"
     }
     
+    out_dir = get_output_dir(f"youtube_{video_id}")
+    filename = out_dir / "youtube_video.mp4"
+    if restore_cached_media(url, filename):
+        return str(filename)
+    
     logger.info(f"Fetching YouTube video info for ID: {video_id}...")
-    response = requests.get(api_url, headers=headers, params=params)
-    data = response.json()
+    data = fetch_api_json(url, api_url, headers, params)
     
     video_url = None
     target_quality = "480p"
@@ -535,25 +954,24 @@ def download_youtube(url: str) -> Optional[str]:
     if isinstance(data, dict):
         if "videos" in data and isinstance(data["videos"], dict):
             items = data["videos"].get("items", [])
-            if items:
-                # Try to find 480p with audio
-                for item in items:
-                    if item.get("quality") == target_quality and item.get("hasAudio") and item.get("url"):
-                        video_url = item["url"]
-                        logger.info(f"Found video: {item.get('quality')} ({item.get('sizeText', 'unknown size')})")
+            # One pass ranks items: 0 = 480p with audio, 1 = any with audio, 2 = any
+            best_rank = 3
+            best_item = None
+            for item in items:
+                item_url = item.get("url")
+                if not item_url:
+                    continue
+                if item.get("hasAudio"):
+                    rank = 0 if item.get("quality") == target_quality else 1
+                else:
+                    rank = 2
+                if rank < best_rank:
+                    best_rank, best_item, video_url = rank, item, item_url
+                    if rank == 0:
                         break
-                
-                # Fallback: any video with audio
-                if not video_url:
-                    for item in items:
-                        if item.get("hasAudio") and item.get("url"):
-                            video_url = item["url"]
-                            logger.info(f"Found video: {item.get('quality')} ({item.get('sizeText', 'unknown size')})")
-                            break
-                
-                # Last fallback: first video
-                if not video_url and items:
-                    video_url = items[0].get("url")
+            
+            if best_item is not None and best_rank < 2:
+                logger.info(f"Found video: {best_item.get('quality')} ({best_item.get('sizeText', 'unknown size')})")
         
         if not video_url and "videos" in data and isinstance(data["videos"], list) and data["videos"]:
             video_url = data["videos"][0].get("url")
@@ -564,45 +982,31 @@ def download_youtube(url: str) -> Optional[str]:
     if isinstance(video_url, list) and video_url:
         video_url = video_url[0]
     
-    out_dir = get_output_dir(f"youtube_{video_id}")
-    
     if video_url and isinstance(video_url, str) and video_url.startswith("http"):
         logger.info("Downloading YouTube video...")
-        video_response = requests.get(video_url)
         
-        filename = out_dir / "youtube_video.mp4"
-        with open(filename, "wb") as f:
-            f.write(video_response.content)
+        # Captions come from a different host, so fetch them while the video streams
+        subtitle_url, subtitle_lang = _youtube_caption_track(data)
+        captions = None
+        if subtitle_url:
+            captions = _SIDE_FETCH_EXECUTOR.submit(
+                _download_youtube_captions, subtitle_url, subtitle_lang, out_dir
+            )
+        downloaded = download_to_file(video_url, filename)
+        if captions is not None:
+            captions.result()
         
-        logger.info(f"[OK] Video saved: {filename}")
+        if not downloaded:
+            return None
+        store_cached_media(url, filename)
         
-        # Also download captions if available
-        if isinstance(data, dict) and "subtitles" in data:
-            subtitles_data = data["subtitles"]
-            if isinstance(subtitles_data, dict) and "items" in subtitles_data:
-                items = subtitles_data["items"]
-                if items:
-                    subtitle_url = items[0].get("url")
-                    subtitle_lang = items[0].get("code", "unknown")
-                    
-                    if subtitle_url:
-                        logger.info(f"Downloading captions ({subtitle_lang})...")
-                        try:
-                            subtitle_response = requests.get(subtitle_url)
-                            plain_text = parse_subtitles_to_text(subtitle_response.text)
-                            
-                            if plain_text:
-                                caption_filename = out_dir / "youtube_captions.txt"
-                                with open(caption_filename, "w", encoding="utf-8") as f:
-                                    f.write(plain_text)
-                                logger.info(f"[OK] Captions saved: {caption_filename}")
-                        except Exception as e:
-                            logger.warning(f"Failed to download captions: {e}")
+        logger.info(f"[OK] Video saved: {filename}")
         
         return str(filename)
     else:
         logger.error("Could not find YouTube video URL")
-        logger.debug(f"API Response: {data}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("API Response: %s", data)
         return None
 
 
@@ -610,44 +1014,71 @@ def download_youtube(url: str) -> Optional[str]:
 # Main Entry Point
 # ============================================
 
-def download_and_process(url: str) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+# One case-insensitive scan names the platform via the matching group
+_PLATFORM_RE = re.compile(
+    r"(?P<tiktok>tiktok\.com)"
+    r"|(?P<instagram>instagram\.com)"
+    r"|(?P<twitter>twitter\.com|x\.com)"
+    r"|(?P<youtube>youtube\.com|youtu\.be)",
+    re.IGNORECASE,
+)
+
+_PLATFORM_DOWNLOADERS = {
+    "tiktok": download_tiktok,
+    "instagram": download_instagram,
+    "twitter": download_twitter,
+    "youtube": download_youtube,
+}
+
+
+def detect_platform(url: str) -> Optional[str]:
+    """Get the platform name ('tiktok', 'instagram', 'twitter', 'youtube') for a URL, or None."""
+    platform = _PLATFORM_RE.search(url)
+    return platform.lastgroup if platform else None
+
+
+def download_url(url: str) -> Optional[str]:
     """
-    Download media from URL and process it with AI.
+    Download media (or page content via Jina Reader) from a URL without processing it.
     
     Args:
         url: URL to download from
         
     Returns:
-        Tuple of (downloaded_file_path, topic_path, summary_path, processor_used)
+        Path to the downloaded file, or None on failure
     """
-    url_lower = url.lower()
-    downloaded_file = None
-    
     # Download based on platform
-    if "tiktok.com" in url_lower or "vm.tiktok.com" in url_lower:
-        downloaded_file = download_tiktok(url)
-    elif "instagram.com" in url_lower:
-        downloaded_file = download_instagram(url)
-    elif "twitter.com" in url_lower or "x.com" in url_lower:
-        downloaded_file = download_twitter(url)
-    elif "youtube.com" in url_lower or "youtu.be" in url_lower:
-        downloaded_file = download_youtube(url)
+    platform = detect_platform(url)
+    if platform:
+        return _PLATFORM_DOWNLOADERS[platform](url)
     else:
         # Generic URL - Try Jina Reader
         logger.info(f"Generic URL detected. Attempting to fetch content via Jina Reader...")
         jina_content = process_url_with_jina(url)
         
         if jina_content:
-             out_dir = get_output_dir("jina_content")
+             out_dir = get_url_output_dir("jina", url)
              filename = out_dir / "url_content.md"
              with open(filename, "w", encoding="utf-8") as f:
                  f.write(jina_content)
-             downloaded_file = str(filename)
              logger.info(f"[OK] Jina content saved: {filename}")
+             return str(filename)
         else:
              logger.error("Unsupported URL and Jina Reader failed.")
-             return None, None, None, None
+             return None
+
+
+def download_and_process(url: str) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+    """
+    Download media from URL and process it with AI.
     
+    Args:
+        url: URL to download from
+        
+    Returns:
+        Tuple of (downloaded_file_path, topic_path, summary_path, processor_used)
+    """
+    downloaded_file = download_url(url)
     if not downloaded_file:
         return None, None, None, None
     
@@ -699,22 +1130,23 @@ Examples:
     print(f"Video Processor: {VIDEO_PROCESSOR.upper()} (set VIDEO_PROCESSOR env var to change)")
     print()
     
-    # Check AI service availability
-    overshoot_status = check_overshoot_status()
-    gemini_status = check_gemini_availability()
-    
-    print("Service Status:")
-    if gemini_status['available']:
-        print("  [OK] Gemini API: Ready (primary for videos)")
-    else:
-        print(f"  [X] Gemini API: {gemini_status['message']}")
-    
-    if overshoot_status['available']:
-        print("  [OK] Overshoot AI: Ready (alternative, requires open network)")
-    else:
-        print(f"  [--] Overshoot AI: {overshoot_status['message']} (optional)")
-    
-    print()
+    # Check AI service availability (local-file runs go straight to processing)
+    if not args.process_only and not args.input:
+        overshoot_status = check_overshoot_status()
+        gemini_status = check_gemini_availability()
+        
+        print("Service Status:")
+        if gemini_status['available']:
+            print("  [OK] Gemini API: Ready (primary for videos)")
+        else:
+            print(f"  [X] Gemini API: {gemini_status['message']}")
+        
+        if overshoot_status['available']:
+            print("  [OK] Overshoot AI: Ready (alternative, requires open network)")
+        else:
+            print(f"  [--] Overshoot AI: {overshoot_status['message']} (optional)")
+        
+        print()
     
     # Process based on arguments
     if args.process_only:
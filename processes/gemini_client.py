@@ -27,7 +27,8 @@ SCRIPT_DIR = Path(__file__).parent
 load_dotenv(SCRIPT_DIR / '.env')
 
 # Setup logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+from log_format import configure_logging
+configure_logging()
 logger = logging.getLogger(__name__)
 
 # Try to import google-generativeai
@@ -0,0 +1,54 @@
+"""
+Logging Setup Module
+Shared root-logger configuration for the processes scripts.
+
+Whichever script module is imported first configures the root logger, so
+they all go through configure_logging() to get the same cheap formatter.
+"""
+
+import logging
+import time
+from typing import Optional
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# None of the formats use thread/process fields; skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that runs strftime at most once per second.
+    
+    Records within the same second reuse the formatted timestamp; only the
+    milliseconds (when no datefmt is given) are filled in per record.
+    """
+    
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        super().__init__(fmt, datefmt)
+        self._cached = (None, '')
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, text = self._cached
+        if second != cached_second:
+            text = time.strftime(datefmt or self.default_time_format, self.converter(second))
+            self._cached = (second, text)
+        if datefmt:
+            return text
+        return self.default_msec_format % (text, record.msecs)
+
+
+def configure_logging(datefmt: Optional[str] = None, level: int = logging.INFO) -> None:
+    """
+    Configure the root logger with CachedTimeFormatter, unless already configured.
+    
+    Args:
+        datefmt: strftime format for timestamps (default: ISO date and time with milliseconds)
+        level: Root log level
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(CachedTimeFormatter(LOG_FORMAT, datefmt))
+    logging.basicConfig(level=level, handlers=[handler])
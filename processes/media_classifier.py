@@ -1,10 +1,13 @@
 """
 Media Classifier Module
 Detects whether a file is a video or non-video based on MIME type and extension.
+
+Classification is filename-based and never touches the disk; callers that
+need the file to exist check that once upstream.
 """
 
 import os
-import mimetypes
+from typing import Optional
 
 # Video file extensions
 VIDEO_EXTENSIONS = {
@@ -15,13 +18,81 @@ VIDEO_EXTENSIONS = {
 # Video MIME type prefixes
 VIDEO_MIME_PREFIXES = ('video/',)
 
+# Extension-based fallbacks for non-video types
+TEXT_EXTENSIONS = {'.txt', '.md', '.json', '.csv', '.xml', '.html', '.htm', '.log', '.yaml', '.yml'}
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.svg', '.ico'}
+
+# MIME types for the closed set of extensions this pipeline handles; a dict
+# lookup replaces mimetypes.guess_type and its platform-dependent database
+EXT_TO_MIME = {
+    # Video
+    '.mp4': 'video/mp4',
+    '.m4v': 'video/mp4',
+    '.mov': 'video/quicktime',
+    '.mkv': 'video/x-matroska',
+    '.webm': 'video/webm',
+    '.avi': 'video/x-msvideo',
+    '.wmv': 'video/x-ms-wmv',
+    '.flv': 'video/x-flv',
+    '.3gp': 'video/3gpp',
+    '.mpeg': 'video/mpeg',
+    '.mpg': 'video/mpeg',
+    '.ogv': 'video/ogg',
+    # Image
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.bmp': 'image/bmp',
+    '.svg': 'image/svg+xml',
+    '.ico': 'image/vnd.microsoft.icon',
+    # Documents and text
+    '.pdf': 'application/pdf',
+    '.txt': 'text/plain',
+    '.md': 'text/markdown',
+    '.json': 'application/json',
+    '.csv': 'text/csv',
+    '.xml': 'application/xml',
+    '.html': 'text/html',
+    '.htm': 'text/html',
+    '.log': 'text/plain',
+    '.yaml': 'application/yaml',
+    '.yml': 'application/yaml',
+}
+
+# File kind per extension
+_EXT_TO_KIND = {
+    '.pdf': 'pdf',
+    **dict.fromkeys(TEXT_EXTENSIONS, 'text'),
+    **dict.fromkeys(IMAGE_EXTENSIONS, 'image'),
+    **dict.fromkeys(VIDEO_EXTENSIONS, 'video'),
+}
+
+
+def _extension(file_path: str) -> str:
+    """Get the lowercased extension of a path, including the dot."""
+    _, dot, tail = file_path.rpartition('.')
+    # A separator after the last dot means the dot belongs to a directory name
+    if not dot or '/' in tail or os.sep in tail:
+        return ''
+    return '.' + tail.lower()
+
+
+def _is_video_from(mime_type: Optional[str], ext: str) -> bool:
+    """Decide video-ness from an already-extracted MIME type and extension."""
+    if mime_type:
+        return mime_type.startswith(VIDEO_MIME_PREFIXES)
+    return ext in VIDEO_EXTENSIONS
+
 
 def is_video(file_path: str) -> bool:
     """
     Determine if a file is a video.
     
-    Uses MIME type detection (preferred) with file extension fallback.
-    If ambiguous, defaults to False (not a video).
+    Looks the extension up in a static MIME table. If ambiguous, defaults
+    to False (not a video). Only the name is inspected; the file need not
+    exist.
     
     Args:
         file_path: Path to the file to check
@@ -29,29 +100,17 @@ def is_video(file_path: str) -> bool:
     Returns:
         True if the file is a video, False otherwise
     """
-    if not file_path or not os.path.exists(file_path):
+    if not file_path:
         return False
     
-    # Method 1: Try MIME type detection
-    mime_type, _ = mimetypes.guess_type(file_path)
-    if mime_type:
-        if mime_type.startswith(VIDEO_MIME_PREFIXES):
-            return True
-        # If MIME type is detected but not video, return False
-        return False
-    
-    # Method 2: Fallback to extension check
-    _, ext = os.path.splitext(file_path)
-    if ext.lower() in VIDEO_EXTENSIONS:
-        return True
-    
     # Default: not a video if ambiguous
-    return False
+    ext = _extension(file_path)
+    return _is_video_from(EXT_TO_MIME.get(ext), ext)
 
 
 def get_file_type(file_path: str) -> str:
     """
-    Get a descriptive file type for the given file.
+    Get a descriptive file type for the given file, from its name alone.
     
     Args:
         file_path: Path to the file
@@ -59,38 +118,10 @@ def get_file_type(file_path: str) -> str:
     Returns:
         String describing the file type (e.g., 'video', 'image', 'pdf', 'text', 'unknown')
     """
-    if not file_path or not os.path.exists(file_path):
+    if not file_path:
         return 'unknown'
     
-    mime_type, _ = mimetypes.guess_type(file_path)
-    _, ext = os.path.splitext(file_path)
-    ext = ext.lower()
-    
-    # Check video first
-    if is_video(file_path):
-        return 'video'
-    
-    # Check other types
-    if mime_type:
-        if mime_type.startswith('image/'):
-            return 'image'
-        if mime_type == 'application/pdf':
-            return 'pdf'
-        if mime_type.startswith('text/') or mime_type in ('application/json', 'application/xml'):
-            return 'text'
-    
-    # Extension-based fallback
-    text_extensions = {'.txt', '.md', '.json', '.csv', '.xml', '.html', '.htm', '.log', '.yaml', '.yml'}
-    image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.svg', '.ico'}
-    
-    if ext == '.pdf':
-        return 'pdf'
-    if ext in text_extensions:
-        return 'text'
-    if ext in image_extensions:
-        return 'image'
-    
-    return 'unknown'
+    return _EXT_TO_KIND.get(_extension(file_path), 'unknown')
 
 
 def get_mime_type(file_path: str) -> str:
@@ -103,8 +134,7 @@ def get_mime_type(file_path: str) -> str:
     Returns:
         MIME type string or 'application/octet-stream' if unknown
     """
-    mime_type, _ = mimetypes.guess_type(file_path)
-    return mime_type or 'application/octet-stream'
+    return EXT_TO_MIME.get(_extension(file_path), 'application/octet-stream')
 
 
 if __name__ == "__main__":
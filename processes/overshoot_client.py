@@ -15,40 +15,99 @@ Based on Overshoot SDK documentation:
 GitHub: https://github.com/Overshoot-ai/overshoot-js-sdk
 
 This implementation uses Puppeteer to run the SDK in a real browser
-for reliable WebRTC video streaming.
+for reliable WebRTC video streaming. One Node worker (overshoot_worker.cjs)
+keeps the browser warm across videos.
 
 Environment Variables Required:
 - OVERSHOOT_API_KEY: Your Overshoot AI API key
+
+Optional:
+- STASH_FAST_PATH=1: Use a downloaded caption as topic/summary when one is
+  long enough, skipping the browser analysis
 """
 
 import os
+import re
+import atexit
+import hashlib
 import logging
+import mmap
+import queue
+import shutil
+import signal
 import subprocess
+import threading
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Optional
 
 from dotenv import load_dotenv
 
+from log_format import configure_logging
+
 SCRIPT_DIR = Path(__file__).parent
 load_dotenv(SCRIPT_DIR / '.env')
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+configure_logging()
 logger = logging.getLogger(__name__)
 
-OVERSHOOT_AVAILABLE = False
+ROOT_DIR = SCRIPT_DIR.parent
+WORKER_SCRIPT = SCRIPT_DIR / 'overshoot_worker.cjs'
+
+# Seconds to wait for one video's analysis before giving up
+ANALYSIS_TIMEOUT = 180
+
+ANALYSIS_PROMPT = 'First provide a 1-3 word topic label. Then describe what happens in this video.'
 
-try:
-    node_result = subprocess.run(['node', '--version'], capture_output=True, text=True, timeout=5)
-    if node_result.returncode == 0:
-        root_dir = Path(__file__).parent.parent
-        sdk_path = root_dir / 'node_modules' / '@overshoot' / 'sdk'
-        puppeteer_path = root_dir / 'node_modules' / 'puppeteer'
-        if sdk_path.exists() and puppeteer_path.exists():
-            OVERSHOOT_AVAILABLE = True
-            logger.info(f"Overshoot SDK found. Node.js version: {node_result.stdout.strip()}")
-except Exception as e:
-    logger.warning(f"Error checking dependencies: {e}")
+# Results keyed by video content (and prompt), so re-runs skip the browser entirely
+CACHE_DIR = SCRIPT_DIR / 'outputs' / '.cache' / 'overshoot'
+HASH_CHUNK_SIZE = 1 << 20
+
+# Fast path: with STASH_FAST_PATH=1, a caption saved next to the video by the
+# downloader stands in for the browser analysis when it is long enough
+FAST_PATH_ENABLED = os.environ.get('STASH_FAST_PATH') == '1'
+FAST_PATH_CAPTION_FILES = ('caption.txt', 'youtube_captions.txt')
+FAST_PATH_MIN_CHARS = 200
+FAST_PATH_MAX_SUMMARY_CHARS = 2000
+_WORD_RE = re.compile(r"[A-Za-z][A-Za-z0-9'-]*")
+_STOPWORDS = frozenset(
+    "the and for with this that from your you our are was were have has had "
+    "not but all can will just out about into what when how who its it's "
+    "they them their there here been being more most some than then very".split()
+)
+
+@lru_cache(maxsize=1)
+def is_overshoot_available() -> bool:
+    """
+    Check (once per process) that Node.js, the Overshoot SDK and Puppeteer are installed.
+    
+    Runs on first use rather than at import, so importing this module never
+    spawns a process; the node_modules checks come first so a missing SDK
+    skips the node probe entirely.
+    """
+    sdk_path = ROOT_DIR / 'node_modules' / '@overshoot' / 'sdk'
+    puppeteer_path = ROOT_DIR / 'node_modules' / 'puppeteer'
+    if not sdk_path.exists() or not puppeteer_path.exists():
+        return False
+    
+    try:
+        node_result = subprocess.run(['node', '--version'], capture_output=True, text=True, timeout=5)
+    except Exception as e:
+        logger.warning(f"Error checking dependencies: {e}")
+        return False
+    if node_result.returncode != 0:
+        return False
+    
+    logger.info(f"Overshoot SDK found. Node.js version: {node_result.stdout.strip()}")
+    return True
+
+
+def __getattr__(name: str) -> Any:
+    # OVERSHOOT_AVAILABLE is computed on first access
+    if name == 'OVERSHOOT_AVAILABLE':
+        return is_overshoot_available()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _get_api_key() -> str:
@@ -63,12 +122,13 @@ def _get_api_url() -> str:
 
 
 def check_overshoot_status() -> Dict[str, Any]:
+    available = is_overshoot_available()
     return {
-        'available': OVERSHOOT_AVAILABLE,
-        'sdk_installed': OVERSHOOT_AVAILABLE,
+        'available': available,
+        'sdk_installed': available,
         'puppeteer_installed': True,
         'api_key_set': bool(os.environ.get('OVERSHOOT_API_KEY')),
-        'message': 'Ready' if (OVERSHOOT_AVAILABLE and os.environ.get('OVERSHOOT_API_KEY')) else 'Missing dependencies'
+        'message': 'Ready' if (available and os.environ.get('OVERSHOOT_API_KEY')) else 'Missing dependencies'
     }
 
 
@@ -78,9 +138,6 @@ def process_video_with_overshoot(video_path: str, out_dir: str) -> Tuple[str, st
     
     Based on: https://docs.overshoot.ai/getting-started#using-a-video-file
     """
-    api_key = _get_api_key()
-    api_url = _get_api_url()
-    
     out_path = Path(out_dir).absolute()
     out_path.mkdir(parents=True, exist_ok=True)
     
@@ -91,305 +148,342 @@ def process_video_with_overshoot(video_path: str, out_dir: str) -> Tuple[str, st
     if not video_path_obj.exists():
         raise FileNotFoundError(f"Video not found: {video_path_obj}")
     
+    if FAST_PATH_ENABLED and _fast_path(video_path_obj, topic_path, summary_path):
+        return str(topic_path), str(summary_path)
+    
+    if not is_overshoot_available():
+        raise RuntimeError("Overshoot dependencies missing (Node.js, @overshoot/sdk, puppeteer)")
+    
+    api_key = _get_api_key()
+    api_url = _get_api_url()
+    
+    cache_key = _video_cache_key(video_path_obj)
+    if _restore_cached_result(cache_key, topic_path, summary_path):
+        return str(topic_path), str(summary_path)
+    
     try:
         logger.info(f"Processing video with Overshoot AI: {video_path_obj}")
-        return _run_with_puppeteer(str(video_path_obj), str(out_path), api_key, api_url, topic_path, summary_path)
+        result = _run_with_puppeteer(str(video_path_obj), str(out_path), api_key, api_url, topic_path, summary_path)
+        _store_cached_result(cache_key, topic_path, summary_path)
+        return result
     except Exception as e:
         logger.error(f"Overshoot error: {e}")
-        with open(topic_path, 'w') as f:
-            f.write("Error")
-        with open(summary_path, 'w') as f:
-            f.write(f"Failed: {e}")
+        topic_path.write_text("Error", encoding='utf-8')
+        summary_path.write_text(f"Failed: {e}", encoding='utf-8')
         raise
 
 
-def _run_with_puppeteer(video_path: str, out_dir: str, api_key: str, api_url: str,
-                        topic_path: Path, summary_path: Path) -> Tuple[str, str]:
+# ============================================
+# Caption Fast Path
+# ============================================
+
+def _fast_path(video_path: Path, topic_path: Path, summary_path: Path) -> bool:
     """
-    Run Overshoot SDK in a real browser using Puppeteer.
+    Derive topic/summary from a caption saved next to the video.
+    
+    Returns:
+        True if the files were written; False if there is no caption or it is
+        too short to stand in for the video analysis
     """
-    root_dir = Path(__file__).parent.parent
-    out_path = Path(out_dir)
+    for name in FAST_PATH_CAPTION_FILES:
+        caption_path = video_path.parent / name
+        if caption_path.exists():
+            break
+    else:
+        return False
     
-    # Create HTML file for the browser
-    html_path = _create_html_file(out_path, video_path, api_key, api_url)
+    try:
+        caption = ' '.join(caption_path.read_text(encoding='utf-8', errors='replace').split())
+    except OSError:
+        return False
+    if len(caption) < FAST_PATH_MIN_CHARS:
+        return False
     
-    # Create Puppeteer runner script
-    script_path = _create_puppeteer_script(out_path, html_path, topic_path, summary_path)
+    words = [w for w in _WORD_RE.findall(caption) if len(w) > 2 and w.lower() not in _STOPWORDS]
+    if not words:
+        return False
     
-    logger.info("Running Overshoot via Puppeteer...")
+    summary = caption
+    if len(summary) > FAST_PATH_MAX_SUMMARY_CHARS:
+        summary = summary[:FAST_PATH_MAX_SUMMARY_CHARS].rsplit(' ', 1)[0] + '...'
     
+    topic_path.write_text(' '.join(words[:3]), encoding='utf-8')
+    summary_path.write_text(summary, encoding='utf-8')
+    logger.info(f"[OK] Using caption instead of Overshoot analysis: {caption_path}")
+    return True
+
+
+# ============================================
+# Result Cache
+# ============================================
+
+def _video_cache_key(video_path: Path) -> str:
+    """
+    Hash a video's bytes and the analysis prompt into a cache key.
+    
+    The file is mapped rather than read, so hashing copies nothing into
+    Python and runs in one call with the GIL released.
+    """
+    digest = hashlib.blake2b(ANALYSIS_PROMPT.encode('utf-8'), digest_size=16)
+    with open(video_path, 'rb') as f:
+        fd = f.fileno()
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        try:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+        except ValueError:
+            # Empty file: nothing to map or hash
+            pass
+        except OSError:
+            # Not mappable (e.g. some network filesystems): read in chunks
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _restore_cached_result(cache_key: str, topic_path: Path, summary_path: Path) -> bool:
+    """Copy a cached topic/summary pair into place; False on a cache miss."""
+    cached = CACHE_DIR / cache_key
+    cached_topic = cached / 'topic.txt'
+    cached_summary = cached / 'summary.txt'
+    if not cached_topic.exists() or not cached_summary.exists():
+        return False
     try:
-        result = subprocess.run(
-            ['node', str(script_path)],
-            cwd=str(root_dir),
-            capture_output=True,
-            text=True,
-            timeout=180  # 3 minute timeout
-        )
-        
-        for line in (result.stdout or '').strip().split('\n'):
-            if line.strip():
-                logger.info(f"[Overshoot] {line}")
-        
-        for line in (result.stderr or '').strip().split('\n'):
-            if line.strip() and not line.startswith('DevTools'):
-                logger.warning(f"[Overshoot] {line}")
-        
-        if result.returncode != 0:
-            raise RuntimeError(f"Overshoot failed with code {result.returncode}")
-        
-        # Verify results were saved
-        if not topic_path.exists() or not summary_path.exists():
-            raise RuntimeError("Results files not created")
-        
-        return str(topic_path), str(summary_path)
-        
-    finally:
-        # Cleanup temp files
-        for f in [script_path, html_path]:
-            try:
-                f.unlink()
-            except:
-                pass
+        shutil.copyfile(cached_topic, topic_path)
+        shutil.copyfile(cached_summary, summary_path)
+    except OSError as e:
+        logger.warning(f"Failed to restore cached Overshoot result: {e}")
+        return False
+    logger.info(f"[OK] Using cached Overshoot result for {cache_key}")
+    return True
+
+
+def _store_cached_result(cache_key: str, topic_path: Path, summary_path: Path) -> None:
+    """Add a topic/summary pair to the cache, each file swapped in atomically."""
+    cached = CACHE_DIR / cache_key
+    try:
+        cached.mkdir(parents=True, exist_ok=True)
+        # Topic last: a lookup only hits once both files are in place
+        for src, name in ((summary_path, 'summary.txt'), (topic_path, 'topic.txt')):
+            partial = cached / f"{name}.part"
+            shutil.copyfile(src, partial)
+            os.replace(partial, cached / name)
+    except OSError as e:
+        logger.warning(f"Failed to cache Overshoot result: {e}")
 
 
-def _create_html_file(out_path: Path, video_path: str, api_key: str, api_url: str) -> Path:
-    """Create HTML file that runs the Overshoot SDK."""
+# ============================================
+# Persistent Puppeteer Worker
+# ============================================
+
+class _PuppeteerWorker:
+    """
+    Long-lived Node process that keeps one Chromium instance warm.
     
-    # Convert video path to file:// URL
-    video_url = Path(video_path).as_uri()
-    video_name = Path(video_path).name
+    Jobs are sent as JSON lines on the worker's stdin; each opens a fresh
+    page in the shared browser. Results come back as JSON lines tagged with
+    the job id, so several jobs can be in flight at once. The worker is
+    (re)started on demand if it has exited.
     
-    html_content = f'''<!DOCTYPE html>
-<html>
-<head>
-    <title>Overshoot Video Analysis</title>
-</head>
-<body>
-    <h1>Analyzing Video...</h1>
-    <div id="status">Initializing...</div>
-    <div id="results"></div>
+    Reader threads drain stdout and stderr as the worker writes them, so
+    progress is logged live, memory stays flat, and a failed or exited
+    worker wakes its waiting jobs immediately.
+    """
     
-    <script type="module">
-        // Results storage
-        window.analysisResults = {{
-            topics: [],
-            summaries: [],
-            count: 0,
-            error: null,
-            done: false
-        }};
+    def __init__(self):
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._pending: Dict[int, Tuple[subprocess.Popen, queue.Queue]] = {}
+        self._next_id = 0
+    
+    def _ensure_started(self) -> subprocess.Popen:
+        """Start the worker process if it isn't running. Caller holds the lock."""
+        if self._proc is not None:
+            if self._proc.poll() is None:
+                return self._proc
+            # A crashed worker may have left its browser running
+            _kill_process_group(self._proc)
         
-        const status = document.getElementById('status');
-        const resultsDiv = document.getElementById('results');
+        logger.info("Starting Overshoot browser worker...")
+        proc = subprocess.Popen(
+            ['node', str(WORKER_SCRIPT)],
+            cwd=str(ROOT_DIR),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            # Node writes UTF-8; the locale codec could choke on a summary and kill the reader
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1,
+            # Own process group, so Ctrl-C in the terminal doesn't kill the worker
+            # before it can close Chromium, and the whole tree can be killed at once
+            start_new_session=(os.name == 'posix')
+        )
+        threading.Thread(target=self._read_stdout, args=(proc,), name="overshoot-stdout", daemon=True).start()
+        threading.Thread(target=self._read_stderr, args=(proc,), name="overshoot-stderr", daemon=True).start()
+        self._proc = proc
+        return proc
+    
+    def _read_stdout(self, proc: subprocess.Popen) -> None:
+        """Relay worker log lines and hand job results to their waiters."""
+        for line in proc.stdout:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                text = line.rstrip()
+                if text:
+                    logger.info("[Overshoot] %s", text)
+                continue
+            
+            if 'status' in message:
+                waiter = self._pending.get(message.get('id'))
+                if waiter is not None:
+                    waiter[1].put(message)
+            elif 'warn' in message:
+                logger.warning("[Overshoot] %s", message['warn'])
+            elif 'log' in message:
+                # May hold several lines the worker batched together
+                logger.info("[Overshoot] %s", message['log'])
         
-        function log(msg) {{
-            console.log('[Overshoot] ' + msg);
-            status.textContent = msg;
-        }}
+        # The worker exited: fail whatever it was still running
+        for waiter_proc, results in list(self._pending.values()):
+            if waiter_proc is proc:
+                results.put({'status': 'error', 'error': f"worker exited with code {proc.wait()}"})
+    
+    def _read_stderr(self, proc: subprocess.Popen) -> None:
+        for line in proc.stderr:
+            text = line.rstrip()
+            if text and not text.startswith('DevTools'):
+                logger.warning("[Overshoot] %s", text)
+    
+    def run(self, config: Dict[str, Any], video_path: str, topic_path: Path, summary_path: Path,
+            timeout: float = ANALYSIS_TIMEOUT) -> None:
+        """
+        Analyze one video and wait for topic/summary files to be written.
+        
+        Args:
+            config: Settings for the analysis page (apiUrl, apiKey, prompt)
+            video_path: Video to attach to the page's file input
+            topic_path: Where the worker writes the topic
+            summary_path: Where the worker writes the summary
+            timeout: Seconds to wait for the result
+            
+        Raises:
+            RuntimeError: If the analysis failed or timed out
+        """
+        results: queue.Queue = queue.Queue()
+        with self._lock:
+            proc = self._ensure_started()
+            self._next_id += 1
+            job_id = self._next_id
+            self._pending[job_id] = (proc, results)
+            job = {
+                'id': job_id,
+                'config': config,
+                'videoPath': video_path,
+                'topicPath': str(topic_path),
+                'summaryPath': str(summary_path)
+            }
+            try:
+                proc.stdin.write(json.dumps(job) + '\n')
+                proc.stdin.flush()
+            except OSError:
+                self._pending.pop(job_id, None)
+                raise RuntimeError("Overshoot worker is not accepting jobs")
         
-        async function analyzeVideo() {{
-            try {{
-                log('Loading SDK...');
-                
-                // Import SDK from CDN
-                const {{ RealtimeVision }} = await import('https://cdn.jsdelivr.net/npm/@overshoot/sdk@latest/dist/index.mjs');
-                
-                log('Fetching video file...');
-                
-                // Fetch video and create File object
-                const response = await fetch('{video_url}');
-                if (!response.ok) throw new Error('Failed to fetch video: ' + response.status);
-                
-                const blob = await response.blob();
-                const videoFile = new File([blob], '{video_name}', {{ type: 'video/mp4' }});
-                
-                log('Video file created: ' + videoFile.size + ' bytes');
-                
-                // Create RealtimeVision with File source
-                log('Creating RealtimeVision...');
-                
-                const vision = new RealtimeVision({{
-                    apiUrl: '{api_url}',
-                    apiKey: '{api_key}',
-                    prompt: 'First provide a 1-3 word topic label. Then describe what happens in this video.',
-                    debug: true,
-                    
-                    source: {{
-                        type: 'video',
-                        file: videoFile
-                    }},
-                    
-                    onResult: (r) => {{
-                        window.analysisResults.count++;
-                        log('Result #' + window.analysisResults.count + ': ' + (r.result ? r.result.substring(0, 50) + '...' : '(empty)'));
-                        
-                        if (r.result) {{
-                            resultsDiv.innerHTML += '<p>' + r.result + '</p>';
-                            
-                            if (window.analysisResults.topics.length === 0) {{
-                                window.analysisResults.topics.push(r.result.split('.')[0].trim());
-                            }}
-                            window.analysisResults.summaries.push(r.result);
-                        }}
-                    }},
-                    
-                    onError: (e) => {{
-                        console.error('[Overshoot] SDK Error:', e);
-                        window.analysisResults.error = e.message || String(e);
-                        log('Error: ' + window.analysisResults.error);
-                    }},
-                    
-                    onEnd: () => {{
-                        log('Analysis complete. Total results: ' + window.analysisResults.count);
-                        window.analysisResults.done = true;
-                    }}
-                }});
-                
-                // Start analysis
-                log('Starting analysis...');
-                await vision.start();
-                log('Stream started - waiting for results...');
-                
-                // Wait for onEnd callback or timeout (video duration + 60s buffer)
-                await new Promise((resolve) => {{
-                    const checkDone = setInterval(() => {{
-                        if (window.analysisResults.done) {{
-                            clearInterval(checkDone);
-                            resolve();
-                        }}
-                    }}, 500);
-                    
-                    // Timeout after 90 seconds
-                    setTimeout(() => {{
-                        clearInterval(checkDone);
-                        log('Timeout reached');
-                        window.analysisResults.done = true;
-                        resolve();
-                    }}, 90000);
-                }});
-                
-                // Stop vision
-                try {{
-                    vision.stop();
-                    log('Vision stopped');
-                }} catch(e) {{}}
-                
-                log('Done! Results: ' + window.analysisResults.count);
-                
-            }} catch (err) {{
-                console.error('[Overshoot] Analysis failed:', err);
-                window.analysisResults.error = err.message || String(err);
-                window.analysisResults.done = true;
-                log('Failed: ' + err.message);
-            }}
-        }}
+        try:
+            result = results.get(timeout=timeout)
+        except queue.Empty:
+            # Close just this job's page; other jobs share the browser
+            self._send(proc, {'cmd': 'cancel', 'id': job_id})
+            raise RuntimeError(f"Overshoot timed out after {timeout}s")
+        finally:
+            self._pending.pop(job_id, None)
         
-        // Start analysis
-        analyzeVideo();
-    </script>
-</body>
-</html>'''
+        if result.get('status') != 'ok':
+            raise RuntimeError(f"Overshoot failed: {result.get('error', 'unknown error')}")
     
-    html_path = out_path / "overshoot_analysis.html"
-    with open(html_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    def _send(self, proc: subprocess.Popen, message: Dict[str, Any]) -> None:
+        """Write a command to a worker, ignoring one that has exited."""
+        with self._lock:
+            if proc.poll() is not None:
+                return
+            try:
+                proc.stdin.write(json.dumps(message) + '\n')
+                proc.stdin.flush()
+            except OSError:
+                pass
     
-    return html_path
+    def shutdown(self) -> None:
+        """Ask the worker to close its browser and exit, killing it if it doesn't."""
+        with self._lock:
+            proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        
+        if proc.poll() is None:
+            try:
+                proc.stdin.write(json.dumps({'cmd': 'quit'}) + '\n')
+                proc.stdin.flush()
+            except OSError:
+                pass
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+        
+        # Chromium outlives a killed or crashed Node process; take it down too
+        _kill_process_group(proc)
 
 
-def _create_puppeteer_script(out_path: Path, html_path: Path, topic_path: Path, summary_path: Path) -> Path:
-    """Create Node.js script to run Puppeteer."""
-    
-    html_url = html_path.as_uri()
-    topic_js = str(topic_path).replace('\\', '/')
-    summary_js = str(summary_path).replace('\\', '/')
-    
-    script_content = f'''
-const puppeteer = require('puppeteer');
-const fs = require('fs');
+def _kill_process_group(proc: subprocess.Popen) -> None:
+    """Kill whatever is left in the worker's process group (POSIX only)."""
+    if os.name != 'posix':
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+_puppeteer_worker: Optional[_PuppeteerWorker] = None
+_puppeteer_worker_lock = threading.Lock()
+
 
-async function main() {{
-    console.log('Launching browser...');
+def _get_puppeteer_worker() -> _PuppeteerWorker:
+    """Get the shared Puppeteer worker, registering its shutdown at exit."""
+    global _puppeteer_worker
+    if _puppeteer_worker is None:
+        with _puppeteer_worker_lock:
+            if _puppeteer_worker is None:
+                _puppeteer_worker = _PuppeteerWorker()
+                atexit.register(_puppeteer_worker.shutdown)
+    return _puppeteer_worker
+
+
+def _run_with_puppeteer(video_path: str, out_dir: str, api_key: str, api_url: str,
+                        topic_path: Path, summary_path: Path) -> Tuple[str, str]:
+    """
+    Run Overshoot SDK in a real browser using the persistent Puppeteer worker.
     
-    const browser = await puppeteer.launch({{
-        headless: 'new',
-        args: [
-            '--no-sandbox',
-            '--disable-setuid-sandbox',
-            '--autoplay-policy=no-user-gesture-required',
-            '--disable-web-security',
-            '--allow-file-access-from-files',
-            '--use-fake-ui-for-media-stream',
-            '--use-fake-device-for-media-stream'
-        ]
-    }});
+    The worker renders overshoot_analysis.html from memory with this job's
+    settings, so nothing is written to disk besides the results.
+    """
+    config = {
+        'apiUrl': api_url,
+        'apiKey': api_key,
+        'prompt': ANALYSIS_PROMPT
+    }
     
-    try {{
-        const page = await browser.newPage();
-        
-        // Enable console logging
-        page.on('console', msg => {{
-            const text = msg.text();
-            if (text.includes('[Overshoot]') || text.includes('[RealtimeVision]')) {{
-                console.log(text);
-            }}
-        }});
-        
-        page.on('pageerror', err => {{
-            console.error('Page error:', err.message);
-        }});
-        
-        console.log('Navigating to analysis page...');
-        await page.goto('{html_url}', {{
-            waitUntil: 'networkidle0',
-            timeout: 60000
-        }});
-        
-        console.log('Waiting for analysis to complete...');
-        
-        // Wait for analysis to complete (max 2 minutes)
-        await page.waitForFunction(
-            () => window.analysisResults && window.analysisResults.done === true,
-            {{ timeout: 120000, polling: 1000 }}
-        );
-        
-        // Get results
-        const results = await page.evaluate(() => window.analysisResults);
-        
-        console.log('Analysis complete!');
-        console.log('Results count:', results.count);
-        
-        // Process topic
-        let topic = results.topics[0] || 'Unknown';
-        topic = topic.replace(/[^a-zA-Z0-9\\s-]/g, '').trim();
-        topic = topic.split(/\\s+/).slice(0, 3).join(' ') || 'Unknown';
-        
-        // Process summary
-        const summary = results.summaries.join('\\n\\n') || 'Unable to generate summary.';
-        
-        // Save results
-        fs.writeFileSync('{topic_js}', topic);
-        fs.writeFileSync('{summary_js}', summary);
-        
-        console.log('Topic:', topic);
-        console.log('Summary length:', summary.length, 'chars');
-        console.log('Results saved!');
-        
-    }} finally {{
-        await browser.close();
-    }}
-}}
-
-main().catch(err => {{
-    console.error('Fatal error:', err);
-    process.exit(1);
-}});
-'''
+    logger.info("Running Overshoot via Puppeteer...")
+    
+    _get_puppeteer_worker().run(config, video_path, topic_path, summary_path)
     
-    script_path = out_path / "overshoot_runner.cjs"
-    with open(script_path, 'w', encoding='utf-8') as f:
-        f.write(script_content)
+    # Verify results were saved
+    if not topic_path.exists() or not summary_path.exists():
+        raise RuntimeError("Results files not created")
     
-    return script_path
+    return str(topic_path), str(summary_path)
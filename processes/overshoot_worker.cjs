@@ -0,0 +1,304 @@
+/**
+ * Persistent Overshoot Worker
+ *
+ * Launches Chromium once and runs one analysis page per job, so batch
+ * workflows pay the browser startup cost a single time.
+ *
+ * Protocol (newline-delimited JSON):
+ * - stdin:  {"id": 1, "config": {...}, "videoPath": "...", "topicPath": "...", "summaryPath": "..."}
+ *           {"cmd": "cancel", "id": 1} closes that job's page, leaving other jobs running
+ *           {"cmd": "quit"}
+ * - stdout: {"id": 1, "log": "..."} / {"id": 1, "warn": "..."} progress lines,
+ *           then {"id": 1, "status": "ok"} or {"id": 1, "status": "error", "error": "..."}
+ *
+ * Each job renders overshoot_analysis.html (read once at startup) with its
+ * config object substituted in, so no per-job files are written. The page's
+ * SDK import is answered from the local node_modules copy when installed.
+ *
+ * Started and fed by overshoot_client.py.
+ */
+
+const puppeteer = require('puppeteer');
+const fs = require('fs');
+const path = require('path');
+const readline = require('readline');
+
+const STARTUP_TIMEOUT_MS = 60000;
+const ANALYSIS_TIMEOUT_MS = 120000;
+const BROWSER_CLOSE_TIMEOUT_MS = 5000;
+
+// Topic words: letters, digits and hyphens; apostrophes are dropped ("Chef's" -> "Chefs")
+const TOPIC_WORD_RE = /[a-zA-Z0-9-]+(?:'[a-zA-Z0-9-]+)*/g;
+const APOSTROPHE_RE = /'/g;
+
+const ANALYSIS_PAGE = fs.readFileSync(path.join(__dirname, 'overshoot_analysis.html'), 'utf8');
+
+// The page imports the SDK from this CDN prefix; serve those files locally
+const SDK_CDN_PREFIX = 'https://cdn.jsdelivr.net/npm/@overshoot/sdk@latest/';
+const SDK_DIR = path.join(__dirname, '..', 'node_modules', '@overshoot', 'sdk');
+const SDK_AVAILABLE = fs.existsSync(SDK_DIR);
+const sdkFiles = new Map();
+
+function readSdkFile(url) {
+    const filePath = path.join(SDK_DIR, url.slice(SDK_CDN_PREFIX.length).split(/[?#]/)[0]);
+    if (!filePath.startsWith(SDK_DIR + path.sep)) return null;
+    if (!sdkFiles.has(filePath)) {
+        sdkFiles.set(filePath, fs.existsSync(filePath) ? fs.readFileSync(filePath) : null);
+    }
+    return sdkFiles.get(filePath);
+}
+
+function serveLocalSdk(request) {
+    const url = request.url();
+    const body = url.startsWith(SDK_CDN_PREFIX) ? readSdkFile(url) : null;
+    if (!body) {
+        request.continue();
+        return;
+    }
+    request.respond({
+        status: 200,
+        contentType: 'text/javascript',
+        headers: { 'Access-Control-Allow-Origin': '*' },
+        body
+    });
+}
+
+function renderAnalysisPage(config) {
+    // Escape '<' so config values can't close the script element
+    const json = JSON.stringify(config).replace(/</g, '\\u003c');
+    return ANALYSIS_PAGE.replace('__OVERSHOOT_CONFIG__', () => json);
+}
+
+// Messages queued this tick. Consecutive log lines for the same job are merged
+// into one message, so a burst of page output costs the parent one log record
+let outbox = [];
+let flushScheduled = false;
+
+function flush() {
+    flushScheduled = false;
+    if (outbox.length === 0) return;
+    process.stdout.write(outbox.map(message => JSON.stringify(message)).join('\n') + '\n');
+    outbox = [];
+}
+
+function send(message) {
+    const last = outbox[outbox.length - 1];
+    if (message.log !== undefined && last && last.log !== undefined && last.id === message.id) {
+        last.log += '\n' + message.log;
+    } else {
+        outbox.push(message);
+    }
+    if (!flushScheduled) {
+        flushScheduled = true;
+        setImmediate(flush);
+    }
+}
+
+let browserPromise = null;
+
+function getBrowser() {
+    if (!browserPromise) {
+        send({ log: 'Launching browser...' });
+        browserPromise = puppeteer.launch({
+            headless: 'new',
+            args: [
+                '--no-sandbox',
+                '--disable-setuid-sandbox',
+                '--autoplay-policy=no-user-gesture-required',
+                '--disable-web-security',
+                '--allow-file-access-from-files',
+                '--use-fake-ui-for-media-stream',
+                '--use-fake-device-for-media-stream'
+            ]
+        }).then(browser => {
+            // Relaunch on the next job if Chromium goes away
+            browser.on('disconnected', () => { browserPromise = null; });
+            return browser;
+        }, err => {
+            browserPromise = null;
+            throw err;
+        });
+    }
+    return browserPromise;
+}
+
+async function writeFileAtomic(filePath, data) {
+    const partial = filePath + '.part';
+    await fs.promises.writeFile(partial, data);
+    await fs.promises.rename(partial, filePath);
+}
+
+async function withTimeout(promise, ms, message) {
+    let timer;
+    const timeout = new Promise((resolve, reject) => {
+        timer = setTimeout(() => reject(new Error(message)), ms);
+    });
+    try {
+        return await Promise.race([promise, timeout]);
+    } finally {
+        clearTimeout(timer);
+    }
+}
+
+// Cancel functions of the jobs in flight, by id
+const runningJobs = new Map();
+
+async function runJob(job) {
+    const log = text => send({ id: job.id, log: text });
+
+    // Cancelling closes the page, which fails any pending page call, and
+    // rejects this promise, which every wait on the page races against
+    let page = null;
+    let isCancelled = false;
+    let cancel;
+    const cancelled = new Promise((resolve, reject) => {
+        cancel = () => reject(new Error('Cancelled'));
+    });
+    cancelled.catch(() => {});
+    runningJobs.set(job.id, () => {
+        isCancelled = true;
+        cancel();
+        if (page) page.close().catch(() => {});
+    });
+
+    try {
+        const browser = await getBrowser();
+        page = await browser.newPage();
+        if (isCancelled) throw new Error('Cancelled');
+
+        // Enable console logging
+        page.on('console', msg => {
+            const text = msg.text();
+            if (text.includes('[Overshoot]') || text.includes('[RealtimeVision]')) {
+                log(text);
+            }
+        });
+
+        page.on('pageerror', err => {
+            send({ id: job.id, warn: 'Page error: ' + err.message });
+        });
+
+        if (SDK_AVAILABLE) {
+            await page.setRequestInterception(true);
+            page.on('request', serveLocalSdk);
+        }
+
+        // The page calls these once streaming starts and when analysis ends
+        // (passing its results), so nothing polls for either
+        let notifyReady, notifyDone;
+        const ready = new Promise(resolve => { notifyReady = resolve; });
+        const done = new Promise(resolve => { notifyDone = resolve; });
+        await page.exposeFunction('__overshootReady', () => notifyReady());
+        await page.exposeFunction('__overshootDone', results => notifyDone(results));
+
+        // The page signals readiness itself, so don't wait for network idle
+        log('Loading analysis page...');
+        await page.setContent(renderAnalysisPage(job.config), {
+            waitUntil: 'domcontentloaded',
+            timeout: STARTUP_TIMEOUT_MS
+        });
+
+        // Hand the video over through the file input: the page gets a
+        // disk-backed File rather than a fetched copy in renderer memory
+        const videoInput = await page.$('#videoInput');
+        await videoInput.uploadFile(job.videoPath);
+
+        // SDK loaded and stream started (or the page already gave up)
+        await withTimeout(Promise.race([ready, done, cancelled]), STARTUP_TIMEOUT_MS, 'Timed out starting analysis');
+
+        log('Waiting for analysis to complete...');
+
+        // Wait for analysis to complete (max 2 minutes)
+        const results = await withTimeout(Promise.race([done, cancelled]), ANALYSIS_TIMEOUT_MS, 'Timed out waiting for analysis');
+
+        // A failed or empty analysis is an error, so the client never caches it
+        if (results.error) {
+            throw new Error(results.error);
+        }
+        if (!results.count) {
+            throw new Error('Analysis returned no results');
+        }
+
+        log('Analysis complete!');
+        log('Results count: ' + results.count);
+
+        // Process topic: first three words, in one pass over the raw label
+        const words = (results.topics[0] || '').match(TOPIC_WORD_RE) || [];
+        const topic = words.slice(0, 3).join(' ').replace(APOSTROPHE_RE, '') || 'Unknown';
+
+        // Process summary
+        const summary = results.summaries.join('\n\n') || 'Unable to generate summary.';
+
+        // Save results; each file is renamed into place so readers never see a partial write
+        await Promise.all([
+            writeFileAtomic(job.summaryPath, summary),
+            writeFileAtomic(job.topicPath, topic)
+        ]);
+
+        log('Topic: ' + topic);
+        log('Summary length: ' + summary.length + ' chars');
+        log('Results saved!');
+
+    } finally {
+        runningJobs.delete(job.id);
+        // Don't hold up the job's result; the next job opens its own page
+        if (page) {
+            page.close().catch(err => send({ id: job.id, warn: 'Failed to close page: ' + err.message }));
+        }
+    }
+}
+
+let shuttingDown = false;
+
+async function shutdown() {
+    if (shuttingDown) return;
+    shuttingDown = true;
+
+    const browser = browserPromise && await browserPromise.catch(() => null);
+    if (browser) {
+        // Don't let a wedged Chromium hold the parent's exit hostage
+        await Promise.race([
+            browser.close().catch(() => {}),
+            new Promise(resolve => setTimeout(resolve, BROWSER_CLOSE_TIMEOUT_MS))
+        ]);
+    }
+    flush();
+    process.exit(0);
+}
+
+const input = readline.createInterface({ input: process.stdin });
+
+input.on('line', line => {
+    if (!line.trim()) return;
+
+    let job;
+    try {
+        job = JSON.parse(line);
+    } catch (err) {
+        send({ warn: 'Ignoring malformed job: ' + line });
+        return;
+    }
+
+    if (job.cmd === 'quit') {
+        shutdown();
+        return;
+    }
+
+    if (job.cmd === 'cancel') {
+        const cancelJob = runningJobs.get(job.id);
+        if (cancelJob) cancelJob();
+        return;
+    }
+
+    runJob(job).then(
+        () => send({ id: job.id, status: 'ok' }),
+        err => send({ id: job.id, status: 'error', error: (err && err.message) || String(err) })
+    );
+});
+
+// Parent went away without saying quit
+input.on('close', shutdown);
+
+// Close Chromium on termination rather than leaving it orphaned
+process.on('SIGTERM', shutdown);
+process.on('SIGINT', shutdown);
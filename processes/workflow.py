@@ -11,6 +11,9 @@ Usage:
     python workflow.py <url1> <url2> ...              # Process multiple URLs
     python workflow.py --output-dir <dir>             # Process existing output directory
 
+Multiple URLs run as a pipeline: while one item is being classified, the
+next is analyzed and the one after that is downloaded.
+
 Examples:
     python workflow.py https://www.instagram.com/p/DNs58us4txJ/
     python workflow.py outputs/instagram_video
@@ -19,6 +22,8 @@ Examples:
 import sys
 import os
 import argparse
+import queue
+import threading
 from pathlib import Path
 from typing import List, Optional
 
@@ -36,32 +41,84 @@ import downloader
 from auto_folder import AutoFolder
 
 import logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%dT%H:%M:%S'
-)
+from log_format import configure_logging
+configure_logging(datefmt='%Y-%m-%dT%H:%M:%S')
 logger = logging.getLogger(__name__)
 
 
-def process_url(url: str) -> Optional[str]:
+# Items buffered between pipeline stages
+PIPELINE_DEPTH = 2
+
+# Concurrent analyses (pages in the shared Overshoot browser, Gemini requests)
+MAX_ANALYZE_WORKERS = 4
+
+# Marks the end of a stage's output
+_STAGE_DONE = object()
+
+# Keeps multi-line banners from different stages from interleaving
+_print_lock = threading.Lock()
+
+
+def _print_block(*lines: str) -> None:
+    """Print lines as one uninterrupted block."""
+    with _print_lock:
+        print("\n".join(lines), flush=True)
+
+
+_auto_folder: Optional[AutoFolder] = None
+_auto_folder_lock = threading.Lock()
+
+
+def _get_auto_folder() -> AutoFolder:
     """
-    Download and process a URL, then classify into folders.
+    Get the AutoFolder shared by every classification in this process.
+    
+    Construction connects to the folder store and loads its folders, so it
+    happens once rather than per URL. A failed construction is retried on
+    the next call.
+    """
+    global _auto_folder
+    if _auto_folder is None:
+        with _auto_folder_lock:
+            if _auto_folder is None:
+                _auto_folder = AutoFolder()
+    return _auto_folder
+
+
+# ============================================
+# Workflow Steps
+# ============================================
+
+def download_step(url: str) -> Optional[str]:
+    """
+    Download a URL's media without processing it.
     
-    Args:
-        url: URL to download and process
-        
     Returns:
-        Path to output directory if successful, None otherwise
+        Path to the downloaded file if successful, None otherwise
     """
-    print("\n" + "=" * 80)
-    print(f"STEP 1: DOWNLOADING & PROCESSING")
-    print("=" * 80)
-    print(f"URL: {url}\n")
+    _print_block(
+        "\n" + "=" * 80,
+        f"STEP 1: DOWNLOADING & PROCESSING",
+        "=" * 80,
+        f"URL: {url}\n"
+    )
     
-    # Step 1: Download and process with downloader.py
     try:
-        downloaded_file, topic_path, summary_path, processor = downloader.download_and_process(url)
+        return downloader.download_url(url)
+    except Exception as e:
+        logger.error(f"Download failed: {e}")
+        return None
+
+
+def analyze_step(downloaded_file: str) -> Optional[str]:
+    """
+    Process a downloaded file with AI into topic.txt + summary.txt.
+    
+    Returns:
+        Path to output directory if successful, None otherwise
+    """
+    try:
+        topic_path, summary_path, processor = downloader.process_media(downloaded_file)
         
         if not topic_path or not summary_path:
             logger.error("Failed to generate topic.txt or summary.txt")
@@ -72,32 +129,64 @@ def process_url(url: str) -> Optional[str]:
         logger.info(f"Generated files in: {output_dir}")
         logger.info(f"  - topic.txt: {topic_path}")
         logger.info(f"  - summary.txt: {summary_path}")
+        return output_dir
         
     except Exception as e:
         logger.error(f"Download/processing failed: {e}")
         return None
+
+
+def classify_step(output_dir: str) -> bool:
+    """
+    Classify a processed output directory into folders using auto_folder.
     
-    # Step 2: Classify into folders using auto_folder
-    print("\n" + "=" * 80)
-    print(f"STEP 2: CLASSIFYING INTO FOLDERS")
-    print("=" * 80)
-    print(f"Output directory: {output_dir}\n")
+    Returns:
+        True if successful, False otherwise
+    """
+    _print_block(
+        "\n" + "=" * 80,
+        f"STEP 2: CLASSIFYING INTO FOLDERS",
+        "=" * 80,
+        f"Output directory: {output_dir}\n"
+    )
     
     try:
-        auto_folder = AutoFolder()
-        result = auto_folder.classify_from_downloader(output_dir)
+        result = _get_auto_folder().classify_from_downloader(output_dir)
         
-        print("\n" + "=" * 80)
-        print("CLASSIFICATION RESULT")
-        print("=" * 80)
-        print(result.to_json())
-        print("=" * 80)
+        _print_block(
+            "\n" + "=" * 80,
+            "CLASSIFICATION RESULT",
+            "=" * 80,
+            result.to_json(),
+            "=" * 80
+        )
         
-        return output_dir
+        return True
         
     except Exception as e:
         logger.error(f"Classification failed: {e}")
+        return False
+
+
+def process_url(url: str) -> Optional[str]:
+    """
+    Download and process a URL, then classify into folders.
+    
+    Args:
+        url: URL to download and process
+        
+    Returns:
+        Path to output directory if successful, None otherwise
+    """
+    downloaded_file = download_step(url)
+    if not downloaded_file:
         return None
+    
+    output_dir = analyze_step(downloaded_file)
+    if not output_dir:
+        return None
+    
+    return output_dir if classify_step(output_dir) else None
 
 
 def process_existing_output(output_dir: str) -> bool:
@@ -130,8 +219,7 @@ def process_existing_output(output_dir: str) -> bool:
     print(f"Directory: {output_dir}\n")
     
     try:
-        auto_folder = AutoFolder()
-        result = auto_folder.classify_from_downloader(output_dir)
+        result = _get_auto_folder().classify_from_downloader(output_dir)
         
         print("\n" + "=" * 80)
         print("CLASSIFICATION RESULT")
@@ -146,6 +234,91 @@ def process_existing_output(output_dir: str) -> bool:
         return False
 
 
+# ============================================
+# Pipelined Batch Processing
+# ============================================
+
+def run_pipeline(urls: List[str], analyze_workers: Optional[int] = None) -> List[bool]:
+    """
+    Process URLs with download, analysis and classification running concurrently.
+    
+    Each stage runs on its own thread(s) and hands items to the next through
+    a bounded queue, so the batch takes about as long as its slowest stage
+    instead of the sum of all three. Analysis, the slowest stage, runs
+    several items at once. Every URL downloads into its own output
+    directory, so items never wait on each other.
+    
+    Args:
+        urls: URLs to process
+        analyze_workers: Concurrent analyses (default: min(MAX_ANALYZE_WORKERS, len(urls)))
+        
+    Returns:
+        Success flag per URL, in input order
+    """
+    if analyze_workers is None:
+        analyze_workers = min(MAX_ANALYZE_WORKERS, len(urls))
+    analyze_workers = max(1, analyze_workers)
+    
+    results = [False] * len(urls)
+    to_analyze: queue.Queue = queue.Queue(maxsize=PIPELINE_DEPTH)
+    to_classify: queue.Queue = queue.Queue(maxsize=PIPELINE_DEPTH)
+    
+    def download_stage():
+        try:
+            for i, url in enumerate(urls):
+                _print_block(
+                    f"\n{'='*80}",
+                    f"PROCESSING {i + 1}/{len(urls)}",
+                    f"{'='*80}"
+                )
+                downloaded_file = download_step(url)
+                if downloaded_file:
+                    to_analyze.put((i, downloaded_file))
+        finally:
+            # One end marker per analysis worker
+            for _ in range(analyze_workers):
+                to_analyze.put(_STAGE_DONE)
+    
+    def analyze_stage():
+        try:
+            while True:
+                item = to_analyze.get()
+                if item is _STAGE_DONE:
+                    break
+                i, downloaded_file = item
+                output_dir = analyze_step(downloaded_file)
+                if output_dir:
+                    to_classify.put((i, output_dir))
+        finally:
+            to_classify.put(_STAGE_DONE)
+    
+    stages = [threading.Thread(target=download_stage, name="download-stage", daemon=True)]
+    stages += [
+        threading.Thread(target=analyze_stage, name=f"analyze-stage-{n}", daemon=True)
+        for n in range(analyze_workers)
+    ]
+    for stage in stages:
+        stage.start()
+    
+    # Classification runs on the calling thread, until every analysis worker is done
+    running = analyze_workers
+    while running:
+        item = to_classify.get()
+        if item is _STAGE_DONE:
+            running -= 1
+            continue
+        i, output_dir = item
+        results[i] = classify_step(output_dir)
+    
+    for stage in stages:
+        stage.join()
+    return results
+
+
+# ============================================
+# Main Entry Point
+# ============================================
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -191,20 +364,14 @@ Examples:
         
     elif args.urls:
         # Process URL(s)
-        success_count = 0
-        failed_count = 0
+        results = run_pipeline(args.urls)
+        success_count = sum(results)
+        failed_count = len(results) - success_count
         
-        for i, url in enumerate(args.urls, 1):
-            print(f"\n{'='*80}")
-            print(f"PROCESSING {i}/{len(args.urls)}")
-            print(f"{'='*80}")
-            
-            result = process_url(url)
-            if result:
-                success_count += 1
+        for url, ok in zip(args.urls, results):
+            if ok:
                 print(f"\n✅ Successfully processed: {url}")
             else:
-                failed_count += 1
                 print(f"\n❌ Failed to process: {url}")
         
         # Summary
@@ -233,19 +400,9 @@ Examples:
             print("No URLs provided. Exiting.")
             sys.exit(1)
         
-        success_count = 0
-        failed_count = 0
-        
-        for i, url in enumerate(urls, 1):
-            print(f"\n{'='*80}")
-            print(f"PROCESSING {i}/{len(urls)}")
-            print(f"{'='*80}")
-            
-            result = process_url(url)
-            if result:
-                success_count += 1
-            else:
-                failed_count += 1
+        results = run_pipeline(urls)
+        success_count = sum(results)
+        failed_count = len(results) - success_count
         
         # Summary
         print("\n" + "=" * 80)